@@ -55,6 +55,8 @@ INSTALLED_APPS = [
     "training.verbs.apps.VerbsConfig",
     "training.tables.apps.TablesConfig",
     "training.results.apps.ResultsConfig",
+    "training.deletions.apps.DeletionsConfig",
+    "training.outbox.apps.OutboxConfig",
 ]
 
 MIDDLEWARE = [
@@ -64,6 +66,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.auth.middleware.LoginRequiredMiddleware",
+    "training.authentication.middleware.RateLimitMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -120,6 +123,18 @@ STATIC_ROOT = os.path.join(BASE_DIR, "training/staticfiles")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/ref/settings/#caches
+
+# The verbs catalog version, the cached users and the rate limit buckets
+# must be shared by every worker process. The local memory cache is only
+# fit for a single process, production uses Redis.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 # Auth model
 
 AUTH_USER_MODEL = "authentication.User"
@@ -131,6 +146,40 @@ AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
 ]
 
+# Maximum number of passwords hashed or checked at the same time by the
+# async login, signup and account deletion views.
+PASSWORD_HASHING_WORKERS = 4
+
+# Token buckets of the login, password reset and account deletion
+# views, (capacity, period): capacity POST requests per client address
+# or posted email, refilled at capacity tokens per period seconds.
+RATE_LIMITS = {
+    "ip": (20, 60),
+    "email": (5, 300),
+}
+# request.META key of the header holding the client address set by a
+# trusted reverse proxy, e.g. "HTTP_X_FORWARDED_FOR", its last address
+# is used. Unset, the "ip" buckets count REMOTE_ADDR, which is the
+# address of the proxy if there is one: a single bucket for everyone.
+RATE_LIMIT_IP_HEADER = None
+
+# Seconds during which EmailBackend.get_user() serves the user and its
+# profile from the cache, 0 to load them from the database every request.
+USER_CACHE_TIMEOUT = 0
+
+# Outbox
+
+# Backend the send_outbox command delivers the emails queued by
+# training.outbox.backends.OutboxEmailBackend with.
+OUTBOX_EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# Attempts before a failing email is given up.
+OUTBOX_MAX_ATTEMPTS = 5
+# Seconds before the second attempt, doubled on each further failure.
+OUTBOX_RETRY_DELAY = 60
+# Seconds the emails claimed by a send_outbox worker are hidden from the
+# others, they are sent again after it if the worker died.
+OUTBOX_CLAIM_TIMEOUT = 600
+
 # Crispy forms
 
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
@@ -152,6 +201,18 @@ MESSAGE_TAGS = {
     messages.ERROR: "alert-danger",
 }
 
+# Training
+
+# Seconds during which the results of a training can be displayed
+TRAINING_SESSION_AGE = 60 * 60 * 24
+
+# Results
+
+# Also write the results to the PackedProgress bitsets, then read them
+# from there once backfilled (see the backfill_packed_progress command).
+RESULTS_PACKED_WRITE = False
+RESULTS_PACKED_READ = False
+
 # Tests
 
 IS_TEST = False
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'training.authentication'
+
+    def ready(self):
+        import training.common.lookups  # noqa: F401
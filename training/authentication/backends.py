@@ -1,13 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
 
+from training.authentication.cache import cache_user, get_cached_user
+from training.authentication.hashing import acheck_password, ahash_password
+
 
 UserModel = get_user_model()
 
 
 class EmailBackend(ModelBackend):
     """
-    Authenticates user with email address and password.
+    Authenticates user with email address, case insensitive, and password.
     Rejects inactive users.
     """
 
@@ -21,7 +24,7 @@ class EmailBackend(ModelBackend):
         if email is None or password is None:
             return
         try:
-            user = UserModel.objects.get(email=email)
+            user = UserModel.objects.get(email__lower_exact=email)
         except UserModel.DoesNotExist:
             # Run the default password hasher once to reduce the timing
             # difference between an existing and a nonexistent user (#20760).
@@ -30,11 +33,39 @@ class EmailBackend(ModelBackend):
             if user.check_password(password) and self.user_can_authenticate(user):
                 return user
 
-    def get_user(self, user_id):
+    async def aauthenticate(
+        self,
+        request,
+        email=None,
+        password=None,
+        **kwargs,
+    ):
+        """authenticate() with the password hashed in the hashing pool."""
+        if email is None or password is None:
+            return
         try:
-            user = UserModel.objects.get(pk=user_id)
+            user = await UserModel.objects.aget(email__lower_exact=email)
         except UserModel.DoesNotExist:
-            return None
+            await ahash_password(password)
+        else:
+            if await acheck_password(user, password) and self.user_can_authenticate(
+                user
+            ):
+                return user
+
+    def get_user(self, user_id):
+        """
+        Return the user with its profile joined in, most views read it.
+        The pair is served from the cache when USER_CACHE_TIMEOUT is
+        set, see training.authentication.cache.
+        """
+        user = get_cached_user(user_id)
+        if user is None:
+            try:
+                user = UserModel.objects.select_related("profile").get(pk=user_id)
+            except UserModel.DoesNotExist:
+                return None
+            cache_user(user)
         return user if self.user_can_authenticate(user) else None
 
 
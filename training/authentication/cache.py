@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.cache import cache
+
+
+USER_CACHE_KEY = "authentication:user:%s:%s"
+PASSWORD_CACHE_KEY = "authentication:password:%s"
+
+
+def get_password_fingerprint(user):
+    """Return a fingerprint of the password hash of user."""
+    return user.get_session_auth_hash()
+
+
+def get_cached_user(user_id):
+    """
+    Return the cached user, with its profile, or None. Users are cached
+    by id and password fingerprint, the fingerprint of the current
+    password is cached apart.
+    """
+    if not settings.USER_CACHE_TIMEOUT:
+        return None
+    fingerprint = cache.get(PASSWORD_CACHE_KEY % user_id)
+    if fingerprint is None:
+        return None
+    return cache.get(USER_CACHE_KEY % (user_id, fingerprint))
+
+
+def cache_user(user):
+    """
+    Cache the user, with its profile if loaded, for USER_CACHE_TIMEOUT
+    seconds. A user loaded before a password change is cached under its
+    former fingerprint, it is not served.
+    """
+    if settings.USER_CACHE_TIMEOUT:
+        fingerprint = get_password_fingerprint(user)
+        # Keep the fingerprint set by a password change meanwhile.
+        cache.add(
+            PASSWORD_CACHE_KEY % user.pk, fingerprint, settings.USER_CACHE_TIMEOUT
+        )
+        cache.set(
+            USER_CACHE_KEY % (user.pk, fingerprint),
+            user,
+            settings.USER_CACHE_TIMEOUT,
+        )
+
+
+def invalidate_cached_user(user_id, user=None):
+    """
+    Drop the cached user, on every change of the user or its profile.
+    The saved user records the fingerprint of its password.
+    """
+    if not settings.USER_CACHE_TIMEOUT:
+        return
+    if user is None:
+        cache.delete(PASSWORD_CACHE_KEY % user_id)
+        return
+    fingerprint = get_password_fingerprint(user)
+    cache.set(PASSWORD_CACHE_KEY % user_id, fingerprint, settings.USER_CACHE_TIMEOUT)
+    cache.delete(USER_CACHE_KEY % (user_id, fingerprint))
@@ -1,15 +1,50 @@
+from asgiref.sync import sync_to_async
 from django import forms
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import aauthenticate, authenticate, get_user_model
+from django.contrib.auth.forms import PasswordChangeForm as BasePasswordChangeForm
 from django.contrib.auth.forms import UserCreationForm
 from django.core.exceptions import ValidationError
 from django.utils.text import capfirst
 from django.utils.translation import gettext_lazy as _
 
+from training.authentication.hashing import ahash_password
+
 
 User = get_user_model()
 
 
-class LoginForm(forms.Form):
+class AsyncAuthenticationFormMixin:
+    """
+    Authenticate the email and password of the form in the password
+    hashing pool with 'await form.aprepare()', see
+    training.authentication.hashing. Validation then reuses user_cache
+    instead of running the hasher.
+    """
+
+    is_prepared = False
+
+    async def aprepare(self):
+        try:
+            email = self.fields["email"].clean(self.data.get(self.add_prefix("email")))
+            password = self.fields["password"].clean(
+                self.data.get(self.add_prefix("password"))
+            )
+        except ValidationError:
+            return
+        self.user_cache = await aauthenticate(
+            self.request,
+            email=User.objects.normalize_email(email),
+            password=password,
+        )
+        self.is_prepared = True
+
+    def authenticate(self, email, password):
+        if not self.is_prepared:
+            self.user_cache = authenticate(self.request, email=email, password=password)
+        return self.user_cache
+
+
+class LoginForm(AsyncAuthenticationFormMixin, forms.Form):
     email = forms.EmailField(
         label=_("Email"),
         widget=forms.EmailInput(
@@ -65,7 +100,7 @@ class LoginForm(forms.Form):
         password = self.cleaned_data.get("password")
 
         if email is not None and password:
-            self.user_cache = authenticate(self.request, email=email, password=password)
+            self.authenticate(email, password)
             if self.user_cache is None:
                 raise self.get_invalid_login_error()
             else:
@@ -120,10 +155,35 @@ class SignUpForm(UserCreationForm):
         super().__init__(*args, **kwargs)
         self.fields["password1"].required = True
         self.fields["password2"].required = True
+        # (password, hash) computed by aprepare()
+        self.password_hash = None
+
+    async def aprepare(self):
+        """
+        Validate the form, then hash the password in the password hashing
+        pool when it is valid, see training.authentication.hashing. The
+        view reuses the validation and save() reuses the hash instead of
+        running the hasher. An invalid signup never runs the hasher.
+        """
+        if not await sync_to_async(self.is_valid)():
+            return
+        password = self.cleaned_data["password1"]
+        self.password_hash = (password, await ahash_password(password))
+
+    def set_password_and_save(self, user, password_field_name="password1", commit=True):
+        password = self.cleaned_data[password_field_name]
+        if self.password_hash is None or self.password_hash[0] != password:
+            return super().set_password_and_save(user, password_field_name, commit)
+        user.password = self.password_hash[1]
+        # Let User.save() notify the password validators, as set_password().
+        user._password = password
+        if commit:
+            user.save()
+        return user
 
     def clean_email(self):
         email = self.cleaned_data.get("email")
-        if email and User.objects.filter(email__iexact=email).exists():
+        if email and User.objects.filter(email__lower_exact=email).exists():
             raise self.get_unique_email_error()
         else:
             return email
@@ -135,7 +195,21 @@ class SignUpForm(UserCreationForm):
         )
 
 
-class UsernameChangeForm(forms.ModelForm):
+class ChangedFieldsSaveMixin:
+    """
+    Save only the columns of the changed fields, nothing when no field
+    changed.
+    """
+
+    def save(self, commit=True):
+        if not commit or self.instance._state.adding:
+            return super().save(commit=commit)
+        if self.changed_data:
+            self.instance.save(update_fields=[*self.changed_data, "updated_at"])
+        return self.instance
+
+
+class UsernameChangeForm(ChangedFieldsSaveMixin, forms.ModelForm):
     username = forms.CharField(
         label=_("Username"),
         widget=forms.TextInput(
@@ -173,7 +247,7 @@ class UsernameChangeForm(forms.ModelForm):
         )
 
 
-class EmailChangeForm(forms.ModelForm):
+class EmailChangeForm(ChangedFieldsSaveMixin, forms.ModelForm):
     email = forms.EmailField(
         label=_("Email"),
         widget=forms.EmailInput(
@@ -196,7 +270,7 @@ class EmailChangeForm(forms.ModelForm):
         email = self.cleaned_data.get("email")
         if (
             email
-            and User.objects.filter(email__iexact=email)
+            and User.objects.filter(email__lower_exact=email)
             .exclude(email=self.instance.email)
             .exists()
         ):
@@ -210,7 +284,7 @@ class EmailChangeForm(forms.ModelForm):
         )
 
 
-class DeleteAccountForm(forms.Form):
+class DeleteAccountForm(AsyncAuthenticationFormMixin, forms.Form):
     """
     Form to delete the account of the logged-in user.
     Requires email address and password to confirm deletion.
@@ -265,7 +339,7 @@ class DeleteAccountForm(forms.Form):
         password = self.cleaned_data.get("password")
 
         if email is not None and password:
-            self.user_cache = authenticate(email=email, password=password)
+            self.authenticate(email, password)
             if self.user_cache is None or self.user_cache != self.current_user:
                 raise self.get_invalid_credentials_error()
 
@@ -276,3 +350,13 @@ class DeleteAccountForm(forms.Form):
             self.error_messages["invalid_credentials"],
             code="invalid_credentials",
         )
+
+
+class PasswordChangeForm(BasePasswordChangeForm):
+    """Save only the password of the user."""
+
+    def save(self, commit=True):
+        self.user.set_password(self.cleaned_data["new_password1"])
+        if commit:
+            self.user.save(update_fields=["password", "updated_at"])
+        return self.user
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the pool running the password hashers, with at most
+    PASSWORD_HASHING_WORKERS threads. PBKDF2 and the other hashlib based
+    hashers release the GIL, the threads hash in parallel while the
+    event loop keeps serving requests.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASHING_WORKERS,
+                    thread_name_prefix="password-hashing",
+                )
+    return _executor
+
+
+async def run_hasher(function, *args):
+    """Run function(*args) in the password hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(function, *args))
+
+
+async def ahash_password(raw_password):
+    """Async make_password()."""
+    return await run_hasher(make_password, raw_password)
+
+
+async def acheck_password(user, raw_password):
+    """
+    Async user.check_password(), the stored hash is upgraded if the
+    hasher settings changed.
+    """
+    must_update = False
+
+    def setter(raw_password):
+        nonlocal must_update
+        must_update = True
+
+    is_correct = await run_hasher(check_password, raw_password, user.password, setter)
+    if must_update:
+        user.password = await ahash_password(raw_password)
+        await user.asave(update_fields=["password"])
+    return is_correct
@@ -0,0 +1,212 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils.text import slugify
+
+from training.profiles.models import Profile
+from training.tables.models import DefaultTable, Table
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the users listed in a CSV (with a header) or JSONL file, with "
+        "their profile and optional starter tables. Rows have an email, a "
+        "username and an optional password, users without password must "
+        "reset it. Users whose email or username is taken are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSONL file of users.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="File format, guessed from the extension by default.",
+        )
+        parser.add_argument(
+            "--starter-table",
+            action="append",
+            default=[],
+            dest="starter_tables",
+            metavar="NAME",
+            help="Default table copied as a table of each user, repeatable.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of users created per transaction (default: 500).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help=(
+                "Number of processes hashing the passwords, 0 to hash them "
+                "in this process (default: number of CPUs)."
+            ),
+        )
+
+    def read_rows(self, path, file_format):
+        file_format = file_format or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format not in ("csv", "jsonl"):
+            raise CommandError(f"Unknown file format: {file_format}.")
+        with open(path, newline="", encoding="utf-8") as file:
+            if file_format == "csv":
+                # Line 1 is the header.
+                yield from enumerate(csv.DictReader(file), start=2)
+            else:
+                # Lines are parsed by clean_row(), a malformed one is
+                # skipped like the other invalid rows.
+                for line_number, line in enumerate(file, start=1):
+                    if line.strip():
+                        yield line_number, line
+
+    def clean_row(self, row):
+        """
+        Return the normalized (email, username, password) of a row, a dict
+        or a JSONL line.
+        """
+        if isinstance(row, str):
+            try:
+                row = json.loads(row)
+            except json.JSONDecodeError as error:
+                raise ValidationError(f"Invalid JSON: {error}.")
+        if not isinstance(row, dict):
+            raise ValidationError("A row must be a JSON object.")
+        email = User.objects.normalize_email((row.get("email") or "").strip())
+        username = User.normalize_username((row.get("username") or "").strip())
+        for name, value in (("email", email), ("username", username)):
+            field = User._meta.get_field(name)
+            if not value:
+                raise ValidationError(f"{name} is required.")
+            field.run_validators(value)
+        return email, username, row.get("password") or None
+
+    def get_starter_tables(self, names):
+        tables = list(
+            DefaultTable.objects.filter(name__in=names).prefetch_related("verbs")
+        )
+        missing = set(names) - {table.name for table in tables}
+        if missing:
+            raise CommandError(
+                f"Unknown default tables: {', '.join(sorted(missing))}."
+            )
+        return tables
+
+    def hash_passwords(self, passwords, executor):
+        if executor is None:
+            return [make_password(password) for password in passwords]
+        chunksize = max(len(passwords) // (self.workers * 4), 1)
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+    def provision(self, rows, starter_tables, executor):
+        """
+        Create the users of rows ((email, username, password)) whose email
+        and username are free, return the number of created users.
+        """
+        taken_emails = set(
+            User.objects.annotate(lower=Lower("email"))
+            .filter(lower__in=[email.lower() for email, _, _ in rows])
+            .values_list("lower", flat=True)
+        )
+        taken_usernames = set(
+            User.objects.annotate(lower=Lower("username"))
+            .filter(lower__in=[username.lower() for _, username, _ in rows])
+            .values_list("lower", flat=True)
+        )
+        rows = [
+            (email, username, password)
+            for email, username, password in rows
+            if email.lower() not in taken_emails
+            and username.lower() not in taken_usernames
+        ]
+        if not rows:
+            return 0
+        passwords = self.hash_passwords([row[2] for row in rows], executor)
+        users = [
+            User(email=email, username=username, password=password)
+            for (email, username, _), password in zip(rows, passwords)
+        ]
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            profiles = Profile.objects.bulk_create(
+                Profile(user=user) for user in users
+            )
+            if starter_tables:
+                tables = Table.objects.bulk_create(
+                    Table(
+                        type=Table.USER_TABLE,
+                        name=table.name,
+                        slug_name=slugify(table.name),
+                        owner=profile,
+                    )
+                    for profile in profiles
+                    for table in starter_tables
+                )
+                Through = Table.verbs.through
+                Through.objects.bulk_create(
+                    Through(table_id=table.id, verb_id=verb.id)
+                    for table, starter_table in zip(
+                        tables, starter_tables * len(profiles)
+                    )
+                    for verb in starter_table.verbs.all()
+                )
+        return len(users)
+
+    def handle(
+        self, *args, path, format, starter_tables, batch_size, workers, **options
+    ):
+        self.workers = workers
+        starter_tables = self.get_starter_tables(starter_tables)
+        created = skipped = 0
+        seen_emails, seen_usernames = set(), set()
+        start = time.perf_counter()
+        executor = ProcessPoolExecutor(workers) if workers > 0 else None
+        try:
+            batch = []
+            for line_number, row in self.read_rows(path, format):
+                try:
+                    email, username, password = self.clean_row(row)
+                except ValidationError as error:
+                    self.stderr.write(
+                        f"Line {line_number}: {' '.join(error.messages)}"
+                    )
+                    skipped += 1
+                    continue
+                # Duplicates of the file are skipped like taken ones.
+                if (
+                    email.lower() in seen_emails
+                    or username.lower() in seen_usernames
+                ):
+                    skipped += 1
+                    continue
+                seen_emails.add(email.lower())
+                seen_usernames.add(username.lower())
+                batch.append((email, username, password))
+                if len(batch) == batch_size:
+                    count = self.provision(batch, starter_tables, executor)
+                    created, skipped = created + count, skipped + len(batch) - count
+                    batch = []
+            if batch:
+                count = self.provision(batch, starter_tables, executor)
+                created, skipped = created + count, skipped + len(batch) - count
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{created} users provisioned, {skipped} skipped "
+            f"in {elapsed:.1f} s ({created / elapsed:.0f} users/s)."
+        )
@@ -0,0 +1,27 @@
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.translation import gettext
+
+from training.authentication.ratelimit import check_rate_limits
+
+
+class RateLimitMiddleware(MiddlewareMixin):
+    """
+    Answer 429 to the POST requests of the views marked with rate_limit()
+    once a bucket of the client is empty. The view is not called, no
+    password is hashed and no email is sent.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        scopes = getattr(view_func, "rate_limits", None)
+        if not scopes or request.method != "POST":
+            return None
+        retry_after = check_rate_limits(request, scopes)
+        if retry_after:
+            return HttpResponse(
+                gettext("Too many attempts, try again later."),
+                content_type="text/plain; charset=utf-8",
+                status=429,
+                headers={"Retry-After": str(retry_after)},
+            )
+        return None
@@ -1,5 +1,3 @@
-import uuid
-
 from django.apps import apps
 from django.contrib import auth
 from django.contrib.auth.models import AbstractUser, BaseUserManager
@@ -8,6 +6,9 @@ from django.db.models import UniqueConstraint
 from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
+from training.common.ids import uuid7
+from training.deletions.models import DeferredDeletionMixin
+
 
 class MyUserManager(BaseUserManager):
     def _create_user(
@@ -127,12 +128,12 @@ class MyUserManager(BaseUserManager):
         return self.none()
 
 
-class User(AbstractUser):
+class User(DeferredDeletionMixin, AbstractUser):
     id = models.UUIDField(
         primary_key=True,
         unique=True,
         editable=False,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     email = models.EmailField(
         unique=True,
@@ -159,6 +160,29 @@ class User(AbstractUser):
             ),
         ]
 
+    def hide(self):
+        """Deactivate the account and free its username and email."""
+        self.is_active = False
+        self.username = f"deleted-{self.pk}"
+        self.email = f"{self.pk}@deleted.invalid"
+        self.set_unusable_password()
+        self.save(
+            update_fields=["is_active", "username", "email", "password", "updated_at"]
+        )
+
+    def get_deletion_querysets(self):
+        Result = apps.get_model("results.Result")
+        TableProgress = apps.get_model("results.TableProgress")
+        Table = apps.get_model("tables.Table")
+        TrainingSession = apps.get_model("tables.TrainingSession")
+        return [
+            Result.objects.filter(owner__user=self),
+            TableProgress.objects.filter(owner__user=self),
+            TrainingSession.objects.filter(owner__user=self),
+            Table.verbs.through.objects.filter(table__owner__user=self),
+            Table._base_manager.filter(owner__user=self),
+        ]
+
     def clean(self):
         self.username = self.normalize_username(self.username)
         self.email = self.__class__.objects.normalize_email(self.email)
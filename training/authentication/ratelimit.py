@@ -0,0 +1,101 @@
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+RATE_LIMIT_KEY = "authentication:ratelimit:%s:%s"
+REJECTED_KEY = "authentication:ratelimit:rejected:%s"
+
+
+def rate_limit(*scopes):
+    """
+    Mark a view as rate limited by RateLimitMiddleware, its POST requests
+    take a token of the bucket of each scope, "ip" for the client address
+    and "email" for the posted email. Buckets are set in RATE_LIMITS.
+    """
+
+    def decorator(view_func):
+        view_func.rate_limits = scopes
+        return view_func
+
+    return decorator
+
+
+def get_identity(request, scope):
+    """Return what the bucket of the scope counts for the request, or None."""
+    if scope == "ip":
+        if settings.RATE_LIMIT_IP_HEADER:
+            forwarded = request.META.get(settings.RATE_LIMIT_IP_HEADER, "")
+            # The last address is the one added by the trusted proxy.
+            address = forwarded.split(",")[-1].strip()
+            if address:
+                return address
+        return request.META.get("REMOTE_ADDR")
+    if scope == "email":
+        email = request.POST.get("email", "").strip().lower()
+        # Hashed, the cache keys do not hold email addresses.
+        return hashlib.sha256(email.encode()).hexdigest() if email else None
+    raise ValueError(f"Unknown rate limit scope: {scope}.")
+
+
+def take_token(scope, identity):
+    """
+    Take a token of the bucket of the identity in the scope. Return 0 if
+    a token was taken, else the seconds until the next one.
+
+    A bucket holds RATE_LIMITS[scope] = (capacity, period) tokens and is
+    refilled at capacity tokens per period seconds. It is stored as the
+    time at which it is full again in milliseconds (GCRA), pushed by one
+    token interval with a single atomic incr(), so that concurrent
+    requests never take the same token. A rejected request gives its
+    interval back. The key expires once the bucket is full again.
+    """
+    capacity, period = settings.RATE_LIMITS[scope]
+    key = RATE_LIMIT_KEY % (scope, identity)
+    interval = math.ceil(period * 1000 / capacity)
+    now = math.floor(time.time() * 1000)
+    cache.add(key, now, timeout=math.ceil(period))
+    try:
+        full_at = cache.incr(key, interval)
+    except ValueError:
+        # Evicted since add(), the bucket is full again.
+        return 0
+    if full_at - now > period * 1000:
+        cache.decr(key, interval)
+        return math.ceil((full_at - now - period * 1000) / 1000)
+    # Two racing requests may set the expiry of the earlier one, the
+    # bucket is then refilled one token early.
+    cache.touch(key, math.ceil((full_at - now) / 1000))
+    return 0
+
+
+def check_rate_limits(request, scopes):
+    """
+    Take a token of every bucket of the request in the scopes set in
+    RATE_LIMITS. Return 0 if the request may go on, else the seconds to
+    wait, the rejection is then counted.
+    """
+    for scope in scopes:
+        if scope not in settings.RATE_LIMITS:
+            continue
+        identity = get_identity(request, scope)
+        if identity is None:
+            continue
+        retry_after = take_token(scope, identity)
+        if retry_after:
+            key = REJECTED_KEY % scope
+            cache.add(key, 0, timeout=None)
+            cache.incr(key)
+            return retry_after
+    return 0
+
+
+def get_rejected_counts():
+    """Return the number of requests rejected by each scope, {scope: count}."""
+    counts = cache.get_many([REJECTED_KEY % scope for scope in settings.RATE_LIMITS])
+    return {
+        scope: counts.get(REJECTED_KEY % scope, 0) for scope in settings.RATE_LIMITS
+    }
@@ -1,8 +1,14 @@
-from django.contrib.auth import authenticate, get_user, get_user_model
+from django.contrib.auth import aauthenticate, authenticate, get_user, get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.http import HttpRequest
 from django.test import TestCase, override_settings
 
+from training.authentication.backends import EmailBackend
+from training.authentication.cache import cache_user, get_cached_user
+from training.authentication.hashing import acheck_password, get_executor
+from training.common.testcase.mixins import QueryPlanMixin
+
 
 User = get_user_model()
 
@@ -28,7 +34,7 @@ class TestDataMixin:
         )
 
 
-class TestEmailBackend(TestDataMixin, TestCase):
+class TestEmailBackend(QueryPlanMixin, TestDataMixin, TestCase):
 
     def test_authenticate_email_none(self):
         self.assertIsNone(authenticate(password="password"))
@@ -52,6 +58,17 @@ class TestEmailBackend(TestDataMixin, TestCase):
             authenticate(email="user@email.com", password="password"), self.user
         )
 
+    def test_authenticate_email_case_insensitive(self):
+        self.assertEqual(
+            authenticate(email="User@Email.com", password="password"), self.user
+        )
+
+    def test_authenticate_email_query_uses_index(self):
+        self.assertIndexScan(
+            User.objects.filter(email__lower_exact="User@Email.com"),
+            "case_insensitive_unique_user_email",
+        )
+
     def test_get_user(self):
         self.client.force_login(self.user)
         request = HttpRequest()
@@ -74,6 +91,111 @@ class TestEmailBackend(TestDataMixin, TestCase):
         user = get_user(request)
         self.assertIsInstance(user, AnonymousUser)
 
+    def test_get_user_profile_joined(self):
+        with self.assertNumQueries(1):
+            user = EmailBackend().get_user(self.user.pk)
+            self.assertEqual(user.profile.user_id, self.user.pk)
+
+
+@override_settings(USER_CACHE_TIMEOUT=60)
+class TestEmailBackendCache(TestDataMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.backend = EmailBackend()
+        self.backend.get_user(self.user.pk)
+
+    def test_get_user_cached(self):
+        with self.assertNumQueries(0):
+            user = self.backend.get_user(self.user.pk)
+            self.assertEqual(user, self.user)
+            self.assertEqual(user.profile.user_id, self.user.pk)
+
+    def test_user_saved(self):
+        self.user.username = "renamed"
+        self.user.save()
+
+        self.assertEqual(self.backend.get_user(self.user.pk).username, "renamed")
+
+    def test_profile_saved(self):
+        self.user.profile.save()
+
+        with self.assertNumQueries(1):
+            self.backend.get_user(self.user.pk)
+
+    def test_password_changed(self):
+        self.client.force_login(self.user)
+        request = HttpRequest()
+        request.session = self.client.session
+        self.assertEqual(get_user(request), self.user)
+
+        self.user.set_password("new password")
+        self.user.save()
+
+        self.assertIsInstance(get_user(request), AnonymousUser)
+
+    def test_password_changed_user_cached_late(self):
+        # Loaded before the password change, cached after it.
+        user = User.objects.get(pk=self.user.pk)
+        self.user.set_password("new password")
+        self.user.save()
+        cache_user(user)
+
+        self.assertIsNone(get_cached_user(self.user.pk))
+        self.assertEqual(
+            self.backend.get_user(self.user.pk).password, self.user.password
+        )
+
+    def test_user_deleted(self):
+        self.user.delete()
+
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+
+
+class TestAsyncAuthenticate(TestDataMixin, TestCase):
+    async def test_aauthenticate_success(self):
+        user = await aauthenticate(email="User@Email.com", password="password")
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(
+            user.backend, "training.authentication.backends.EmailBackend"
+        )
+
+    async def test_aauthenticate_incorrect_password(self):
+        self.assertIsNone(
+            await aauthenticate(email="user@email.com", password="incorrect")
+        )
+
+    async def test_aauthenticate_incorrect_email(self):
+        self.assertIsNone(
+            await aauthenticate(email="incorrect@email.com", password="password")
+        )
+
+    async def test_aauthenticate_inactive_user(self):
+        self.assertIsNone(
+            await aauthenticate(email="inactive_user@email.com", password="password")
+        )
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        ]
+    )
+    async def test_acheck_password_upgrades_hash(self):
+        user = await User.objects.aget(pk=self.user.pk)
+        with override_settings(
+            PASSWORD_HASHERS=["django.contrib.auth.hashers.PBKDF2PasswordHasher"]
+        ):
+            user.set_password("password")
+        await user.asave(update_fields=["password"])
+
+        self.assertTrue(await acheck_password(user, "password"))
+        user = await User.objects.aget(pk=self.user.pk)
+        self.assertTrue(user.password.startswith("md5$"))
+
+    def test_executor_bounded(self):
+        self.assertEqual(get_executor()._max_workers, 4)
+
 
 @override_settings(
     AUTHENTICATION_BACKENDS=[
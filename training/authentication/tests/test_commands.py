@@ -0,0 +1,142 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from training.profiles.models import Profile
+from training.tables.models import DefaultTable, UserTable
+from training.verbs.models import Verb
+
+
+User = get_user_model()
+
+
+class TestProvisionUsersCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.verb = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.default_table = DefaultTable.objects.create(name="Starter")
+        cls.default_table.verbs.add(cls.verb)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, name, content):
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def call(self, path, **options):
+        out, err = StringIO(), StringIO()
+        call_command("provision_users", path, stdout=out, stderr=err, **options)
+        return out.getvalue(), err.getvalue()
+
+    def test_csv(self):
+        path = self.write(
+            "users.csv",
+            "email,username,password\n"
+            "alice@Email.com,alice,a password\n"
+            "bob@email.com,bob,\n",
+        )
+        out, _ = self.call(path, workers=0)
+
+        self.assertIn("2 users provisioned, 0 skipped", out)
+        self.assertIn("users/s", out)
+        alice = User.objects.get(username="alice")
+        self.assertEqual(alice.email, "alice@email.com")
+        self.assertTrue(alice.check_password("a password"))
+        self.assertFalse(User.objects.get(username="bob").has_usable_password())
+        self.assertEqual(Profile.objects.filter(user__username="bob").count(), 1)
+
+    def test_jsonl_with_process_pool(self):
+        path = self.write(
+            "users.jsonl",
+            "\n".join(
+                json.dumps(
+                    {
+                        "email": f"user{i}@example.com",
+                        "username": f"user{i}",
+                        "password": f"password {i}",
+                    }
+                )
+                for i in range(5)
+            ),
+        )
+        out, _ = self.call(path, workers=2, batch_size=2)
+
+        self.assertIn("5 users provisioned, 0 skipped", out)
+        self.assertTrue(
+            User.objects.get(username="user3").check_password("password 3")
+        )
+        self.assertEqual(Profile.objects.count(), 6)
+
+    def test_taken_duplicated_and_invalid_rows_skipped(self):
+        path = self.write(
+            "users.csv",
+            "email,username,password\n"
+            "USER@email.com,other,password\n"
+            "other@email.com,User,password\n"
+            "new@email.com,new,password\n"
+            "NEW@email.com,new2,password\n"
+            "invalid,invalid,password\n",
+        )
+        out, err = self.call(path, workers=0)
+
+        self.assertIn("1 users provisioned, 4 skipped", out)
+        self.assertIn("Line 6: Enter a valid email address.", err)
+        self.assertEqual(
+            set(User.objects.values_list("username", flat=True)), {"user", "new"}
+        )
+
+    def test_malformed_jsonl_lines_skipped(self):
+        path = self.write(
+            "users.jsonl",
+            '{"email": "alice@email.com", "username": "alice"}\n'
+            '{"email": "bob@email.com",\n'
+            '["x"]\n'
+            '{"email": "carol@email.com", "username": "carol"}\n',
+        )
+        out, err = self.call(path, workers=0)
+
+        self.assertIn("2 users provisioned, 2 skipped", out)
+        self.assertIn("Line 2: Invalid JSON: ", err)
+        self.assertIn("Line 3: A row must be a JSON object.", err)
+        self.assertTrue(User.objects.filter(username="carol").exists())
+
+    def test_starter_tables(self):
+        path = self.write(
+            "users.csv", "email,username\na@email.com,a\nb@email.com,b\n"
+        )
+        # Starter tables with their verbs, then for the batch: taken emails
+        # and usernames, then in a savepoint one insert of users, profiles,
+        # tables and table verbs each.
+        with self.assertNumQueries(10):
+            self.call(path, workers=0, starter_tables=["Starter"])
+
+        tables = UserTable.objects.filter(owner__user__username__in=["a", "b"])
+        self.assertEqual(tables.count(), 2)
+        for table in tables:
+            self.assertEqual(table.slug_name, "starter")
+            self.assertEqual(list(table.verbs.all()), [self.verb])
+
+    def test_unknown_starter_table(self):
+        path = self.write("users.csv", "email,username\na@email.com,a\n")
+        with self.assertRaisesMessage(CommandError, "Unknown default tables: Nope."):
+            self.call(path, workers=0, starter_tables=["Nope"])
@@ -10,6 +10,7 @@ from training.authentication.forms import (
     DeleteAccountForm,
     EmailChangeForm,
     LoginForm,
+    PasswordChangeForm,
     SignUpForm,
     UsernameChangeForm,
 )
@@ -433,6 +434,13 @@ class TestUsernameChangeForm(TestDataMixin, TestCase):
         # U+03A9 GREEK CAPITAL LETTER OMEGA
         self.assertEqual(user.username, "testΩ")
 
+    def test_unchanged_username_not_saved(self):
+        data = {"username": self.user.username}
+        form = self.form_class(instance=self.user, data=data)
+        self.assertTrue(form.is_valid())
+        with self.assertNumQueries(0):
+            form.save()
+
     def test_blank_username(self):
         """Username is required."""
         data = {"username": ""}
@@ -558,6 +566,22 @@ class TestEmailChangeForm(TestDataMixin, TestCase):
         self.assertEqual(error.code, "unique_email")
 
 
+class TestPasswordChangeForm(TestDataMixin, TestCase):
+    def test_save(self):
+        data = {
+            "old_password": "password",
+            "new_password1": "a new password",
+            "new_password2": "a new password",
+        }
+        form = PasswordChangeForm(self.user, data=data)
+        self.assertTrue(form.is_valid())
+        # The password and updated_at only, the profile is not written.
+        with self.assertNumQueries(1):
+            user = form.save()
+        user.refresh_from_db()
+        self.assertTrue(user.check_password("a new password"))
+
+
 class TestDeleteAccountForm(TestDataMixin, TestCase):
     form_class = DeleteAccountForm
 
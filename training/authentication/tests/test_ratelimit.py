@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from training.authentication.ratelimit import (
+    get_identity,
+    get_rejected_counts,
+    take_token,
+)
+
+
+User = get_user_model()
+
+
+@override_settings(RATE_LIMITS={"ip": (4, 60), "email": (2, 60)})
+class TestRateLimit(TestCase):
+    login_url = reverse_lazy("authentication:login")
+    password_reset_url = reverse_lazy("authentication:password-reset")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def post_login(self, email="user@email.com", password="incorrect"):
+        return self.client.post(
+            self.login_url, data={"email": email, "password": password}
+        )
+
+    def test_take_token(self):
+        with patch("training.authentication.ratelimit.time.time", return_value=0):
+            self.assertEqual(take_token("email", "a"), 0)
+            self.assertEqual(take_token("email", "a"), 0)
+            self.assertEqual(take_token("email", "a"), 30)
+            self.assertEqual(take_token("email", "b"), 0)
+        # Refilled at 2 tokens per 60 seconds.
+        with patch("training.authentication.ratelimit.time.time", return_value=45):
+            self.assertEqual(take_token("email", "a"), 0)
+            self.assertEqual(take_token("email", "a"), 15)
+        # Full again, no more than the capacity.
+        with patch("training.authentication.ratelimit.time.time", return_value=600):
+            self.assertEqual(take_token("email", "a"), 0)
+            self.assertEqual(take_token("email", "a"), 0)
+            self.assertEqual(take_token("email", "a"), 30)
+
+    def test_take_token_evicted(self):
+        with patch.object(cache, "incr", side_effect=ValueError):
+            self.assertEqual(take_token("email", "a"), 0)
+
+    def test_get_identity(self):
+        request = RequestFactory().post(
+            "/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="1.1.1.1, 2.2.2.2"
+        )
+        self.assertEqual(get_identity(request, "ip"), "10.0.0.1")
+        with self.settings(RATE_LIMIT_IP_HEADER="HTTP_X_FORWARDED_FOR"):
+            self.assertEqual(get_identity(request, "ip"), "2.2.2.2")
+            del request.META["HTTP_X_FORWARDED_FOR"]
+            self.assertEqual(get_identity(request, "ip"), "10.0.0.1")
+
+    @patch("training.authentication.ratelimit.time.time", return_value=50)
+    def test_email_bucket(self, time):
+        self.assertEqual(self.post_login().status_code, 200)
+        self.assertEqual(self.post_login(email="User@Email.com").status_code, 200)
+
+        response = self.post_login(password="password")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(get_rejected_counts(), {"ip": 0, "email": 1})
+        self.assertEqual(self.post_login(email="other@email.com").status_code, 200)
+
+    def test_ip_bucket(self):
+        for i in range(4):
+            self.assertEqual(
+                self.post_login(email=f"user{i}@email.com").status_code, 200
+            )
+
+        self.assertEqual(self.post_login().status_code, 429)
+        self.assertEqual(get_rejected_counts(), {"ip": 1, "email": 0})
+
+    def test_rejected_before_hashing(self):
+        self.post_login()
+        self.post_login()
+        with patch("training.authentication.hashing.check_password") as check:
+            self.post_login()
+        check.assert_not_called()
+
+    def test_get_not_limited(self):
+        for _ in range(5):
+            self.assertEqual(self.client.get(self.login_url).status_code, 200)
+
+    def test_password_reset_rejected_before_sending(self):
+        data = {"email": "user@email.com"}
+        self.client.post(self.password_reset_url, data=data)
+        self.client.post(self.password_reset_url, data=data)
+        response = self.client.post(self.password_reset_url, data=data)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(mail.outbox), 2)
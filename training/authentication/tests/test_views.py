@@ -1,15 +1,19 @@
 import itertools
+import threading
 from unittest.mock import patch
 
 from django.conf import settings
-from django.contrib.auth import get_user, get_user_model
+from django.contrib.auth import get_user, get_user_model, hashers
 from django.contrib.messages import constants
 from django.contrib.messages.storage.base import Message
 from django.contrib.messages.test import MessagesTestMixin
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse, reverse_lazy
 
 from training.authentication.views import SignUpView
+from training.deletions.models import PendingDeletion
 
 
 User = get_user_model()
@@ -66,6 +70,30 @@ class LoginViewTests(AuthenticationViewsTestCase):
         self.assertTrue(user.is_authenticated)
         self.assertRedirects(response, reverse(settings.LOGIN_REDIRECT_URL))
 
+    def test_post_query_count(self):
+        data = {"email": "user@email.com", "password": "password"}
+        # user and last_login update, the profile is neither read nor
+        # written. The rest is the session: key existence check, insert
+        # of the new key and update of its data, each write in a
+        # savepoint.
+        with self.assertNumQueries(9):
+            self.client.post(self.url, data=data)
+
+    def test_post_password_checked_in_pool(self):
+        threads = []
+
+        def check_password(*args):
+            threads.append(threading.current_thread().name)
+            return hashers.check_password(*args)
+
+        data = {"email": "user@email.com", "password": "password"}
+        with patch("training.authentication.hashing.check_password", check_password):
+            self.client.post(self.url, data=data)
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("password-hashing"))
+        self.assertTrue(get_user(self.client).is_authenticated)
+
     def test_post_invalid_data(self):
         data = {"email": "b@b.com", "password": "x"}
         response = self.client.post(self.url, data=data)
@@ -122,6 +150,44 @@ class SignupViewTests(MessagesTestMixin, AuthenticationViewsTestCase):
         self.assertRedirects(response, reverse(settings.LOGIN_REDIRECT_URL))
         self.assertMessages(response, expected_messages)
 
+    def test_post_password_hashed_in_pool(self):
+        threads = []
+
+        def make_password(*args):
+            threads.append(threading.current_thread().name)
+            return hashers.make_password(*args)
+
+        data = {
+            "email": "newuser@email.com",
+            "username": "newuser",
+            "password1": "wxcv1234",
+            "password2": "wxcv1234",
+        }
+        with patch(
+            "training.authentication.hashing.make_password", make_password
+        ):
+            self.client.post(self.url, data=data)
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("password-hashing"))
+        self.assertTrue(
+            User.objects.get(email="newuser@email.com").check_password("wxcv1234")
+        )
+
+    def test_post_invalid_data_not_hashed(self):
+        data = {
+            "email": self.user.email,
+            "username": "newuser",
+            "password1": "wxcv1234",
+            "password2": "wxcv1234",
+        }
+        with patch("training.authentication.hashing.make_password") as make_password:
+            response = self.client.post(self.url, data=data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("email", response.context["form"].errors)
+        make_password.assert_not_called()
+
     def test_post_invalid_data(self):
         user_count = User.objects.count()
         data = {
@@ -191,6 +257,20 @@ class UsernameChangeViewTests(MessagesTestMixin, AuthenticationViewsTestCase):
         self.assertRedirects(response, reverse("authentication:account"))
         self.assertMessages(response, expected_messages)
 
+    def test_post_writes_username_only(self):
+        data = {"username": "newusername"}
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, data=data)
+        updates = [
+            query["sql"] for query in queries if query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertRegex(
+            updates[0],
+            r'^UPDATE "authentication_user" SET "username" = .*, "updated_at" = '
+            r"[^,]* WHERE",
+        )
+
     def test_post_invalid_data(self):
         data = {"username": "user2"}
         response = self.client.post(self.url, data=data)
@@ -265,7 +345,7 @@ class DeleteAccountViewTests(MessagesTestMixin, AuthenticationViewsTestCase):
         self.assertTemplateUsed(response, template_expected)
 
     def test_post_valid_data(self):
-        user_count = User.objects.count()
+        user_count = User.objects.filter(is_active=True).count()
         data = {
             "email": "user@email.com",
             "password": "password",
@@ -274,7 +354,12 @@ class DeleteAccountViewTests(MessagesTestMixin, AuthenticationViewsTestCase):
             Message(constants.SUCCESS, "Your account has been sucessfully deleted.")
         ]
         response = self.client.post(self.url, data=data, follow=True)
-        self.assertEqual(user_count - 1, User.objects.count())
+        # The account is hidden, it is deleted by process_deletions.
+        self.assertEqual(user_count - 1, User.objects.filter(is_active=True).count())
+        self.assertTrue(
+            PendingDeletion.objects.pending().filter(object_id=self.user.pk).exists()
+        )
+        self.assertFalse(get_user(self.client).is_authenticated)
         self.assertRedirects(response, reverse("authentication:login"))
         self.assertMessages(
             response,
@@ -1,6 +1,7 @@
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth import login
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_not_required
 from django.contrib.auth.views import LoginView as BaseLoginView
 from django.contrib.auth.views import PasswordChangeView as BasePasswordChangeView
@@ -25,14 +26,44 @@ from training.authentication.forms import (
     DeleteAccountForm,
     EmailChangeForm,
     LoginForm,
+    PasswordChangeForm,
     SignUpForm,
     UsernameChangeForm,
 )
+from training.authentication.ratelimit import rate_limit
 from training.common.views.mixins import PreviousPageURLMixin, TitleMixin
 
 
+class AsyncPasswordFormViewMixin:
+    """
+    Serve a password form view asynchronously. The password of a posted
+    form is hashed or checked in the password hashing pool with
+    'await form.aprepare()', then the sync view runs in sync_to_async()
+    and validates and saves this form without running the hasher. The
+    thread serving the sync code is never held by a hasher, other
+    requests keep flowing during login spikes.
+    """
+
+    view_is_async = True
+    prepared_form = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method == "POST":
+            form = await sync_to_async(self.get_form)()
+            await form.aprepare()
+            self.prepared_form = form
+        return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+
+    def get_form(self, form_class=None):
+        if self.prepared_form is not None and form_class is None:
+            return self.prepared_form
+        return super().get_form(form_class)
+
+
 @method_decorator(login_not_required, name="dispatch")
+@method_decorator(rate_limit("ip", "email"), name="dispatch")
 class LoginView(
+    AsyncPasswordFormViewMixin,
     TitleMixin,
     PreviousPageURLMixin,
     BaseLoginView,
@@ -44,20 +75,9 @@ class LoginView(
     title = _("Login")
 
 
-@method_decorator(login_not_required, name="dispatch")
-class SignUpView(
-    TitleMixin,
-    PreviousPageURLMixin,
-    SuccessMessageMixin,
-    CreateView,
-):
-    template_name = "authentication/signup.html"
-    form_class = SignUpForm
-    success_message = _("Your account was created successfully.")
+class BaseSignUpView(CreateView):
     success_url = reverse_lazy(settings.LOGIN_REDIRECT_URL)
     redirect_authenticated_user = True
-    previous_page_url = reverse_lazy("verbs:list")
-    title = _("Sign Up")
 
     @method_decorator(sensitive_post_parameters())
     @method_decorator(csrf_protect)
@@ -74,6 +94,21 @@ class SignUpView(
             return redirect(redirect_to)
         return super().dispatch(request, *args, **kwargs)
 
+
+@method_decorator(login_not_required, name="dispatch")
+class SignUpView(
+    AsyncPasswordFormViewMixin,
+    TitleMixin,
+    PreviousPageURLMixin,
+    SuccessMessageMixin,
+    BaseSignUpView,
+):
+    template_name = "authentication/signup.html"
+    form_class = SignUpForm
+    success_message = _("Your account was created successfully.")
+    previous_page_url = reverse_lazy("verbs:list")
+    title = _("Sign Up")
+
     def form_valid(self, form):
         valid = super().form_valid(form)
         login(
@@ -85,6 +120,7 @@ class SignUpView(
 
 
 @method_decorator(login_not_required, name="dispatch")
+@method_decorator(rate_limit("ip", "email"), name="dispatch")
 class PasswordResetView(
     TitleMixin,
     PreviousPageURLMixin,
@@ -170,13 +206,16 @@ class PasswordChangeView(
     BasePasswordChangeView,
 ):
     template_name = "authentication/change.html"
+    form_class = PasswordChangeForm
     success_message = _("Your password has been successfully updated.")
     success_url = reverse_lazy("authentication:account")
     previous_page_url = reverse_lazy("authentication:account")
     title = _("Change my password")
 
 
+@method_decorator(rate_limit("ip", "email"), name="dispatch")
 class DeleteAccountView(
+    AsyncPasswordFormViewMixin,
     TitleMixin,
     PreviousPageURLMixin,
     SuccessMessageMixin,
@@ -197,8 +236,12 @@ class DeleteAccountView(
         return kwargs
 
     def form_valid(self, form):
+        # The account is hidden right away, its results and tables are
+        # deleted in batches by the process_deletions command.
+        self.object.delete_later()
+        logout(self.request)
         messages.success(
             self.request,
             gettext("Your account has been sucessfully deleted."),
         )
-        return super().form_valid(form)
+        return redirect(self.get_success_url())
@@ -0,0 +1,35 @@
+from django.db.models import UniqueConstraint
+
+
+class CoveringUniqueConstraint(UniqueConstraint):
+    """
+    UniqueConstraint with include columns where covering indexes are
+    supported (PostgreSQL). Django skips the whole UniqueConstraint on
+    other databases, this one is created without the include columns.
+    """
+
+    def _get_supported(self, schema_editor):
+        features = schema_editor.connection.features
+        if self.include and not features.supports_covering_indexes:
+            constraint = self.clone()
+            constraint.include = ()
+            return constraint
+        return self
+
+    def constraint_sql(self, model, schema_editor):
+        constraint = self._get_supported(schema_editor)
+        return super(CoveringUniqueConstraint, constraint).constraint_sql(
+            model, schema_editor
+        )
+
+    def create_sql(self, model, schema_editor):
+        constraint = self._get_supported(schema_editor)
+        return super(CoveringUniqueConstraint, constraint).create_sql(
+            model, schema_editor
+        )
+
+    def remove_sql(self, model, schema_editor):
+        constraint = self._get_supported(schema_editor)
+        return super(CoveringUniqueConstraint, constraint).remove_sql(
+            model, schema_editor
+        )
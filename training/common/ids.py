@@ -0,0 +1,56 @@
+import os
+import threading
+import time
+import uuid
+
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def _random_bits(bits):
+    return int.from_bytes(os.urandom(8), "big") >> (64 - bits)
+
+
+def _build(ms, rand_a):
+    value = (
+        (ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | int.from_bytes(os.urandom(8), "big") & _RAND_B_MASK
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7(timestamp=None):
+    """
+    Return a time-ordered UUID, version 7 of RFC 9562.
+
+    The first 48 bits are the Unix time in milliseconds, ids created
+    later sort after the previous ones and new rows are appended to the
+    right of the primary key index instead of a random page. Within a
+    millisecond, the 12 rand_a bits are a counter started at a random
+    value so the ids of a process keep increasing.
+
+    - timestamp (datetime, optional): build the id of a row created at
+        this time, ids are then only ordered by millisecond.
+    """
+    if timestamp is not None:
+        return _build(int(timestamp.timestamp() * 1000), _random_bits(12))
+    global _last_ms, _counter
+    ms = time.time_ns() // 1_000_000
+    with _lock:
+        if ms > _last_ms:
+            # Start in the lower half to leave room for the increments.
+            _last_ms, _counter = ms, _random_bits(11)
+        else:
+            # Same millisecond or clock moved backwards.
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms, _counter = _last_ms + 1, _random_bits(11)
+        return _build(_last_ms, _counter)
@@ -0,0 +1,30 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models import Index
+
+
+class TrigramIndex(Index):
+    """
+    GIN index of the trigrams (pg_trgm) of text expressions on PostgreSQL,
+    serving LIKE '%term%' and similarity searches, the extension is
+    created with django.contrib.postgres.operations.TrigramExtension. On
+    other databases, a B-tree index of the same expressions serving
+    prefix searches.
+    """
+
+    def _get_supported(self, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return self
+        return GinIndex(
+            *[
+                OpClass(expression, name="gin_trgm_ops")
+                for expression in self.expressions
+            ],
+            name=self.name,
+            condition=self.condition,
+        )
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        index = self._get_supported(schema_editor)
+        if index is self:
+            return super().create_sql(model, schema_editor, using=using, **kwargs)
+        return index.create_sql(model, schema_editor, using=using, **kwargs)
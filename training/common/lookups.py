@@ -0,0 +1,19 @@
+from django.db.models import CharField, Lookup
+
+
+@CharField.register_lookup
+class LowerExact(Lookup):
+    """
+    Case insensitive exact match compiled as LOWER(field) = LOWER(value).
+
+    The predicate has the expression of the Lower() unique constraints
+    and indexes, so the database can use them. iexact compiles to UPPER()
+    on PostgreSQL and LIKE on SQLite and is never served by them.
+    """
+
+    lookup_name = "lower_exact"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"LOWER({lhs}) = LOWER({rhs})", (*lhs_params, *rhs_params)
@@ -0,0 +1,157 @@
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently as BaseAddIndexConcurrently,
+)
+from django.contrib.postgres.operations import NotInTransactionMixin
+from django.db import transaction
+from django.db.migrations.operations import AddConstraint, AddIndex
+
+
+class AddIndexConcurrently(BaseAddIndexConcurrently):
+    """
+    AddIndexConcurrently on PostgreSQL, writes to the table go on while
+    the index is built. A plain AddIndex on other databases.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        return AddIndex.database_forwards(
+            self, app_label, schema_editor, from_state, to_state
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        return AddIndex.database_backwards(
+            self, app_label, schema_editor, from_state, to_state
+        )
+
+
+class AddConstraintConcurrently(NotInTransactionMixin, AddConstraint):
+    """
+    AddConstraint of a UniqueConstraint of fields (optionally covering,
+    see training.common.constraints.CoveringUniqueConstraint) whose index
+    is built with CREATE UNIQUE INDEX CONCURRENTLY on PostgreSQL, writes
+    to the table go on meanwhile. The index then becomes the constraint
+    with ADD CONSTRAINT ... USING INDEX, in a brief transaction which also
+    drops the constraint of the same name if replaces is set.
+
+    A plain AddConstraint, after removing the replaced constraint, on
+    other databases.
+    """
+
+    atomic = False
+
+    def __init__(self, model_name, constraint, replaces=False):
+        super().__init__(model_name, constraint)
+        self.replaces = replaces
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        if self.replaces:
+            kwargs["replaces"] = True
+        return name, args, kwargs
+
+    def state_forwards(self, app_label, state):
+        if self.replaces:
+            state.remove_constraint(
+                app_label, self.model_name_lower, self.constraint.name
+            )
+        super().state_forwards(app_label, state)
+
+    def describe(self):
+        return "Concurrently create constraint %s on model %s" % (
+            self.constraint.name,
+            self.model_name,
+        )
+
+    def create_index_sql(self, model, schema_editor, constraint, name):
+        """Return the SQL building the index of constraint as name."""
+        if constraint.condition or constraint.expressions or constraint.opclasses:
+            raise ValueError(
+                f"{self.__class__.__name__} only supports constraints of fields."
+            )
+        quote_name = schema_editor.quote_name
+        meta = model._meta
+
+        def columns(fields):
+            return ", ".join(
+                quote_name(meta.get_field(field).column) for field in fields
+            )
+
+        sql = (
+            f"CREATE UNIQUE INDEX CONCURRENTLY {quote_name(name)} "
+            f"ON {quote_name(meta.db_table)} ({columns(constraint.fields)})"
+        )
+        if constraint.include:
+            sql += f" INCLUDE ({columns(constraint.include)})"
+        return sql
+
+    def attach_index_sql(self, model, schema_editor, constraint, name, replaces):
+        """Return the statements turning the index name into constraint."""
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        statements = []
+        if replaces:
+            statements.append(
+                f"ALTER TABLE {table} DROP CONSTRAINT {quote_name(constraint.name)}"
+            )
+        statements.append(
+            f"ALTER TABLE {table} ADD CONSTRAINT {quote_name(constraint.name)} "
+            f"UNIQUE USING INDEX {quote_name(name)}"
+        )
+        return statements
+
+    def add_concurrently(self, model, schema_editor, constraint, replaces):
+        self._ensure_not_in_transaction(schema_editor)
+        # Renamed to the constraint name by ADD CONSTRAINT. A failed build
+        # leaves an invalid index of this name, to drop before a new run.
+        name = f"{constraint.name[:59]}_new"
+        schema_editor.execute(
+            self.create_index_sql(model, schema_editor, constraint, name)
+        )
+        with transaction.atomic(using=schema_editor.connection.alias):
+            for sql in self.attach_index_sql(
+                model, schema_editor, constraint, name, replaces
+            ):
+                schema_editor.execute(sql)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if schema_editor.connection.vendor == "postgresql":
+            self.add_concurrently(model, schema_editor, self.constraint, self.replaces)
+            return
+        if self.replaces:
+            from_model = from_state.apps.get_model(app_label, self.model_name)
+            schema_editor.remove_constraint(
+                from_model,
+                from_state.models[
+                    app_label, self.model_name_lower
+                ].get_constraint_by_name(self.constraint.name),
+            )
+        schema_editor.add_constraint(model, self.constraint)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        replaced = (
+            to_state.models[app_label, self.model_name_lower].get_constraint_by_name(
+                self.constraint.name
+            )
+            if self.replaces
+            else None
+        )
+        if replaced is not None and schema_editor.connection.vendor == "postgresql":
+            self.add_concurrently(model, schema_editor, replaced, replaces=True)
+            return
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        schema_editor.remove_constraint(from_model, self.constraint)
+        if replaced is not None:
+            schema_editor.add_constraint(model, replaced)
@@ -1,4 +1,7 @@
+import re
+
 from django.contrib.messages.storage.fallback import FallbackStorage
+from django.db import connections, transaction
 from django.test import RequestFactory
 
 
@@ -21,3 +24,35 @@ class RequestFactoryMixin:
 
         messages = FallbackStorage(request)
         setattr(request, "_messages", messages)
+
+
+class QueryPlanMixin:
+    """Assert that querysets are served by an index."""
+
+    def get_query_plan(self, queryset):
+        """Return the EXPLAIN output of the queryset."""
+        connection = connections[queryset.db]
+        with transaction.atomic(using=queryset.db):
+            if connection.vendor == "postgresql":
+                # Test tables are small enough to be scanned, make the
+                # planner use an index whenever one can serve the query.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            return queryset.explain()
+
+    def assertIndexScan(self, queryset, index_name=None, scanned=()):
+        """
+        Fail if the plan of the queryset scans a whole table, other than
+        the tables in scanned, or does not use index_name if provided.
+        """
+        plan = self.get_query_plan(queryset)
+        if connections[queryset.db].vendor == "postgresql":
+            full_scans = re.findall(r"\bSeq Scan on (\w+)", plan)
+        else:
+            # SQLite: SEARCH uses an index, SCAN reads a whole table or
+            # index.
+            full_scans = re.findall(r"\bSCAN (\w+)", plan)
+        if set(full_scans) - set(scanned):
+            self.fail(f"Full scan in the query plan:\n{plan}")
+        if index_name is not None and index_name not in plan:
+            self.fail(f"Index {index_name} not used in the query plan:\n{plan}")
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase
+
+from training.common.ids import uuid7
+
+
+class TestUUID7(SimpleTestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+
+    def test_increasing(self):
+        values = [uuid7() for _ in range(10_000)]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(set(values)), len(values))
+
+    def test_timestamp(self):
+        timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        value = uuid7(timestamp)
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.int >> 80, int(timestamp.timestamp() * 1000))
+        self.assertLess(value, uuid7())
@@ -0,0 +1,60 @@
+from django.db import connection
+from django.db.migrations.state import ModelState, ProjectState
+from django.test import SimpleTestCase
+
+from training.common.constraints import CoveringUniqueConstraint
+from training.common.operations import AddConstraintConcurrently
+from training.results.models import Result
+
+
+class TestAddConstraintConcurrently(SimpleTestCase):
+    def setUp(self):
+        self.constraint = CoveringUniqueConstraint(
+            fields=["owner", "table", "verb"],
+            include=["is_success", "generation"],
+            name="unique_result_for_verb_in_table_per_owner",
+        )
+        self.operation = AddConstraintConcurrently(
+            "result", self.constraint, replaces=True
+        )
+
+    def test_create_index_sql(self):
+        self.assertEqual(
+            self.operation.create_index_sql(
+                Result, connection.ops, self.constraint, "new_idx"
+            ),
+            'CREATE UNIQUE INDEX CONCURRENTLY "new_idx" '
+            'ON "results_result" ("owner_id", "table_id", "verb_id") '
+            'INCLUDE ("is_success", "generation")',
+        )
+
+    def test_attach_index_sql(self):
+        self.assertEqual(
+            self.operation.attach_index_sql(
+                Result, connection.ops, self.constraint, "new_idx", True
+            ),
+            [
+                'ALTER TABLE "results_result" DROP CONSTRAINT '
+                '"unique_result_for_verb_in_table_per_owner"',
+                'ALTER TABLE "results_result" ADD CONSTRAINT '
+                '"unique_result_for_verb_in_table_per_owner" '
+                'UNIQUE USING INDEX "new_idx"',
+            ],
+        )
+
+    def test_state_forwards_replaces(self):
+        state = ProjectState()
+        model_state = ModelState.from_model(Result)
+        state.add_model(model_state)
+        self.operation.state_forwards("results", state)
+
+        self.assertEqual(
+            state.models["results", "result"].options["constraints"],
+            [self.constraint],
+        )
+
+    def test_deconstruct(self):
+        _, args, kwargs = self.operation.deconstruct()
+
+        self.assertEqual(kwargs["replaces"], True)
+        self.assertEqual(kwargs["constraint"], self.constraint)
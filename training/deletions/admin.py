@@ -0,0 +1,35 @@
+from django.contrib import admin
+from django.db.models.query import QuerySet
+from django.http import HttpRequest
+
+from training.deletions.models import PendingDeletion
+
+
+@admin.register(PendingDeletion)
+class PendingDeletionAdmin(admin.ModelAdmin):
+    list_display = [
+        "content_type",
+        "object_id",
+        "deleted_count",
+        "created_at",
+        "completed_at",
+    ]
+    list_filter = ["content_type"]
+    readonly_fields = [
+        "content_type",
+        "object_id",
+        "deleted_count",
+        "created_at",
+        "updated_at",
+        "completed_at",
+    ]
+    search_fields = ["object_id"]
+    search_help_text = "Search deletions by object id"
+    list_per_page = 50
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[PendingDeletion]:
+        queryset = super().get_queryset(request)
+        return queryset.select_related("content_type")
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
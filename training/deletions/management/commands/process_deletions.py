@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from training.deletions.models import PendingDeletion
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the objects hidden by delete_later() and the rows depending "
+        "on them in batches. Run it as a cron job, or as a worker with --watch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows deleted per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--watch",
+            type=float,
+            help="Keep running and look for new deletions every WATCH seconds.",
+        )
+
+    def process(self, batch_size):
+        count = 0
+        for deletion in PendingDeletion.objects.pending():
+            while not deletion.process_batch(batch_size):
+                pass
+            count += 1
+            if self.verbosity > 1:
+                self.stdout.write(
+                    f"{deletion} completed, {deletion.deleted_count} rows deleted."
+                )
+        return count
+
+    def handle(self, *args, batch_size, watch, verbosity, **options):
+        self.verbosity = verbosity
+        if watch is None:
+            count = self.process(batch_size)
+            self.stdout.write(f"{count} deletions completed.")
+            return
+        while True:
+            if count := self.process(batch_size):
+                self.stdout.write(f"{count} deletions completed.")
+            time.sleep(watch)
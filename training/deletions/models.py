@@ -0,0 +1,128 @@
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models.constraints import UniqueConstraint
+from django.utils import timezone
+
+
+class DeferredDeletionMixin:
+    """
+    Let a model be hidden right away and deleted later by the
+    process_deletions command, so large cascades do not run inside a
+    request.
+
+    Subclasses implement hide() and get_deletion_querysets(), the
+    querysets of the rows depending on the object in deletion order.
+    """
+
+    def hide(self):
+        """Hide the object until it is deleted."""
+        raise NotImplementedError("Subclasses must implement hide()")
+
+    def get_deletion_querysets(self):
+        """Return the querysets of the rows to delete before the object."""
+        raise NotImplementedError(
+            "Subclasses must implement get_deletion_querysets()"
+        )
+
+    def delete_later(self):
+        """Hide the object and schedule its deletion."""
+        with transaction.atomic():
+            self.hide()
+            deletion, _ = PendingDeletion.objects.get_or_create(
+                content_type=ContentType.objects.get_for_model(self),
+                object_id=str(self.pk),
+            )
+        return deletion
+
+    def delete_batch(self, batch_size):
+        """
+        Delete at most batch_size rows of the first non empty queryset
+        of get_deletion_querysets(). Return the number of deleted rows,
+        0 when only the object itself is left.
+        """
+        for queryset in self.get_deletion_querysets():
+            pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+            if pks:
+                return queryset.model._base_manager.filter(pk__in=pks).delete()[0]
+        return 0
+
+
+class PendingDeletionManager(models.Manager):
+    def pending(self):
+        return self.filter(completed_at__isnull=True).order_by("created_at")
+
+
+class PendingDeletion(models.Model):
+    """
+    An object hidden by DeferredDeletionMixin.delete_later() and waiting
+    to be deleted, deleted_count tracks the progress of the deletion.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        unique=True,
+        editable=False,
+        default=uuid.uuid4,
+    )
+    content_type = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+    )
+    object_id = models.CharField(
+        max_length=36,
+    )
+    deleted_count = models.PositiveIntegerField(
+        default=0,
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        db_index=True,
+    )
+
+    objects = PendingDeletionManager()
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=[
+                    "content_type",
+                    "object_id",
+                ],
+                name="unique_pending_deletion_per_object",
+            )
+        ]
+
+    def get_object(self):
+        """Return the hidden object, None if it is already deleted."""
+        model = self.content_type.model_class()
+        return model._base_manager.filter(pk=self.object_id).first()
+
+    def process_batch(self, batch_size):
+        """
+        Delete the next batch of rows depending on the object, or the
+        object itself once nothing is left. Each batch runs in its own
+        transaction. Return True when the deletion is completed.
+        """
+        with transaction.atomic():
+            obj = self.get_object()
+            deleted = 0
+            if obj is not None:
+                deleted = obj.delete_batch(batch_size)
+            if not deleted:
+                if obj is not None:
+                    deleted = obj.delete()[0]
+                self.completed_at = timezone.now()
+            self.deleted_count += deleted
+            self.save(update_fields=["deleted_count", "completed_at", "updated_at"])
+        return self.completed_at is not None
+
+    def __str__(self):
+        return f"Deletion: {self.content_type.model} <{self.object_id}>"
@@ -0,0 +1,38 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from training.deletions.models import PendingDeletion
+from training.tables.models import Table, UserTable
+
+
+User = get_user_model()
+
+
+class TestProcessDeletionsCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.table1 = UserTable.objects.create(name="table1", owner=cls.user.profile)
+        cls.table2 = UserTable.objects.create(name="table2", owner=cls.user.profile)
+
+    def test_process_deletions(self):
+        self.table1.delete_later()
+        self.table2.delete_later()
+        out = StringIO()
+        call_command("process_deletions", batch_size=10, stdout=out)
+
+        self.assertEqual(out.getvalue(), "2 deletions completed.\n")
+        self.assertFalse(Table._base_manager.exists())
+        self.assertFalse(PendingDeletion.objects.pending().exists())
+
+    def test_nothing_to_delete(self):
+        out = StringIO()
+        call_command("process_deletions", stdout=out)
+        self.assertEqual(out.getvalue(), "0 deletions completed.\n")
@@ -0,0 +1,161 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from training.deletions.models import PendingDeletion
+from training.results.models import Result, TableProgress
+from training.tables.models import DefaultTable, Table, UserTable
+from training.verbs.catalog import catalog
+from training.verbs.models import Example, Info, Verb
+
+
+User = get_user_model()
+
+
+class BaseTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@email.com",
+            password="password",
+        )
+        cls.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@email.com",
+            password="password",
+        )
+        cls.verb1 = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.verb2 = Verb.objects.create(
+            infinitive="become",
+            simple_past="became",
+            past_participle="become",
+            translation="devenir",
+        )
+        Info.objects.create(content="irregular", verb=cls.verb1)
+        Example.objects.create(
+            english="It began.", translation="Ça a commencé.", verb=cls.verb1
+        )
+        cls.default_table = DefaultTable.objects.create(name="default")
+        cls.default_table.verbs.add(cls.verb1, cls.verb2)
+        cls.user_table = UserTable.objects.create(
+            name="table", owner=cls.user1.profile
+        )
+        cls.user_table.verbs.add(cls.verb1, cls.verb2)
+        for user in (cls.user1, cls.user2):
+            for verb in (cls.verb1, cls.verb2):
+                Result.objects.create(
+                    owner=user.profile,
+                    table=cls.default_table,
+                    verb=verb,
+                    is_success=True,
+                )
+        for verb in (cls.verb1, cls.verb2):
+            Result.objects.create(
+                owner=cls.user1.profile,
+                table=cls.user_table,
+                verb=verb,
+                is_success=False,
+            )
+
+    def process(self, deletion, batch_size=1):
+        batches = 1
+        while not deletion.process_batch(batch_size):
+            batches += 1
+        return batches
+
+
+class TestDeferredDeletionMixin(BaseTestCase):
+    def test_table_delete_later(self):
+        deletion = self.user_table.delete_later()
+
+        self.assertFalse(UserTable.objects.filter(pk=self.user_table.pk).exists())
+        self.assertTrue(Table._base_manager.filter(pk=self.user_table.pk).exists())
+        self.assertEqual(Result.objects.filter(table=self.user_table).count(), 2)
+        self.assertQuerySetEqual(PendingDeletion.objects.pending(), [deletion])
+
+    def test_table_name_available_once_hidden(self):
+        self.user_table.delete_later()
+        UserTable.objects.create(name="table", owner=self.user1.profile)
+
+    def test_delete_later_twice(self):
+        deletion = self.user_table.delete_later()
+        self.assertEqual(self.user_table.delete_later(), deletion)
+
+    def test_verb_delete_later(self):
+        catalog.clear()
+        self.verb1.delete_later()
+
+        self.assertQuerySetEqual(Verb.objects.all(), [self.verb2])
+        self.assertEqual(catalog.get_verbs(), [self.verb2])
+        self.assertEqual(self.default_table.verbs.count(), 1)
+
+    def test_user_delete_later(self):
+        self.user1.delete_later()
+        self.user1.refresh_from_db()
+
+        self.assertFalse(self.user1.is_active)
+        self.assertFalse(self.user1.has_usable_password())
+        self.assertFalse(User.objects.filter(email="user1@email.com").exists())
+        User.objects.create_user(
+            username="user1",
+            email="user1@email.com",
+            password="password",
+        )
+
+
+class TestPendingDeletion(BaseTestCase):
+    def test_process_table(self):
+        deletion = self.user_table.delete_later()
+        # 2 results, 1 progress, 2 verbs then the table
+        self.assertEqual(self.process(deletion), 6)
+
+        self.assertFalse(Table._base_manager.filter(pk=self.user_table.pk).exists())
+        self.assertFalse(Result.objects.filter(table=self.user_table).exists())
+        self.assertEqual(deletion.deleted_count, 6)
+        self.assertIsNotNone(deletion.completed_at)
+        self.assertFalse(PendingDeletion.objects.pending().exists())
+        # Other tables are kept.
+        self.assertEqual(Result.objects.count(), 4)
+
+    def test_process_verb(self):
+        deletion = self.verb1.delete_later()
+        self.process(deletion, batch_size=10)
+
+        self.assertFalse(Verb._base_manager.filter(pk=self.verb1.pk).exists())
+        self.assertFalse(Info.objects.exists())
+        self.assertFalse(Example.objects.exists())
+        self.assertEqual(Result.objects.filter(verb=self.verb2).count(), 3)
+        self.assertFalse(Result.objects.filter(verb=self.verb1).exists())
+        # The progress summaries are refreshed as the verb leaves the
+        # tables.
+        progress = TableProgress.objects.get(
+            owner=self.user2.profile, table=self.default_table
+        )
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.not_done_count, 0)
+
+    def test_process_user(self):
+        deletion = self.user1.delete_later()
+        self.process(deletion, batch_size=10)
+
+        self.assertFalse(User.objects.filter(pk=self.user1.pk).exists())
+        self.assertFalse(Table._base_manager.filter(pk=self.user_table.pk).exists())
+        self.assertFalse(Result.objects.filter(owner__user=self.user1).exists())
+        self.assertEqual(Result.objects.count(), 2)
+        self.assertTrue(DefaultTable.objects.filter(pk=self.default_table.pk).exists())
+
+    def test_process_object_already_deleted(self):
+        deletion = self.user_table.delete_later()
+        Table._base_manager.filter(pk=self.user_table.pk).delete()
+
+        self.assertTrue(deletion.process_batch(10))
+        self.assertEqual(deletion.deleted_count, 0)
+
+    def test_str(self):
+        deletion = self.user_table.delete_later()
+        self.assertEqual(str(deletion), f"Deletion: table <{self.user_table.pk}>")
@@ -0,0 +1,36 @@
+from django.contrib import admin
+from django.http import HttpRequest
+
+from training.outbox.models import OutgoingEmail
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = [
+        "subject",
+        "to",
+        "attempts",
+        "created_at",
+        "next_attempt_at",
+    ]
+    readonly_fields = [
+        "subject",
+        "body",
+        "from_email",
+        "to",
+        "cc",
+        "bcc",
+        "reply_to",
+        "headers",
+        "alternatives",
+        "attempts",
+        "last_error",
+        "created_at",
+        "next_attempt_at",
+    ]
+    search_fields = ["subject"]
+    search_help_text = "Search emails by subject"
+    list_per_page = 50
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
@@ -0,0 +1,94 @@
+import time
+from smtplib import SMTPException, SMTPServerDisconnected
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+
+from training.outbox.models import OutgoingEmail
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the emails queued by OutboxEmailBackend over a single "
+        "connection of OUTBOX_EMAIL_BACKEND, failed ones are retried later. "
+        "Run it as a cron job, or as a worker with --watch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of emails claimed at once (default: 100).",
+        )
+        parser.add_argument(
+            "--watch",
+            type=float,
+            help="Keep running and look for new emails every WATCH seconds.",
+        )
+
+    def send_email(self, connection, email):
+        """
+        Send email, once more over a new connection if the server dropped
+        the previous one.
+        """
+        message = email.to_message(connection)
+        try:
+            connection.send_messages([message])
+        except OSError as error:
+            # SMTPException is an OSError too, a new connection won't help
+            # an email refused by the server.
+            if isinstance(error, SMTPException) and not isinstance(
+                error, SMTPServerDisconnected
+            ):
+                raise
+            connection.close()
+            connection.open()
+            connection.send_messages([message])
+
+    def send_batch(self, connection, batch_size):
+        """
+        Send the next due emails, claimed so that several workers send
+        different ones. Return the numbers of sent and failed emails.
+        """
+        emails = OutgoingEmail.objects.claim(batch_size)
+        sent, failed = [], []
+        for email in emails:
+            try:
+                self.send_email(connection, email)
+            except Exception as error:
+                email.record_failure(error)
+                failed.append(email)
+                if self.verbosity > 1:
+                    self.stderr.write(f"{email}: {email.last_error}")
+            else:
+                sent.append(email.pk)
+        OutgoingEmail.objects.filter(pk__in=sent).delete()
+        OutgoingEmail.objects.bulk_update(
+            failed, ["attempts", "last_error", "next_attempt_at"]
+        )
+        return len(sent), len(failed)
+
+    def send(self, batch_size):
+        sent = failed = 0
+        if not OutgoingEmail.objects.due().exists():
+            return sent, failed
+        with get_connection(settings.OUTBOX_EMAIL_BACKEND) as connection:
+            while True:
+                batch_sent, batch_failed = self.send_batch(connection, batch_size)
+                if not batch_sent and not batch_failed:
+                    return sent, failed
+                sent, failed = sent + batch_sent, failed + batch_failed
+
+    def handle(self, *args, batch_size, watch, verbosity, **options):
+        self.verbosity = verbosity
+        if watch is None:
+            sent, failed = self.send(batch_size)
+            self.stdout.write(f"{sent} emails sent, {failed} failed.")
+            return
+        while True:
+            sent, failed = self.send(batch_size)
+            if sent or failed:
+                self.stdout.write(f"{sent} emails sent, {failed} failed.")
+            time.sleep(watch)
@@ -0,0 +1,139 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.db import models, transaction
+from django.utils import timezone
+
+from training.common.ids import uuid7
+
+
+class OutgoingEmailManager(models.Manager):
+    def due(self):
+        """Return the emails to send now, oldest first."""
+        return self.filter(
+            attempts__lt=settings.OUTBOX_MAX_ATTEMPTS,
+            next_attempt_at__lte=timezone.now(),
+        ).order_by("next_attempt_at")
+
+    def claim(self, count):
+        """
+        Return the next count due emails, delayed by OUTBOX_CLAIM_TIMEOUT
+        seconds so that other workers don't send them meanwhile. The rows
+        are only locked while claimed, not while the emails are sent.
+        """
+        with transaction.atomic():
+            emails = list(self.due().select_for_update(skip_locked=True)[:count])
+            next_attempt_at = timezone.now() + timedelta(
+                seconds=settings.OUTBOX_CLAIM_TIMEOUT
+            )
+            self.filter(pk__in=[email.pk for email in emails]).update(
+                next_attempt_at=next_attempt_at
+            )
+        return emails
+
+    def failed(self):
+        """Return the emails given up after OUTBOX_MAX_ATTEMPTS attempts."""
+        return self.filter(attempts__gte=settings.OUTBOX_MAX_ATTEMPTS)
+
+
+class OutgoingEmail(models.Model):
+    """
+    An email queued by OutboxEmailBackend and sent by the send_outbox
+    command. Emails are deleted once sent, the failed ones are kept with
+    their last error.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        unique=True,
+        editable=False,
+        default=uuid7,
+    )
+    subject = models.TextField()
+    body = models.TextField()
+    from_email = models.CharField(
+        max_length=254,
+    )
+    to = models.JSONField(
+        default=list,
+    )
+    cc = models.JSONField(
+        default=list,
+    )
+    bcc = models.JSONField(
+        default=list,
+    )
+    reply_to = models.JSONField(
+        default=list,
+    )
+    headers = models.JSONField(
+        default=dict,
+    )
+    # [[content, mimetype], ...] of EmailMultiAlternatives.
+    alternatives = models.JSONField(
+        default=list,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+    )
+    last_error = models.TextField(
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+    )
+
+    objects = OutgoingEmailManager()
+
+    @classmethod
+    def from_message(cls, message):
+        """Return an unsaved OutgoingEmail of an EmailMessage."""
+        if message.attachments:
+            raise ValueError("Emails with attachments cannot be queued.")
+        return cls(
+            subject=message.subject,
+            body=message.body,
+            from_email=message.from_email,
+            to=list(message.to),
+            cc=list(message.cc),
+            bcc=list(message.bcc),
+            reply_to=list(message.reply_to),
+            headers=message.extra_headers,
+            alternatives=[
+                list(alternative)
+                for alternative in getattr(message, "alternatives", [])
+            ],
+        )
+
+    def to_message(self, connection=None):
+        return EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to,
+            cc=self.cc,
+            bcc=self.bcc,
+            reply_to=self.reply_to,
+            headers=self.headers,
+            alternatives=[tuple(alternative) for alternative in self.alternatives],
+            connection=connection,
+        )
+
+    def record_failure(self, error):
+        """
+        Count a failed attempt, the next one is delayed by
+        OUTBOX_RETRY_DELAY seconds, doubled on each failure.
+        """
+        self.attempts += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self.next_attempt_at = timezone.now() + timedelta(
+            seconds=settings.OUTBOX_RETRY_DELAY * 2 ** (self.attempts - 1)
+        )
+
+    def __str__(self):
+        return f"Email to {', '.join(self.to)}: {self.subject}"
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from training.outbox.models import OutgoingEmail
+
+
+User = get_user_model()
+
+
+@override_settings(EMAIL_BACKEND="training.outbox.backends.OutboxEmailBackend")
+class TestOutboxEmailBackend(TestCase):
+    def test_send_queues_message(self):
+        message = EmailMultiAlternatives(
+            subject="subject",
+            body="body",
+            from_email="from@email.com",
+            to=["to@email.com"],
+            bcc=["bcc@email.com"],
+            headers={"X-Test": "1"},
+        )
+        message.attach_alternative("<p>body</p>", "text/html")
+
+        self.assertEqual(message.send(), 1)
+        self.assertEqual(mail.outbox, [])
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.to, ["to@email.com"])
+        self.assertEqual(email.attempts, 0)
+        queued = email.to_message()
+        self.assertEqual(queued.subject, "subject")
+        self.assertEqual(queued.recipients(), ["to@email.com", "bcc@email.com"])
+        self.assertEqual(queued.extra_headers, {"X-Test": "1"})
+        self.assertEqual(queued.alternatives, [("<p>body</p>", "text/html")])
+
+    def test_send_many_single_query(self):
+        messages = [
+            EmailMessage("subject", "body", to=[f"to{i}@email.com"]) for i in range(3)
+        ]
+        with self.assertNumQueries(1):
+            self.assertEqual(mail.get_connection().send_messages(messages), 3)
+
+    def test_attachments_not_supported(self):
+        message = EmailMessage("subject", "body", to=["to@email.com"])
+        message.attach("file.txt", "content", "text/plain")
+        with self.assertRaises(ValueError):
+            message.send()
+        connection = mail.get_connection(fail_silently=True)
+        self.assertEqual(connection.send_messages([message]), 0)
+        self.assertFalse(OutgoingEmail.objects.exists())
+
+    def test_password_reset_queued(self):
+        User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        response = self.client.post(
+            reverse("authentication:password-reset"),
+            data={"email": "user@email.com"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(OutgoingEmail.objects.get().to, ["user@email.com"])
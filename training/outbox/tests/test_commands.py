@@ -0,0 +1,146 @@
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from training.outbox.models import OutgoingEmail
+
+
+class FailingEmailBackend(EmailBackend):
+    """
+    Locmem backend refusing the emails sent to fail@email.com, dropping
+    the first connection on the emails sent to drop@email.com and every
+    connection on those sent to gone@email.com.
+    """
+
+    opened = 0
+
+    def open(self):
+        self.opened += 1
+
+    def send_messages(self, messages):
+        for message in messages:
+            if "fail@email.com" in message.to:
+                raise SMTPRecipientsRefused({"fail@email.com": (550, b"Refused")})
+            if "gone@email.com" in message.to or (
+                "drop@email.com" in message.to and self.opened < 2
+            ):
+                raise SMTPServerDisconnected("Connection unexpectedly closed")
+        return super().send_messages(messages)
+
+
+@override_settings(
+    OUTBOX_EMAIL_BACKEND=(
+        "training.outbox.tests.test_commands.FailingEmailBackend"
+    ),
+    OUTBOX_MAX_ATTEMPTS=2,
+    OUTBOX_RETRY_DELAY=60,
+)
+class TestSendOutboxCommand(TestCase):
+    def queue(self, *recipients):
+        OutgoingEmail.objects.bulk_create(
+            OutgoingEmail(subject="subject", body="body", to=[recipient])
+            for recipient in recipients
+        )
+
+    def call_command(self, **options):
+        out = StringIO()
+        call_command("send_outbox", stdout=out, **options)
+        return out.getvalue()
+
+    def test_send(self):
+        self.queue("to1@email.com", "to2@email.com", "to3@email.com")
+        output = self.call_command(batch_size=2)
+
+        self.assertEqual(output, "3 emails sent, 0 failed.\n")
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [["to1@email.com"], ["to2@email.com"], ["to3@email.com"]],
+        )
+        self.assertFalse(OutgoingEmail.objects.exists())
+
+    def test_single_connection(self):
+        self.queue("to1@email.com", "to2@email.com", "to3@email.com")
+        with patch.object(
+            FailingEmailBackend, "open", autospec=True, return_value=True
+        ) as open_:
+            self.call_command(batch_size=1)
+        open_.assert_called_once()
+
+    def test_retry(self):
+        self.queue("fail@email.com", "to@email.com")
+        output = self.call_command()
+
+        self.assertEqual(output, "1 emails sent, 1 failed.\n")
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("SMTPRecipientsRefused", email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+        # Not due yet.
+        self.assertEqual(self.call_command(), "0 emails sent, 0 failed.\n")
+
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(self.call_command(), "0 emails sent, 1 failed.\n")
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 2)
+        self.assertGreaterEqual(
+            email.next_attempt_at, timezone.now() + timedelta(seconds=119)
+        )
+        # Given up after OUTBOX_MAX_ATTEMPTS.
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(self.call_command(), "0 emails sent, 0 failed.\n")
+        self.assertEqual(list(OutgoingEmail.objects.failed()), [email])
+
+    def test_reconnect(self):
+        self.queue("drop@email.com", "to@email.com")
+        with patch.object(
+            FailingEmailBackend,
+            "open",
+            autospec=True,
+            side_effect=FailingEmailBackend.open,
+        ) as open_:
+            output = self.call_command()
+
+        self.assertEqual(output, "2 emails sent, 0 failed.\n")
+        self.assertEqual(open_.call_count, 2)
+        self.assertFalse(OutgoingEmail.objects.exists())
+
+    def test_reconnect_once(self):
+        self.queue("gone@email.com")
+        output = self.call_command()
+
+        self.assertEqual(output, "0 emails sent, 1 failed.\n")
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("SMTPServerDisconnected", email.last_error)
+
+    def test_refused_not_retried(self):
+        self.queue("fail@email.com")
+        with patch.object(
+            FailingEmailBackend,
+            "open",
+            autospec=True,
+            side_effect=FailingEmailBackend.open,
+        ) as open_:
+            self.call_command()
+
+        open_.assert_called_once()
+
+    def test_claimed_emails_skipped(self):
+        self.queue("to1@email.com", "to2@email.com")
+        # Claimed by another worker, still sending them.
+        claimed = OutgoingEmail.objects.claim(1)
+        output = self.call_command()
+
+        self.assertEqual(output, "1 emails sent, 0 failed.\n")
+        self.assertEqual(list(OutgoingEmail.objects.all()), claimed)
+        self.assertFalse(OutgoingEmail.objects.due().exists())
+
+    def test_nothing_to_send(self):
+        self.assertEqual(self.call_command(), "0 emails sent, 0 failed.\n")
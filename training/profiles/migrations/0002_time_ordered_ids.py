@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:22
+
+import training.common.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='id',
+            field=models.UUIDField(default=training.common.ids.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+    ]
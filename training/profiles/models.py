@@ -1,8 +1,8 @@
-import uuid
-
 from django.contrib.auth import get_user_model
 from django.db import models
 
+from training.common.ids import uuid7
+
 
 User = get_user_model()
 
@@ -12,7 +12,7 @@ class Profile(models.Model):
         primary_key=True,
         unique=True,
         editable=False,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     user = models.OneToOneField(
         to=User,
@@ -1,7 +1,8 @@
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from training.authentication.cache import invalidate_cached_user
 from training.profiles.models import Profile
 
 
@@ -14,6 +15,17 @@ def create_user_profile(sender, instance, created, **kwargs):
         Profile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User, dispatch_uid="save_user_profile")
-def save_user_profile(sender, instance, **kwargs):
-    instance.profile.save()
+@receiver(post_save, sender=User, dispatch_uid="invalidate_saved_user")
+def invalidate_saved_user(sender, instance, **kwargs):
+    # The profile owns no user column, it is not written on user saves.
+    invalidate_cached_user(instance.pk, instance)
+
+
+@receiver(post_save, sender=Profile, dispatch_uid="invalidate_profile_user")
+def invalidate_profile_user(sender, instance, **kwargs):
+    invalidate_cached_user(instance.user_id)
+
+
+@receiver(post_delete, sender=User, dispatch_uid="invalidate_deleted_user")
+def invalidate_deleted_user(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
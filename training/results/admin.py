@@ -1,7 +1,10 @@
+from collections import defaultdict
 from typing import Any
 
 from django import forms
+from django.conf import settings
 from django.contrib import admin
+from django.db import transaction
 from django.db.models.fields.related import ForeignKey
 from django.db.models.query import QuerySet
 from django.http import HttpRequest
@@ -10,7 +13,7 @@ from django.utils.html import format_html
 
 from training.common.admin.mixins import GetReadOnlyFieldsMixin
 from training.profiles.models import Profile
-from training.results.models import Result
+from training.results.models import PackedProgress, Result, TableProgress
 from training.tables.models import Table
 
 
@@ -105,6 +108,43 @@ class ResultAdmin(GetReadOnlyFieldsMixin, admin.ModelAdmin):
             "table__owner__user",
         )
 
+    def save_model(self, request, obj, form, change):
+        # Validated by the form (Result.clean), record the result like
+        # any other batch to update the progress summary incrementally.
+        Result.objects.bulk_record(
+            owner=obj.owner,
+            table=obj.table,
+            outcomes={obj.verb_id: obj.is_success},
+        )
+        if not change:
+            obj.pk = Result.objects.values_list("pk", flat=True).get(
+                owner=obj.owner, table=obj.table, verb_id=obj.verb_id
+            )
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet[Result]):
+        # Bulk deletion does not call Result.delete(), refresh the
+        # progress summaries of the affected tables once per pair.
+        verb_ids = defaultdict(list)
+        for owner_id, table_id, verb_id in queryset.values_list(
+            "owner_id", "table_id", "verb_id"
+        ):
+            verb_ids[owner_id, table_id].append(verb_id)
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            profiles = Profile.objects.in_bulk({owner_id for owner_id, _ in verb_ids})
+            tables = Table.objects.in_bulk({table_id for _, table_id in verb_ids})
+            for (owner_id, table_id), pair_verb_ids in verb_ids.items():
+                TableProgress.objects.refresh(
+                    owner=profiles[owner_id],
+                    table=tables[table_id],
+                )
+                if settings.RESULTS_PACKED_WRITE:
+                    PackedProgress.objects.discard(
+                        owner=profiles[owner_id],
+                        table=tables[table_id],
+                        verb_ids=pair_verb_ids,
+                    )
+
     def formfield_for_foreignkey(
         self,
         db_field: ForeignKey[Any],
@@ -119,3 +159,39 @@ class ResultAdmin(GetReadOnlyFieldsMixin, admin.ModelAdmin):
         if db_field.name == "table":
             kwargs["queryset"] = Table.objects.select_related("owner__user")
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+@admin.register(TableProgress)
+class TableProgressAdmin(admin.ModelAdmin):
+    list_display = [
+        "owner",
+        "table",
+        "success_count",
+        "failed_count",
+        "not_done_count",
+        "last_trained_at",
+    ]
+    readonly_fields = [
+        "owner",
+        "table",
+        "success_count",
+        "failed_count",
+        "not_done_count",
+        "last_trained_at",
+        "updated_at",
+    ]
+    search_fields = [
+        "owner__user__username",
+        "table__name",
+    ]
+    search_help_text = "Search progress by owner and table name."
+    list_per_page = 50
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[TableProgress]:
+        queryset = super().get_queryset(request)
+        return queryset.select_related("owner__user", "table")
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        # Summaries are computed from the results, use the
+        # rebuild_progress command to fix them.
+        return False
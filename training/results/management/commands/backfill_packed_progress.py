@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from training.results.models import PackedProgress
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the PackedProgress bitsets from the Result rows. Run it once "
+        "RESULTS_PACKED_WRITE is set and before setting RESULTS_PACKED_READ."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows read or written per query (default: 1000).",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        with transaction.atomic():
+            count = PackedProgress.objects.backfill(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"{count} packed progress written."))
@@ -0,0 +1,107 @@
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.db.models.functions import Length
+from django.test.utils import override_settings
+
+from training.results.management.commands import benchmark_status_map
+from training.results.models import PackedProgress, Result
+from training.verbs.catalog import bump_catalog_version, catalog
+
+
+class Command(benchmark_status_map.Command):
+    help = (
+        "Compare the storage and the latency of the Result rows and of the "
+        "PackedProgress bitsets on seeded data. Everything is written in a "
+        "transaction that is rolled back."
+    )
+
+    def report(self, label, rows, packed, unit="ms"):
+        self.stdout.write(
+            f"{label}: rows {rows:.1f} {unit}, packed {packed:.1f} {unit} "
+            f"({rows / packed:.1f}x)"
+        )
+
+    def get_storage(self, profile):
+        """
+        Return the bytes used by the rows and by the bitsets of profile,
+        heap only, indexes are not counted. Column sizes are only known
+        on PostgreSQL, elsewhere the size of the bitsets is returned
+        with the number of rows.
+        """
+        packed = PackedProgress.objects.filter(owner=profile)
+        if connection.vendor != "postgresql":
+            return (
+                Result.objects.filter(owner=profile).count(),
+                packed.aggregate(
+                    size=Sum(Length("done") + Length("success"))
+                )["size"],
+            )
+        sizes = []
+        for model in (Result, PackedProgress):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT SUM(pg_column_size(t.*)) FROM {model._meta.db_table} t "
+                    "WHERE owner_id = %s",
+                    [profile.pk],
+                )
+                sizes.append(cursor.fetchone()[0])
+        return sizes
+
+    def handle(self, *args, verbs, results, repeat, **options):
+        with transaction.atomic():
+            user, table = self.seed(verbs, results)
+            profile = user.profile
+            PackedProgress.objects.backfill(batch_size=5000)
+            catalog.clear()
+            catalog.get_verbs()
+            outcomes = {
+                verb_id: bool(i % 3)
+                for i, verb_id in enumerate(catalog.get_table_verb_ids(table.id)[:20])
+            }
+
+            def measure_backends(function):
+                timings = []
+                for packed in (False, True):
+                    with override_settings(
+                        RESULTS_PACKED_READ=packed, RESULTS_PACKED_WRITE=packed
+                    ):
+                        timings.append(self.measure(function, repeat))
+                return timings
+
+            self.stdout.write(
+                f"{verbs} verbs, {Result.objects.filter(owner=profile).count()} "
+                f"results, median of {repeat} runs"
+            )
+            rows_size, packed_size = self.get_storage(profile)
+            if connection.vendor == "postgresql":
+                self.report("Storage", rows_size / 1024, packed_size / 1024, "kB")
+            else:
+                self.stdout.write(
+                    f"Storage: {rows_size} rows, packed {packed_size / 1024:.1f} kB"
+                )
+            self.report(
+                "Verb list",
+                *measure_backends(lambda: Result.objects.status_map(profile)),
+            )
+            self.report(
+                "Table detail",
+                *measure_backends(
+                    lambda: Result.objects.status_map(profile, table=table)
+                ),
+            )
+            rows_ms = self.measure(
+                lambda: Result.objects.record_attempts(
+                    owner=profile, table=table, outcomes=outcomes
+                ),
+                repeat,
+            )
+            packed_ms = self.measure(
+                lambda: PackedProgress.objects.record(
+                    owner=profile, table=table, outcomes=outcomes
+                ),
+                repeat,
+            )
+            self.report("Record 20 outcomes", rows_ms, packed_ms)
+            transaction.set_rollback(True)
+        catalog.clear()
+        bump_catalog_version()
@@ -0,0 +1,146 @@
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from training.results.models import Result
+from training.tables.models import Table
+from training.verbs.catalog import bump_catalog_version, catalog
+from training.verbs.models import Verb
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the correlated is_success subquery with "
+        "Result.objects.status_map() on seeded data. Everything is written "
+        "in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbs", type=int, default=1000)
+        parser.add_argument("--results", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def seed(self, verbs_count, results_count):
+        suffix = uuid.uuid4().hex[:8]
+        user = User.objects.create_user(
+            username=f"benchmark-{suffix}",
+            email=f"benchmark-{suffix}@email.com",
+            password="benchmark",
+        )
+        verbs = Verb.objects.bulk_create(
+            Verb(
+                infinitive=f"verb {i}",
+                simple_past=f"simple past {i}",
+                past_participle=f"past participle {i}",
+                translation=f"translation {i}",
+            )
+            for i in range(verbs_count)
+        )
+        tables_count = -(-results_count // verbs_count)
+        tables = Table.objects.bulk_create(
+            Table(
+                type=Table.USER_TABLE,
+                name=f"table {i}",
+                slug_name=f"table-{i}",
+                owner=user.profile,
+            )
+            for i in range(tables_count)
+        )
+        Through = Table.verbs.through
+        results = []
+        for table in tables:
+            Through.objects.bulk_create(
+                Through(table_id=table.id, verb_id=verb.id) for verb in verbs
+            )
+            results.extend(
+                Result(
+                    owner=user.profile,
+                    table=table,
+                    verb=verb,
+                    is_success=bool(i % 2),
+                )
+                for i, verb in enumerate(verbs)
+            )
+        Result.objects.bulk_create(results[:results_count], batch_size=5000)
+        return user, tables[0]
+
+    def measure(self, function, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def report(self, label, subquery_ms, status_map_ms):
+        self.stdout.write(
+            f"{label}: subquery {subquery_ms:.1f} ms, "
+            f"status_map {status_map_ms:.1f} ms "
+            f"({subquery_ms / status_map_ms:.1f}x)"
+        )
+
+    def handle(self, *args, verbs, results, repeat, **options):
+        with transaction.atomic():
+            profile, table = self.seed(verbs, results)
+            profile = profile.profile
+            catalog.clear()
+            catalog.get_verbs()
+
+            def verb_list_subquery():
+                return list(
+                    Verb.objects.annotate(
+                        is_success=Subquery(
+                            Result.objects.filter(verb=OuterRef("id"), owner=profile)
+                            .order_by("-updated_at")
+                            .values("is_success")[:1]
+                        )
+                    )
+                )
+
+            def verb_list_status_map():
+                return catalog.with_status(
+                    catalog.get_verbs(), Result.objects.status_map(profile)
+                )
+
+            def table_subquery():
+                return list(
+                    Verb.objects.filter(tables=table).annotate(
+                        is_success=Subquery(
+                            Result.objects.filter(
+                                verb=OuterRef("pk"), owner=profile, table=table
+                            ).values("is_success")[:1]
+                        )
+                    )
+                )
+
+            def table_status_map():
+                return catalog.with_status(
+                    catalog.get_table_verbs(table.id),
+                    Result.objects.status_map(profile, table=table),
+                )
+
+            self.stdout.write(
+                f"{verbs} verbs, {Result.objects.filter(owner=profile).count()} "
+                f"results, median of {repeat} runs"
+            )
+            self.report(
+                "Verb list",
+                self.measure(verb_list_subquery, repeat),
+                self.measure(verb_list_status_map, repeat),
+            )
+            self.report(
+                "Table detail",
+                self.measure(table_subquery, repeat),
+                self.measure(table_status_map, repeat),
+            )
+            transaction.set_rollback(True)
+        catalog.clear()
+        bump_catalog_version()
@@ -0,0 +1,83 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from training.common.ids import uuid7
+
+
+CREATE_TABLE = {
+    "postgresql": (
+        "CREATE TEMPORARY TABLE {table} "
+        "(id uuid NOT NULL PRIMARY KEY, created_at timestamp with time zone)"
+    ),
+    "sqlite": (
+        "CREATE TEMP TABLE {table} "
+        "(id char(32) NOT NULL PRIMARY KEY, created_at datetime)"
+    ),
+}
+INDEX_SIZE = {
+    "postgresql": "SELECT pg_relation_size('{table}_pkey')",
+    "sqlite": (
+        "SELECT SUM(pgsize) FROM dbstat('temp') "
+        "WHERE name = 'sqlite_autoindex_{table}_1'"
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare random (uuid4) and time-ordered (uuid7) primary keys: seed "
+        "a scratch table with each, then report the throughput of inserts "
+        "made in batches of the size of a training and the size of the "
+        "primary key index. Everything is written in a transaction that is "
+        "rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=200_000)
+        parser.add_argument("--rows", type=int, default=20_000)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="Rows per insert (default: 10, a training).",
+        )
+
+    def insert(self, cursor, table, generate, count, batch_size):
+        field = models.UUIDField()
+        sql = f"INSERT INTO {table} (id, created_at) VALUES (%s, %s)"
+        now = timezone.now()
+        for start in range(0, count, batch_size):
+            cursor.executemany(
+                sql,
+                [
+                    (field.get_db_prep_value(generate(), connection), now)
+                    for _ in range(min(batch_size, count - start))
+                ],
+            )
+
+    def handle(self, *args, seed, rows, batch_size, **options):
+        if connection.vendor not in CREATE_TABLE:
+            raise CommandError(f"Unsupported database: {connection.vendor}.")
+        self.stdout.write(
+            f"{seed} seeded rows, {rows} rows inserted {batch_size} at a time"
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            for label, generate in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+                table = f"benchmark_{label}"
+                cursor.execute(CREATE_TABLE[connection.vendor].format(table=table))
+                self.insert(cursor, table, generate, seed, 5000)
+                start = time.perf_counter()
+                self.insert(cursor, table, generate, rows, batch_size)
+                elapsed = time.perf_counter() - start
+                cursor.execute(INDEX_SIZE[connection.vendor].format(table=table))
+                index_size = cursor.fetchone()[0]
+                cursor.execute(f"DROP TABLE {table}")
+                self.stdout.write(
+                    f"{label}: {rows / elapsed:,.0f} rows/s, "
+                    f"index {index_size / 1024:,.0f} kB"
+                )
+            transaction.set_rollback(True)
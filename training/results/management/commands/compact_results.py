@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from training.results.models import Result
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the results of reset generations. Can be run as a cron job "
+        "to purge the results left behind by the reset views."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of results deleted per query (default: 1000).",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        count = Result.objects.purge_stale(batch_size=batch_size)
+        self.stdout.write(f"{count} stale results deleted.")
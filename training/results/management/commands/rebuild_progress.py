@@ -0,0 +1,114 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count
+
+from training.results.models import TableProgress
+from training.tables.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the TableProgress summaries from the Result rows, or verify "
+        "them with --verify."
+    )
+
+    counters = ("success_count", "failed_count", "not_done_count")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report summaries that do not match the Result rows.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of summaries written per query (default: 1000).",
+        )
+
+    def get_expected(self):
+        """
+        Return the summaries computed from the Result rows, keyed by
+        (owner_id, table_id). Existing summaries without any result are
+        included with zero counts.
+        """
+        verbs_counts = dict(
+            Table.verbs.through.objects.filter(verb__is_deleted=False)
+            .values("table_id")
+            .annotate(count=Count("pk"))
+            .values_list("table_id", "count")
+            .order_by()
+        )
+        keys = TableProgress.objects.values_list("owner_id", "table_id")
+        expected = {
+            key: {"success_count": 0, "failed_count": 0, "last_trained_at": None}
+            for key in keys.iterator()
+        }
+        for summary in TableProgress.objects.get_summaries().iterator():
+            key = (summary.pop("owner_id"), summary.pop("table_id"))
+            expected[key] = summary
+        for (_, table_id), summary in expected.items():
+            summary["not_done_count"] = (
+                verbs_counts.get(table_id, 0)
+                - summary["success_count"]
+                - summary["failed_count"]
+            )
+        return expected
+
+    def verify(self, expected):
+        current = {
+            (progress.pop("owner_id"), progress.pop("table_id")): progress
+            for progress in TableProgress.objects.values(
+                "owner_id", "table_id", *self.counters
+            ).iterator()
+        }
+        mismatches = 0
+        for key, summary in expected.items():
+            progress = current.get(key)
+            if summary["success_count"] == summary["failed_count"] == 0 and (
+                progress is None
+            ):
+                # Missing summaries without results read as not done.
+                continue
+            if progress is None or any(
+                progress[counter] != summary[counter] for counter in self.counters
+            ):
+                mismatches += 1
+                self.stderr.write(
+                    "Mismatch for owner %s, table %s: expected %s, got %s"
+                    % (
+                        *key,
+                        {counter: summary[counter] for counter in self.counters},
+                        progress,
+                    )
+                )
+        if mismatches:
+            raise CommandError(f"{mismatches} summaries do not match the results.")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(expected)} summaries match the results.")
+        )
+
+    def rebuild(self, expected, batch_size):
+        summaries = [
+            TableProgress(owner_id=owner_id, table_id=table_id, **summary)
+            for (owner_id, table_id), summary in expected.items()
+        ]
+        with transaction.atomic():
+            TableProgress.objects.bulk_create(
+                summaries,
+                batch_size=batch_size,
+                update_conflicts=True,
+                update_fields=[*self.counters, "last_trained_at", "updated_at"],
+                unique_fields=["owner_id", "table_id"],
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(summaries)} summaries rebuilt.")
+        )
+
+    def handle(self, *args, verify, batch_size, **options):
+        expected = self.get_expected()
+        if verify:
+            self.verify(expected)
+        else:
+            self.rebuild(expected, batch_size)
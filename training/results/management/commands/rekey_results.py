@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from training.results.models import Result
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace the random primary keys of the results created before the "
+        "switch to time-ordered ids. Can be run again, rekeyed results are "
+        "skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of results rekeyed per query (default: 1000).",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        count = Result.objects.rekey(batch_size=batch_size)
+        self.stdout.write(f"{count} results rekeyed.")
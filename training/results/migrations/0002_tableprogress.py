@@ -0,0 +1,81 @@
+# Generated by Django 5.1.4 on 2026-10-18 08:47
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+from django.db.models import Count, F, Max, Q
+
+
+def backfill_progress(apps, schema_editor):
+    """
+    Build the summaries of the existing results, as the rebuild_progress
+    command does, so the progress is not read as not done after deploy.
+    """
+    Result = apps.get_model("results", "Result")
+    Table = apps.get_model("tables", "Table")
+    TableProgress = apps.get_model("results", "TableProgress")
+    db = schema_editor.connection.alias
+    verbs_counts = dict(
+        Table.verbs.through.objects.using(db)
+        .values("table_id")
+        .annotate(count=Count("pk"))
+        .values_list("table_id", "count")
+        .order_by()
+    )
+    summaries = (
+        Result.objects.using(db)
+        .filter(verb__tables=F("table"))
+        .values("owner_id", "table_id")
+        .annotate(
+            success_count=Count("pk", filter=Q(is_success=True)),
+            failed_count=Count("pk", filter=Q(is_success=False)),
+            last_trained_at=Max("updated_at"),
+        )
+        .order_by()
+    )
+    progress = []
+    for summary in summaries.iterator():
+        progress.append(
+            TableProgress(
+                not_done_count=(
+                    verbs_counts.get(summary["table_id"], 0)
+                    - summary["success_count"]
+                    - summary["failed_count"]
+                ),
+                **summary,
+            )
+        )
+        if len(progress) == 1000:
+            TableProgress.objects.using(db).bulk_create(progress)
+            progress = []
+    TableProgress.objects.using(db).bulk_create(progress)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        ('results', '0001_initial'),
+        ('tables', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableProgress',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('success_count', models.PositiveIntegerField(default=0)),
+                ('failed_count', models.PositiveIntegerField(default=0)),
+                ('not_done_count', models.PositiveIntegerField(default=0)),
+                ('last_trained_at', models.DateTimeField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress', to='profiles.profile')),
+                ('table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress', to='tables.table')),
+            ],
+            options={
+                'verbose_name_plural': 'Table progress',
+                'constraints': [models.UniqueConstraint(fields=('owner', 'table'), name='unique_progress_for_table_per_owner')],
+            },
+        ),
+        migrations.RunPython(backfill_progress, migrations.RunPython.noop),
+    ]
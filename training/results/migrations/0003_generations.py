@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('results', '0002_tableprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='result',
+            name='generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='tableprogress',
+            name='generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
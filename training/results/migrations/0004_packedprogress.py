@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:18
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        ('results', '0003_generations'),
+        ('tables', '0003_table_is_deleted'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PackedProgress',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('done', models.BinaryField(default=b'')),
+                ('success', models.BinaryField(default=b'')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='packed_progress', to='profiles.profile')),
+                ('table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='packed_progress', to='tables.table')),
+            ],
+            options={
+                'verbose_name_plural': 'Packed progress',
+                'constraints': [models.UniqueConstraint(fields=('owner', 'table'), name='unique_packed_progress_for_table_per_owner')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:25
+
+import training.common.constraints
+import training.common.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Result is the busiest table, on PostgreSQL its indexes are built
+    # concurrently, without blocking the writes.
+    atomic = False
+
+    dependencies = [
+        ('profiles', '0002_time_ordered_ids'),
+        ('results', '0005_time_ordered_ids'),
+        ('tables', '0004_time_ordered_ids'),
+        ('verbs', '0002_verb_is_deleted'),
+    ]
+
+    operations = [
+        training.common.operations.AddIndexConcurrently(
+            model_name='result',
+            index=models.Index(fields=['owner', 'verb', '-updated_at'], include=('table', 'generation', 'is_success'), name='result_owner_verb_updated_idx'),
+        ),
+        # The covering index is built before the former constraint is
+        # swapped for it.
+        training.common.operations.AddConstraintConcurrently(
+            model_name='result',
+            constraint=training.common.constraints.CoveringUniqueConstraint(fields=('owner', 'table', 'verb'), include=('is_success', 'generation'), name='unique_result_for_verb_in_table_per_owner'),
+            replaces=True,
+        ),
+    ]
@@ -1,14 +1,72 @@
 import uuid
+from collections import defaultdict, namedtuple
+from functools import reduce
+from operator import or_
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
 from django.db.models.constraints import UniqueConstraint
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 
+from training.common.constraints import CoveringUniqueConstraint
+from training.common.ids import uuid7
 from training.profiles.models import Profile
 from training.tables.models import Table
 from training.verbs.models import Verb
 
 
+# {verb_id: is_success} of the results written or left unchanged by
+# ResultManager.record_attempts()
+RecordedAttempts = namedtuple("RecordedAttempts", ["inserted", "changed", "unchanged"])
+
+
+def _mask(verb_ids):
+    """Return a bitset, as an int, with the bit of each verb id set."""
+    mask = 0
+    for verb_id in verb_ids:
+        mask |= 1 << verb_id
+    return mask
+
+
+def _bits(mask):
+    """Yield the positions of the bits set in mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _pack(mask):
+    return mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+
+
+def _unpack(data):
+    return int.from_bytes(bytes(data), "little")
+
+
+def _progress_generation():
+    """Return the generation of the summary of a result, as a subquery."""
+    return Subquery(
+        TableProgress.objects.filter(
+            owner=OuterRef("owner"), table=OuterRef("table")
+        ).values("generation")
+    )
+
+
 class ResultManager(models.Manager):
     def create(self, *, owner, table, verb, **kwargs):
         if not owner:
@@ -19,13 +77,283 @@ class ResultManager(models.Manager):
             raise ValueError("Result must have a verb")
         return super().create(owner=owner, table=table, verb=verb, **kwargs)
 
+    def current(self):
+        """
+        Return the results of the current generation of their progress
+        summary. Older generations were reset and read as not done, see
+        TableProgressManager.reset().
+        """
+        return self.filter(generation__gte=Coalesce(_progress_generation(), 0))
+
+    def current_of(self, owner, table=None):
+        """
+        Same as current() for the results of owner on table, or on every
+        table. The generations are read once instead of a subquery per
+        result.
+        """
+        generations = TableProgress.objects.filter(owner=owner, generation__gt=0)
+        results = self.filter(owner=owner)
+        if table is not None:
+            generations = generations.filter(table=table)
+            results = results.filter(table=table)
+        stale = [
+            Q(table_id=table_id, generation__lt=generation)
+            for table_id, generation in generations.values_list(
+                "table_id", "generation"
+            )
+        ]
+        if stale:
+            results = results.exclude(reduce(or_, stale))
+        return results
+
+    def stale(self):
+        """Return the results of reset generations, see current()."""
+        return self.filter(generation__lt=_progress_generation())
+
+    def purge_stale(self, batch_size=1000):
+        """
+        Delete the results of reset generations, batch_size rows per
+        query so the table is not locked for long. Return the number of
+        deleted results.
+
+        The reset tables are read from their summaries, the results of each
+        are then found by the (owner, table, verb) index instead of
+        comparing every result with its summary as stale() does.
+        """
+        count = 0
+        reset_tables = (
+            TableProgress.objects.filter(generation__gt=0)
+            .values_list("owner_id", "table_id", "generation")
+            .iterator()
+        )
+        for owner_id, table_id, generation in reset_tables:
+            stale = self.filter(
+                owner_id=owner_id, table_id=table_id, generation__lt=generation
+            )
+            while pks := list(stale.values_list("pk", flat=True)[:batch_size]):
+                count += self.filter(pk__in=pks).delete()[0]
+        return count
+
+    def rekey(self, batch_size=1000):
+        """
+        Replace the random (version 4) primary keys with time-ordered
+        ones built from created_at, see training.common.ids.uuid7().
+        Nothing references a result, its key can be changed in place,
+        batch_size rows per query. Return the number of rekeyed results.
+        """
+        count = 0
+        last_pk = None
+        while True:
+            queryset = self.order_by("pk")
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+            rows = list(queryset.values_list("pk", "created_at")[:batch_size])
+            if not rows:
+                return count
+            last_pk = rows[-1][0]
+            new_pks = {
+                pk: uuid7(created_at) for pk, created_at in rows if pk.version != 7
+            }
+            if new_pks:
+                whens = [When(pk=pk, then=Value(new)) for pk, new in new_pks.items()]
+                self.filter(pk__in=new_pks).update(
+                    id=Case(*whens, output_field=models.UUIDField())
+                )
+                count += len(new_pks)
+
+    def delete_removed(self, **filters):
+        """
+        Delete, in a single statement, the results matching filters
+        whose verb no longer belongs to their table.
+        """
+        in_table = Verb.tables.through.objects.filter(
+            table_id=OuterRef("table_id"), verb_id=OuterRef("verb_id")
+        )
+        return self.filter(~Exists(in_table), **filters).delete()
+
+    def status_map(self, profile, table=None):
+        """
+        Return a {verb_id: is_success} mapping of the profile's results.
+        Without table, the latest result of each verb wins.
+
+        Read from the PackedProgress bitsets when RESULTS_PACKED_READ is
+        set.
+        """
+        if settings.RESULTS_PACKED_READ:
+            return PackedProgress.objects.status_map(profile, table=table)
+        return {
+            verb_id: is_success
+            for verb_id, is_success in self.status_results(profile, table=table)
+            if is_success is not None
+        }
+
+    def status_results(self, profile, table=None):
+        """
+        Return the (verb_id, is_success) rows read by status_map(). Without
+        table, one row per verb, is_success is the latest result of the
+        verb read by a subquery on the (owner, verb, -updated_at) index, or
+        None.
+        """
+        results = self.current_of(profile, table=table)
+        if table is not None:
+            return results.values_list("verb_id", "is_success")
+        latest = (
+            results.filter(verb=OuterRef("pk"))
+            .order_by("-updated_at")
+            .values("is_success")[:1]
+        )
+        return (
+            Verb.objects.annotate(is_success=Subquery(latest))
+            .order_by()
+            .values_list("pk", "is_success")
+        )
+
+    def validate_outcomes(self, *, owner, table, verb_ids):
+        """
+        Raise a ValidationError if table belongs to another profile than
+        owner or if one of the verbs does not belong to table. Runs a
+        single query whatever the number of verbs.
+        """
+        if table.owner_id is not None and table.owner_id != owner.pk:
+            raise ValidationError(
+                {
+                    "table": (
+                        f"The table '{table}' does not belong to "
+                        f"'{owner} profile"
+                    )
+                }
+            )
+        verb_ids = set(verb_ids)
+        missing_ids = verb_ids - set(
+            Verb.tables.through.objects.filter(
+                table_id=table.pk, verb_id__in=verb_ids
+            ).values_list("verb_id", flat=True)
+        )
+        if missing_ids:
+            verbs = ", ".join(
+                f"'{verb}'" for verb in Verb.objects.filter(id__in=missing_ids)
+            )
+            if len(missing_ids) == 1:
+                message = f"The verb {verbs} does not belong to '{table}' table."
+            else:
+                message = f"The verbs {verbs} do not belong to '{table}' table."
+            raise ValidationError({"verb": message})
+
+    def bulk_record(self, *, owner, table, outcomes, last_trained_at=None):
+        """
+        Validate and save the outcomes ({verb_id: is_success}) of owner
+        on table, then update the progress summary.
+
+        Verbs and ownership are checked once for the whole batch instead
+        of once per Result.clean(), see validate_outcomes(). Return the
+        RecordedAttempts of record_attempts().
+        """
+        outcomes = dict(outcomes)
+        self.validate_outcomes(owner=owner, table=table, verb_ids=outcomes)
+        with transaction.atomic(using=self.db):
+            attempts = self.record_attempts(
+                owner=owner, table=table, outcomes=outcomes
+            )
+            TableProgress.objects.apply_attempts(
+                owner=owner,
+                table=table,
+                attempts=attempts,
+                last_trained_at=last_trained_at,
+            )
+        return attempts
+
+    def locked_outcomes(self, *, owner, table, verb_ids, generation):
+        """
+        Return the (verb_id, is_success) of the results of owner on table
+        of verb_ids from generation on. The rows are locked until the end
+        of the transaction, so that a concurrent attempt doesn't change
+        them between the read and the writes of record_attempts().
+        """
+        return (
+            self.select_for_update()
+            .filter(
+                owner=owner,
+                table=table,
+                verb_id__in=verb_ids,
+                generation__gte=generation,
+            )
+            .values_list("verb_id", "is_success")
+        )
+
+    def record_attempts(self, *, owner, table, outcomes):
+        """
+        Save the outcomes ({verb_id: is_success}) of owner on table.
+
+        Only new results are inserted and only results whose is_success
+        changed are updated, at most one UPDATE per value. Unchanged rows
+        are not written, their updated_at is kept. Results of a reset
+        generation are overwritten and counted as inserted. The existing
+        results are locked while they are compared. Return the
+        inserted, changed and unchanged outcomes as RecordedAttempts.
+        """
+        outcomes = dict(outcomes)
+        # Without a savepoint, callers already in a transaction don't pay
+        # for one, an error rolls the whole transaction back.
+        with transaction.atomic(using=self.db, savepoint=False):
+            generation = TableProgress.objects.get_generation(
+                owner=owner, table=table
+            )
+            existing = dict(
+                self.locked_outcomes(
+                    owner=owner, table=table, verb_ids=outcomes, generation=generation
+                )
+            )
+            attempts = RecordedAttempts(inserted={}, changed={}, unchanged={})
+            for verb_id, is_success in outcomes.items():
+                if verb_id not in existing:
+                    attempts.inserted[verb_id] = is_success
+                elif existing[verb_id] != is_success:
+                    attempts.changed[verb_id] = is_success
+                else:
+                    attempts.unchanged[verb_id] = is_success
+
+            if attempts.inserted:
+                # Upsert in case a concurrent request inserted some of them.
+                # WARNING update_fields not working on Oracle database.
+                self.bulk_create(
+                    [
+                        self.model(
+                            owner=owner,
+                            table=table,
+                            verb_id=verb_id,
+                            is_success=is_success,
+                            generation=generation,
+                        )
+                        for verb_id, is_success in attempts.inserted.items()
+                    ],
+                    update_conflicts=True,
+                    update_fields=["is_success", "generation", "updated_at"],
+                    unique_fields=["owner_id", "table_id", "verb_id"],
+                )
+            now = timezone.now()
+            for value in (True, False):
+                verb_ids = [
+                    verb_id
+                    for verb_id, is_success in attempts.changed.items()
+                    if is_success is value
+                ]
+                if verb_ids:
+                    self.filter(
+                        owner=owner, table=table, verb_id__in=verb_ids
+                    ).update(is_success=value, updated_at=now)
+            if settings.RESULTS_PACKED_WRITE:
+                PackedProgress.objects.record(
+                    owner=owner, table=table, outcomes=outcomes
+                )
+        return attempts
+
 
 class Result(models.Model):
     id = models.UUIDField(
         primary_key=True,
         unique=True,
         editable=False,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     verb = models.ForeignKey(
         to=Verb,
@@ -45,6 +373,11 @@ class Result(models.Model):
     is_success = models.BooleanField(
         default=False,
     )
+    # TableProgress.generation of owner on table when the result was
+    # recorded, results of older generations were reset.
+    generation = models.PositiveIntegerField(
+        default=0,
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -56,39 +389,65 @@ class Result(models.Model):
 
     class Meta:
         constraints = [
-            UniqueConstraint(
+            CoveringUniqueConstraint(
                 fields=[
                     "owner",
                     "table",
                     "verb",
                 ],
+                # Covering on PostgreSQL, status_map() and record_attempts()
+                # are answered from the index alone.
+                include=[
+                    "is_success",
+                    "generation",
+                ],
                 name="unique_result_for_verb_in_table_per_owner",
             )
         ]
+        indexes = [
+            # Latest result of each verb of a profile, for the verbs list.
+            models.Index(
+                fields=[
+                    "owner",
+                    "verb",
+                    "-updated_at",
+                ],
+                include=[
+                    "table",
+                    "generation",
+                    "is_success",
+                ],
+                name="result_owner_verb_updated_idx",
+            ),
+        ]
 
     def clean(self):
-        if not self.table.verbs.filter(id=self.verb.id).exists():
-            raise ValidationError(
-                {
-                    "verb": (
-                        f"The verb '{self.verb}' does not belong to "
-                        f"'{self.table}' table."
-                    )
-                }
-            )
-        if self.table.owner and self.table.owner.id != self.owner.id:
-            raise ValidationError(
-                {
-                    "table": (
-                        f"The table '{self.table}' does not belong to "
-                        f"'{self.owner} profile"
-                    )
-                }
-            )
+        Result.objects.validate_outcomes(
+            owner=self.owner, table=self.table, verb_ids=[self.verb_id]
+        )
 
     def save(self, *args, **kwargs):
         self.clean()
-        return super().save(*args, **kwargs)
+        self.generation = TableProgress.objects.get_generation(
+            owner=self.owner, table=self.table
+        )
+        super().save(*args, **kwargs)
+        TableProgress.objects.refresh(owner=self.owner, table=self.table)
+        if settings.RESULTS_PACKED_WRITE:
+            PackedProgress.objects.record(
+                owner=self.owner,
+                table=self.table,
+                outcomes={self.verb_id: self.is_success},
+            )
+
+    def delete(self, *args, **kwargs):
+        deleted = super().delete(*args, **kwargs)
+        TableProgress.objects.refresh(owner=self.owner, table=self.table)
+        if settings.RESULTS_PACKED_WRITE:
+            PackedProgress.objects.discard(
+                owner=self.owner, table=self.table, verb_ids=[self.verb_id]
+            )
+        return deleted
 
     def __str__(self):
         return (
@@ -97,3 +456,427 @@ class Result(models.Model):
             f"table <{self.table}> "
             f"verb <{self.verb.infinitive}>"
         )
+
+
+class TableProgressManager(models.Manager):
+    def get_summaries(self, results=None):
+        """
+        Aggregate Result rows into one summary per (owner, table).
+        Only results for verbs that still belong to the table are
+        counted, results should come from ResultManager.current().
+        """
+        if results is None:
+            results = Result.objects.current()
+        return (
+            results.filter(verb__tables=F("table"))
+            .values("owner_id", "table_id")
+            .annotate(
+                success_count=Count("pk", filter=Q(is_success=True)),
+                failed_count=Count("pk", filter=Q(is_success=False)),
+                last_trained_at=Max("updated_at"),
+            )
+            .order_by()
+        )
+
+    def get_generation(self, *, owner, table):
+        """Return the current result generation of owner on table."""
+        progress = self.filter(owner=owner, table=table).values_list(
+            "generation", flat=True
+        )
+        return next(iter(progress), 0)
+
+    def reset(self, *, owner, table=None):
+        """
+        Reset the progress of owner on table, or on every table, in a
+        single UPDATE whatever the number of results.
+
+        The generation is bumped so the existing results are read as not
+        done, they are deleted later by ResultManager.purge_stale() (see
+        the compact_results command). The missing summaries, of results
+        recorded before they existed, are created first.
+        """
+        if table is not None:
+            tables = Table._base_manager.filter(pk=table.pk)
+        else:
+            tables = Table._base_manager.filter(results__owner=owner)
+        missing = (
+            tables.exclude(progress__owner=owner)
+            .annotate(
+                verbs_count=Count(
+                    "verbs", filter=Q(verbs__is_deleted=False), distinct=True
+                )
+            )
+            .values_list("pk", "verbs_count")
+            .distinct()
+        )
+        self.bulk_create(
+            [
+                self.model(owner=owner, table_id=table_id, not_done_count=verbs_count)
+                for table_id, verbs_count in missing
+            ],
+            ignore_conflicts=True,
+        )
+        progress = self.filter(owner=owner)
+        if table is not None:
+            progress = progress.filter(table=table)
+        if settings.RESULTS_PACKED_WRITE:
+            PackedProgress.objects.reset(owner=owner, table=table)
+        return progress.update(
+            not_done_count=(
+                F("not_done_count") + F("success_count") + F("failed_count")
+            ),
+            success_count=0,
+            failed_count=0,
+            generation=F("generation") + 1,
+            last_trained_at=None,
+            updated_at=timezone.now(),
+        )
+
+    def refresh(self, *, owner, table, last_trained_at=None, verbs_count=None):
+        """
+        Recompute the progress of owner on table from its Result rows
+        and upsert the summary. verbs_count, the number of verbs of the
+        table, is counted if not given.
+        """
+        summaries = self.get_summaries(
+            Result.objects.current_of(owner, table=table)
+        )
+        summary = next(iter(summaries), {"success_count": 0, "failed_count": 0})
+        success_count = summary["success_count"]
+        failed_count = summary["failed_count"]
+        progress = self.model(
+            owner=owner,
+            table=table,
+            success_count=success_count,
+            failed_count=failed_count,
+            not_done_count=(
+                (table.verbs.count() if verbs_count is None else verbs_count)
+                - success_count
+                - failed_count
+            ),
+            last_trained_at=last_trained_at or summary.get("last_trained_at"),
+        )
+        self.bulk_create(
+            [progress],
+            update_conflicts=True,
+            update_fields=[
+                "success_count",
+                "failed_count",
+                "not_done_count",
+                "last_trained_at",
+                "updated_at",
+            ],
+            unique_fields=["owner_id", "table_id"],
+        )
+        return progress
+
+    def apply_attempts(
+        self, *, owner, table, attempts, last_trained_at=None, verbs_count=None
+    ):
+        """
+        Update the summary of owner on table with the RecordedAttempts
+        returned by ResultManager.record_attempts(), without reading the
+        results. Fall back to refresh() when there is no summary yet.
+        """
+        success_delta = failed_delta = 0
+        for is_success in attempts.inserted.values():
+            if is_success:
+                success_delta += 1
+            else:
+                failed_delta += 1
+        for is_success in attempts.changed.values():
+            delta = 1 if is_success else -1
+            success_delta += delta
+            failed_delta -= delta
+        # Greatest() keeps a summary out of sync with the results, e.g.
+        # after a queryset delete, from breaking the training.
+        fields = {
+            "success_count": Greatest(F("success_count") + success_delta, 0),
+            "failed_count": Greatest(F("failed_count") + failed_delta, 0),
+            "not_done_count": Greatest(
+                F("not_done_count") - len(attempts.inserted), 0
+            ),
+            "updated_at": timezone.now(),
+        }
+        if last_trained_at is not None:
+            fields["last_trained_at"] = last_trained_at
+        if not self.filter(owner=owner, table=table).update(**fields):
+            self.refresh(
+                owner=owner,
+                table=table,
+                last_trained_at=last_trained_at,
+                verbs_count=verbs_count,
+            )
+
+    def refresh_table(self, table):
+        """
+        Recompute every summary of the table, e.g. after its verbs
+        changed. Runs as a constant number of UPDATE statements whatever
+        the number of profiles.
+        """
+        results = (
+            Result.objects.filter(
+                owner=OuterRef("owner"),
+                table=OuterRef("table"),
+                verb__tables=OuterRef("table"),
+                generation__gte=OuterRef("generation"),
+            )
+            .order_by()
+            .values("owner")
+        )
+        success_count = results.filter(is_success=True).annotate(count=Count("pk"))
+        failed_count = results.filter(is_success=False).annotate(count=Count("pk"))
+        progress = self.filter(table=table)
+        progress.update(
+            success_count=Coalesce(Subquery(success_count.values("count")), 0),
+            failed_count=Coalesce(Subquery(failed_count.values("count")), 0),
+        )
+        progress.update(
+            not_done_count=(
+                Value(table.verbs.count()) - F("success_count") - F("failed_count")
+            )
+        )
+
+
+class TableProgress(models.Model):
+    """
+    Denormalized summary of the results of a profile on a table.
+
+    Kept in sync by the views and signals writing Result rows, so
+    reading the progress of a table does not scan the Result table.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        unique=True,
+        editable=False,
+        default=uuid.uuid4,
+    )
+    owner = models.ForeignKey(
+        to=Profile,
+        on_delete=models.CASCADE,
+        related_name="progress",
+    )
+    table = models.ForeignKey(
+        to=Table,
+        on_delete=models.CASCADE,
+        related_name="progress",
+    )
+    success_count = models.PositiveIntegerField(
+        default=0,
+    )
+    failed_count = models.PositiveIntegerField(
+        default=0,
+    )
+    not_done_count = models.PositiveIntegerField(
+        default=0,
+    )
+    # Bumped on reset, see TableProgressManager.reset().
+    generation = models.PositiveIntegerField(
+        default=0,
+    )
+    last_trained_at = models.DateTimeField(
+        null=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    objects = TableProgressManager()
+
+    class Meta:
+        verbose_name_plural = "Table progress"
+        constraints = [
+            UniqueConstraint(
+                fields=[
+                    "owner",
+                    "table",
+                ],
+                name="unique_progress_for_table_per_owner",
+            )
+        ]
+
+    def __str__(self):
+        return f"Progress: owner <{self.owner}> table <{self.table}>"
+
+
+class PackedProgressManager(models.Manager):
+    def record(self, *, owner, table, outcomes):
+        """Set the bits of the outcomes ({verb_id: is_success})."""
+        done = _mask(outcomes)
+        success = _mask(
+            verb_id for verb_id, is_success in outcomes.items() if is_success
+        )
+        with transaction.atomic(using=self.db):
+            progress, _ = self.select_for_update().get_or_create(
+                owner=owner, table=table
+            )
+            progress.done_mask |= done
+            progress.success_mask = (progress.success_mask & ~done) | success
+            progress.save()
+        return progress
+
+    def discard(self, *, owner, table, verb_ids):
+        """Clear the bits of the verbs, they read as not done."""
+        mask = _mask(verb_ids)
+        with transaction.atomic(using=self.db):
+            for progress in self.select_for_update().filter(owner=owner, table=table):
+                progress.done_mask &= ~mask
+                progress.success_mask &= ~mask
+                progress.save()
+
+    def clear_removed(self, table_ids=None):
+        """
+        Clear the bits of the verbs that no longer belong to their
+        table, for the given tables or every table.
+        """
+        through = Verb.tables.through.objects.all()
+        progress = self.all()
+        if table_ids is not None:
+            through = through.filter(table_id__in=table_ids)
+            progress = progress.filter(table_id__in=table_ids)
+        masks = defaultdict(int)
+        for table_id, verb_id in through.values_list("table_id", "verb_id"):
+            masks[table_id] |= 1 << verb_id
+        with transaction.atomic(using=self.db):
+            changed = []
+            for packed in progress.select_for_update():
+                mask = masks[packed.table_id]
+                if packed.done_mask & ~mask:
+                    packed.done_mask &= mask
+                    packed.success_mask &= mask
+                    changed.append(packed)
+            self.bulk_update(changed, ["done", "success"], batch_size=1000)
+
+    def reset(self, *, owner, table=None):
+        progress = self.filter(owner=owner)
+        if table is not None:
+            progress = progress.filter(table=table)
+        return progress.update(done=b"", success=b"", updated_at=timezone.now())
+
+    def status_map(self, profile, table=None):
+        """
+        Same as ResultManager.status_map(). Without table, the verbs of
+        the latest updated table win as the bitsets have no date per
+        verb.
+        """
+        progress = self.filter(owner=profile)
+        if table is not None:
+            progress = progress.filter(table=table)
+        status_map = {}
+        for done, success in progress.order_by("updated_at").values_list(
+            "done", "success"
+        ):
+            done, success = _unpack(done), _unpack(success)
+            status_map.update(dict.fromkeys(_bits(done & ~success), False))
+            status_map.update(dict.fromkeys(_bits(success), True))
+        return status_map
+
+    def backfill(self, batch_size=1000):
+        """
+        Write the bitsets of every (owner, table) from the current
+        Result rows. Return the number of PackedProgress written.
+        """
+        masks = defaultdict(lambda: [0, 0])
+        results = (
+            Result.objects.current()
+            .filter(verb__tables=F("table"))
+            .values_list("owner_id", "table_id", "verb_id", "is_success")
+            .order_by()
+        )
+        for owner_id, table_id, verb_id, is_success in results.iterator(
+            chunk_size=batch_size
+        ):
+            mask = masks[owner_id, table_id]
+            mask[0] |= 1 << verb_id
+            if is_success:
+                mask[1] |= 1 << verb_id
+        packed = [
+            self.model(
+                owner_id=owner_id,
+                table_id=table_id,
+                done=_pack(done),
+                success=_pack(success),
+            )
+            for (owner_id, table_id), (done, success) in masks.items()
+        ]
+        self.bulk_create(
+            packed,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=["done", "success", "updated_at"],
+            unique_fields=["owner_id", "table_id"],
+        )
+        return len(packed)
+
+
+class PackedProgress(models.Model):
+    """
+    Compact storage of the results of a profile on a table: two bitsets
+    indexed by verb id, 'done' has the bit of each verb with a result
+    set and 'success' the bit of each succeeded verb.
+
+    Written alongside the Result rows when RESULTS_PACKED_WRITE is set
+    and read by ResultManager.status_map() when RESULTS_PACKED_READ is
+    set. Existing results are copied with the backfill_packed_progress
+    command.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        unique=True,
+        editable=False,
+        default=uuid.uuid4,
+    )
+    owner = models.ForeignKey(
+        to=Profile,
+        on_delete=models.CASCADE,
+        related_name="packed_progress",
+    )
+    table = models.ForeignKey(
+        to=Table,
+        on_delete=models.CASCADE,
+        related_name="packed_progress",
+    )
+    done = models.BinaryField(
+        default=b"",
+    )
+    success = models.BinaryField(
+        default=b"",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    objects = PackedProgressManager()
+
+    class Meta:
+        verbose_name_plural = "Packed progress"
+        constraints = [
+            UniqueConstraint(
+                fields=[
+                    "owner",
+                    "table",
+                ],
+                name="unique_packed_progress_for_table_per_owner",
+            )
+        ]
+
+    @property
+    def done_mask(self):
+        return _unpack(self.done)
+
+    @done_mask.setter
+    def done_mask(self, mask):
+        self.done = _pack(mask)
+
+    @property
+    def success_mask(self):
+        return _unpack(self.success)
+
+    @success_mask.setter
+    def success_mask(self, mask):
+        self.success = _pack(mask)
+
+    def __str__(self):
+        return f"Packed progress: owner <{self.owner}> table <{self.table}>"
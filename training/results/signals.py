@@ -1,12 +1,61 @@
+from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 
-from training.results.models import Result
+from training.results.models import PackedProgress, Result, TableProgress
 from training.tables.models import Table
 
 
 @receiver(m2m_changed, sender=Table.verbs.through, dispatch_uid="table_changed")
-def delete_results(sender, instance, action, pk_set, **kwargs):
-    """Delete results if verb is deleted from table"""
-    if action == "pre_remove":
-        Result.objects.filter(verb_id__in=pk_set, table=instance).delete()
+def delete_results(sender, instance, action, reverse, pk_set, using, **kwargs):
+    """
+    Delete the results of the verbs removed from a table, from either
+    side of the relation, once the transaction is committed. Verbs
+    added back in the same transaction keep their results.
+    """
+    if action not in ("post_remove", "post_clear"):
+        return
+    if reverse:
+        filters = {"verb": instance}
+        # verb.tables.clear() does not tell which tables were changed
+        table_ids = pk_set or None
+        if pk_set:
+            filters["table_id__in"] = pk_set
+    else:
+        filters = {"table": instance}
+        table_ids = [instance.pk]
+        if pk_set:
+            filters["verb_id__in"] = pk_set
+
+    def delete():
+        Result.objects.delete_removed(**filters)
+        if settings.RESULTS_PACKED_WRITE:
+            PackedProgress.objects.clear_removed(table_ids)
+
+    transaction.on_commit(delete, using=using)
+
+
+@receiver(
+    m2m_changed,
+    sender=Table.verbs.through,
+    dispatch_uid="refresh_table_progress",
+)
+def refresh_progress(
+    sender, instance, action, reverse, pk_set, set_verbs=False, **kwargs
+):
+    """
+    Refresh progress summaries once the verbs of a table changed.
+    Table.set_verbs() refreshes them itself, once for its removal and
+    addition.
+    """
+    if set_verbs or action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        tables = [instance]
+    elif pk_set:
+        tables = Table.objects.filter(pk__in=pk_set)
+    else:
+        return
+    for table in tables:
+        TableProgress.objects.refresh_table(table)
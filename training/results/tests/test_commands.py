@@ -0,0 +1,186 @@
+import uuid
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from training.results.models import PackedProgress, Result, TableProgress
+from training.tables.models import Table
+from training.verbs.models import Verb
+
+
+User = get_user_model()
+
+
+class TestRebuildProgressCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.verb1 = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.verb2 = Verb.objects.create(
+            infinitive="become",
+            simple_past="became",
+            past_participle="become",
+            translation="devenir",
+        )
+        cls.table = Table.objects.create(name="test", owner=cls.user.profile)
+        cls.table.verbs.add(*[cls.verb1, cls.verb2])
+        Result.objects.create(
+            owner=cls.user.profile,
+            table=cls.table,
+            verb=cls.verb1,
+            is_success=True,
+        )
+
+    def test_verify(self):
+        out = StringIO()
+        call_command("rebuild_progress", verify=True, stdout=out)
+        self.assertIn("1 summaries match the results.", out.getvalue())
+
+    def test_verify_verb_deletion_pending(self):
+        self.verb2.delete_later()
+        TableProgress.objects.refresh(owner=self.user.profile, table=self.table)
+        out = StringIO()
+        call_command("rebuild_progress", verify=True, stdout=out)
+        self.assertIn("1 summaries match the results.", out.getvalue())
+
+    def test_verify_mismatch(self):
+        TableProgress.objects.update(success_count=0, not_done_count=2)
+        with self.assertRaisesMessage(
+            CommandError, "1 summaries do not match the results."
+        ):
+            call_command("rebuild_progress", verify=True, stderr=StringIO())
+
+    def test_rebuild(self):
+        TableProgress.objects.update(success_count=0, not_done_count=2)
+        call_command("rebuild_progress", stdout=StringIO())
+        progress = TableProgress.objects.get()
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.failed_count, 0)
+        self.assertEqual(progress.not_done_count, 1)
+
+    def test_rebuild_missing_summary(self):
+        TableProgress.objects.all().delete()
+        call_command("rebuild_progress", stdout=StringIO())
+        progress = TableProgress.objects.get()
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.not_done_count, 1)
+
+
+class TestCompactResultsCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.verb = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.table = Table.objects.create(name="test", owner=cls.user.profile)
+        cls.table.verbs.add(cls.verb)
+        Result.objects.create(
+            owner=cls.user.profile,
+            table=cls.table,
+            verb=cls.verb,
+            is_success=True,
+        )
+
+    def test_compact_results(self):
+        TableProgress.objects.reset(owner=self.user.profile)
+        out = StringIO()
+        call_command("compact_results", batch_size=10, stdout=out)
+        self.assertEqual(out.getvalue(), "1 stale results deleted.\n")
+        self.assertFalse(Result.objects.exists())
+
+    def test_current_results_kept(self):
+        out = StringIO()
+        call_command("compact_results", stdout=out)
+        self.assertEqual(out.getvalue(), "0 stale results deleted.\n")
+        self.assertTrue(Result.objects.exists())
+
+
+class TestBackfillPackedProgressCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.verb = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.table = Table.objects.create(name="test", owner=cls.user.profile)
+        cls.table.verbs.add(cls.verb)
+        Result.objects.create(
+            owner=cls.user.profile,
+            table=cls.table,
+            verb=cls.verb,
+            is_success=True,
+        )
+
+    def test_backfill_packed_progress(self):
+        out = StringIO()
+        call_command("backfill_packed_progress", stdout=out)
+        self.assertIn("1 packed progress written.", out.getvalue())
+        self.assertEqual(
+            PackedProgress.objects.status_map(self.user.profile),
+            {self.verb.id: True},
+        )
+
+
+class TestRekeyResultsCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.verb = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.table = Table.objects.create(name="test", owner=cls.user.profile)
+        cls.table.verbs.add(cls.verb)
+        cls.result = Result.objects.create(
+            id=uuid.uuid4(),
+            owner=cls.user.profile,
+            table=cls.table,
+            verb=cls.verb,
+            is_success=True,
+        )
+
+    def test_rekey_results(self):
+        out = StringIO()
+        call_command("rekey_results", batch_size=10, stdout=out)
+        self.assertEqual(out.getvalue(), "1 results rekeyed.\n")
+        result = Result.objects.get()
+        self.assertEqual(result.id.version, 7)
+        self.assertEqual(result.verb, self.verb)
+        self.assertTrue(result.is_success)
+
+        out = StringIO()
+        call_command("rekey_results", stdout=out)
+        self.assertEqual(out.getvalue(), "0 results rekeyed.\n")
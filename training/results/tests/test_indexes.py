@@ -0,0 +1,93 @@
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from training.common.testcase.mixins import QueryPlanMixin
+from training.results.models import Result, TableProgress
+from training.tables.models import Table
+from training.verbs.models import Verb
+
+
+User = get_user_model()
+
+
+class TestResultIndexes(QueryPlanMixin, TestCase):
+    """
+    The hot Result queries must be served by an index, see
+    Result.Meta.constraints and Result.Meta.indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        verbs = Verb.objects.bulk_create(
+            Verb(
+                infinitive=f"verb {i}",
+                simple_past=f"simple past {i}",
+                past_participle=f"past participle {i}",
+                translation=f"translation {i}",
+            )
+            for i in range(20)
+        )
+        cls.verb_ids = [verb.id for verb in verbs]
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f"user{i}",
+                email=f"user{i}@email.com",
+                password="password",
+            )
+            for j in range(3):
+                table = Table.objects.create(name=f"table {j}", owner=user.profile)
+                table.set_verbs(cls.verb_ids)
+                Result.objects.bulk_create(
+                    Result(
+                        owner=user.profile,
+                        table=table,
+                        verb=verb,
+                        is_success=bool(k % 2),
+                    )
+                    for k, verb in enumerate(verbs)
+                )
+        cls.profile = user.profile
+        cls.table = table
+        TableProgress.objects.refresh(owner=cls.profile, table=cls.table)
+
+    def test_status_map_of_table(self):
+        self.assertIndexScan(
+            Result.objects.status_results(self.profile, table=self.table),
+            "unique_result_for_verb_in_table_per_owner",
+        )
+
+    def test_status_map_of_verbs(self):
+        # Every verb is listed, with a subquery reading its latest result.
+        self.assertIndexScan(
+            Result.objects.status_results(self.profile),
+            "result_owner_verb_updated_idx",
+            scanned=["verbs_verb"],
+        )
+
+    def test_record_attempts_existing_results(self):
+        self.assertIndexScan(
+            Result.objects.locked_outcomes(
+                owner=self.profile,
+                table=self.table,
+                verb_ids=self.verb_ids[:10],
+                generation=0,
+            ),
+            "unique_result_for_verb_in_table_per_owner",
+        )
+
+    def test_admin_excluded_verbs(self):
+        TableProgress.objects.reset(owner=self.profile, table=self.table)
+        request = RequestFactory().get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "results",
+                "id_profile": self.profile.pk,
+                "id_table": self.table.pk,
+            },
+        )
+        queryset, _ = site._registry[Verb].get_search_results(
+            request, Verb.objects.all(), ""
+        )
+        self.assertIndexScan(queryset, "unique_result_for_verb_in_table_per_owner")
@@ -0,0 +1,54 @@
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from training.results.models import Result, TableProgress
+from training.tables.models import Table
+from training.verbs.models import Verb
+
+
+User = get_user_model()
+
+migration = import_module("training.results.migrations.0002_tableprogress")
+
+
+class TestTableProgressMigration(TestCase):
+    def test_backfill_progress(self):
+        user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        table = Table.objects.create(name="table", owner=user.profile)
+        verbs = Verb.objects.bulk_create(
+            Verb(
+                infinitive=f"verb {i}",
+                simple_past=f"verb {i}",
+                past_participle=f"verb {i}",
+                translation=f"verb {i}",
+            )
+            for i in range(3)
+        )
+        table.verbs.add(*verbs)
+        # Results recorded before the summaries existed.
+        Result.objects.bulk_create(
+            Result(owner=user.profile, table=table, verb=verb, is_success=success)
+            for verb, success in zip(verbs, [True, False])
+        )
+        TableProgress.objects.all().delete()
+
+        migration.backfill_progress(
+            apps, SimpleNamespace(connection=connection)
+        )
+
+        progress = TableProgress.objects.get()
+        self.assertEqual(progress.owner, user.profile)
+        self.assertEqual(progress.table, table)
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.failed_count, 1)
+        self.assertEqual(progress.not_done_count, 1)
+        self.assertIsNotNone(progress.last_trained_at)
@@ -1,9 +1,11 @@
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.utils import IntegrityError
-from django.test import TestCase
+from django.test import TestCase, override_settings, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
 
-from training.results.models import Result
+from training.results.models import PackedProgress, Result, TableProgress
 from training.tables.models import Table
 from training.verbs.models import Verb
 
@@ -60,6 +62,203 @@ class TestResultManager(BaseTestCase):
                 verb="",
             )
 
+    def test_status_map(self):
+        other_table = Table.objects.create(name="other", owner=self.user.profile)
+        other_table.verbs.add(self.verb1, self.verb2)
+        Result.objects.create(
+            owner=self.user.profile, table=other_table, verb=self.verb2
+        )
+        Result.objects.create(
+            owner=self.user.profile, table=other_table, verb=self.verb1
+        )
+        Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        # generations of the reset tables, then the results
+        with self.assertNumQueries(2):
+            status_map = Result.objects.status_map(self.user.profile)
+        # The latest result of verb1 wins.
+        self.assertEqual(status_map, {self.verb1.id: True, self.verb2.id: False})
+        self.assertEqual(
+            Result.objects.status_map(self.user.profile, table=other_table),
+            {self.verb1.id: False, self.verb2.id: False},
+        )
+
+    def test_status_map_ignores_reset_results(self):
+        Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        TableProgress.objects.reset(owner=self.user.profile, table=self.table)
+        self.assertEqual(Result.objects.status_map(self.user.profile), {})
+        self.assertEqual(
+            Result.objects.status_map(self.user.profile, table=self.table), {}
+        )
+
+    def test_purge_stale(self):
+        other_table = Table.objects.create(name="other", owner=self.user.profile)
+        other_table.verbs.add(self.verb1, self.verb2)
+        for verb in (self.verb1, self.verb2):
+            Result.objects.create(owner=self.user.profile, table=other_table, verb=verb)
+        result = Result.objects.create(
+            owner=self.user.profile, table=self.table, verb=self.verb1
+        )
+        TableProgress.objects.reset(owner=self.user.profile, table=other_table)
+
+        self.assertEqual(Result.objects.purge_stale(batch_size=1), 2)
+        self.assertQuerySetEqual(Result.objects.all(), [result])
+
+    def test_purge_stale_keeps_current_generation(self):
+        self.table.verbs.add(self.verb2)
+        for verb in (self.verb1, self.verb2):
+            Result.objects.create(owner=self.user.profile, table=self.table, verb=verb)
+        TableProgress.objects.reset(owner=self.user.profile, table=self.table)
+        Result.objects.record_attempts(
+            owner=self.user.profile, table=self.table, outcomes={self.verb1.id: True}
+        )
+
+        self.assertEqual(Result.objects.purge_stale(), 1)
+        self.assertQuerySetEqual(
+            Result.objects.values_list("verb", flat=True), [self.verb1.id]
+        )
+
+
+class TestRecordAttempts(BaseTestCase):
+    def setUp(self):
+        self.table.verbs.add(self.verb2)
+        self.result = Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+
+    def test_insert(self):
+        attempts = Result.objects.record_attempts(
+            owner=self.user.profile,
+            table=self.table,
+            outcomes={self.verb2.id: False},
+        )
+        self.assertEqual(attempts, ({self.verb2.id: False}, {}, {}))
+        self.assertFalse(Result.objects.get(verb=self.verb2).is_success)
+
+    def test_change(self):
+        attempts = Result.objects.record_attempts(
+            owner=self.user.profile,
+            table=self.table,
+            outcomes={self.verb1.id: False},
+        )
+        self.assertEqual(attempts, ({}, {self.verb1.id: False}, {}))
+        self.result.refresh_from_db()
+        self.assertFalse(self.result.is_success)
+
+    def test_unchanged_not_written(self):
+        updated_at = self.result.updated_at
+        # Only the selects of the generation and of the existing results.
+        with self.assertNumQueries(2):
+            attempts = Result.objects.record_attempts(
+                owner=self.user.profile,
+                table=self.table,
+                outcomes={self.verb1.id: True},
+            )
+        self.assertEqual(attempts, ({}, {}, {self.verb1.id: True}))
+        self.result.refresh_from_db()
+        self.assertEqual(self.result.updated_at, updated_at)
+
+    @skipUnlessDBFeature("has_select_for_update")
+    def test_existing_results_locked(self):
+        with CaptureQueriesContext(connection) as queries:
+            Result.objects.record_attempts(
+                owner=self.user.profile,
+                table=self.table,
+                outcomes={self.verb1.id: False},
+            )
+        self.assertIn("FOR UPDATE", queries[1]["sql"])
+
+    def test_reset_result_overwritten(self):
+        TableProgress.objects.reset(owner=self.user.profile, table=self.table)
+        attempts = Result.objects.record_attempts(
+            owner=self.user.profile,
+            table=self.table,
+            outcomes={self.verb1.id: True},
+        )
+        self.assertEqual(attempts, ({self.verb1.id: True}, {}, {}))
+        self.result.refresh_from_db()
+        self.assertEqual(self.result.generation, 1)
+        self.assertQuerySetEqual(Result.objects.current(), [self.result])
+
+
+class TestBulkRecord(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.table.verbs.add(cls.verb2)
+        cls.verb3 = Verb.objects.create(
+            infinitive="cut",
+            simple_past="cut",
+            past_participle="cut",
+            translation="couper",
+        )
+
+    def test_bulk_record(self):
+        # verbs check, then in a savepoint: generation, existing results,
+        # insert, progress update and, without summary yet, the refresh
+        # (generation, results summary, verbs count and upsert).
+        with self.assertNumQueries(11):
+            attempts = Result.objects.bulk_record(
+                owner=self.user.profile,
+                table=self.table,
+                outcomes={self.verb1.id: True, self.verb2.id: False},
+            )
+        self.assertEqual(
+            attempts.inserted, {self.verb1.id: True, self.verb2.id: False}
+        )
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.failed_count, 1)
+        self.assertEqual(progress.not_done_count, 0)
+
+    def test_verbs_not_belong_to_table(self):
+        verb4 = Verb.objects.create(
+            infinitive="do",
+            simple_past="did",
+            past_participle="done",
+            translation="faire",
+        )
+        with self.assertRaisesMessage(
+            ValidationError,
+            f"The verbs '{self.verb3}', '{verb4}' do not belong to "
+            f"'{self.table}' table.",
+        ):
+            Result.objects.bulk_record(
+                owner=self.user.profile,
+                table=self.table,
+                outcomes={self.verb1.id: True, self.verb3.id: True, verb4.id: True},
+            )
+        self.assertFalse(Result.objects.exists())
+
+    def test_table_not_belong_to_owner(self):
+        user2 = User.objects.create_user(
+            username="user2",
+            email="user2@email.com",
+            password="password",
+        )
+        with self.assertRaisesMessage(
+            ValidationError,
+            f"The table '{self.table}' does not belong to '{user2.profile} profile",
+        ):
+            with self.assertNumQueries(0):
+                Result.objects.bulk_record(
+                    owner=user2.profile,
+                    table=self.table,
+                    outcomes={self.verb1.id: True},
+                )
+
 
 class TestResultModel(BaseTestCase):
     def test_str(self):
@@ -109,3 +308,253 @@ class TestResultModel(BaseTestCase):
                 table=self.table,
                 verb=self.verb1,
             )
+
+
+class TestTableProgressManager(BaseTestCase):
+    def setUp(self):
+        self.table.verbs.add(self.verb2)
+
+    def test_refresh(self):
+        Result.objects.bulk_create(
+            [
+                Result(
+                    owner=self.user.profile,
+                    table=self.table,
+                    verb=self.verb1,
+                    is_success=True,
+                ),
+            ]
+        )
+        progress = TableProgress.objects.refresh(
+            owner=self.user.profile, table=self.table
+        )
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.failed_count, 0)
+        self.assertEqual(progress.not_done_count, 1)
+        self.assertEqual(TableProgress.objects.count(), 1)
+
+    def test_reset(self):
+        Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        # missing summaries, then the UPDATE
+        with self.assertNumQueries(2):
+            TableProgress.objects.reset(owner=self.user.profile, table=self.table)
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.generation, 1)
+        self.assertEqual(progress.success_count, 0)
+        self.assertEqual(progress.failed_count, 0)
+        self.assertEqual(progress.not_done_count, 2)
+        self.assertIsNone(progress.last_trained_at)
+        # Reset results are not counted back by a refresh.
+        TableProgress.objects.refresh(owner=self.user.profile, table=self.table)
+        progress.refresh_from_db()
+        self.assertEqual(progress.success_count, 0)
+        self.table.verbs.remove(self.verb2)
+        progress.refresh_from_db()
+        self.assertEqual(progress.success_count, 0)
+        self.assertEqual(progress.not_done_count, 1)
+
+    def test_reset_without_summary(self):
+        # Results recorded before the summaries existed.
+        Result.objects.bulk_create(
+            [
+                Result(
+                    owner=self.user.profile,
+                    table=self.table,
+                    verb=self.verb1,
+                    is_success=True,
+                ),
+            ]
+        )
+        self.assertFalse(TableProgress.objects.exists())
+
+        TableProgress.objects.reset(owner=self.user.profile, table=self.table)
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.generation, 1)
+        self.assertEqual(progress.success_count, 0)
+        self.assertEqual(progress.not_done_count, 2)
+        self.assertEqual(Result.objects.status_map(self.user.profile), {})
+
+    def test_reset_every_table_without_summary(self):
+        Result.objects.bulk_create(
+            [
+                Result(
+                    owner=self.user.profile,
+                    table=self.table,
+                    verb=verb,
+                    is_success=True,
+                )
+                for verb in (self.verb1, self.verb2)
+            ]
+        )
+
+        TableProgress.objects.reset(owner=self.user.profile)
+        progress = TableProgress.objects.get()
+        self.assertEqual(progress.generation, 1)
+        self.assertEqual(progress.not_done_count, 2)
+        self.assertFalse(Result.objects.current_of(self.user.profile).exists())
+
+    def test_result_save_and_delete_refresh_progress(self):
+        result = Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=False,
+        )
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.failed_count, 1)
+        self.assertEqual(progress.not_done_count, 1)
+
+        result.delete()
+        progress.refresh_from_db()
+        self.assertEqual(progress.failed_count, 0)
+        self.assertEqual(progress.not_done_count, 2)
+
+    def test_apply_attempts(self):
+        Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        attempts = Result.objects.record_attempts(
+            owner=self.user.profile,
+            table=self.table,
+            outcomes={self.verb1.id: False, self.verb2.id: False},
+        )
+        with self.assertNumQueries(1):
+            TableProgress.objects.apply_attempts(
+                owner=self.user.profile, table=self.table, attempts=attempts
+            )
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.success_count, 0)
+        self.assertEqual(progress.failed_count, 2)
+        self.assertEqual(progress.not_done_count, 0)
+
+    def test_apply_attempts_out_of_sync_summary(self):
+        Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        # Queryset deletes do not refresh the summary.
+        Result.objects.all().delete()
+        attempts = Result.objects.record_attempts(
+            owner=self.user.profile,
+            table=self.table,
+            outcomes={self.verb1.id: True, self.verb2.id: True},
+        )
+        TableProgress.objects.apply_attempts(
+            owner=self.user.profile, table=self.table, attempts=attempts
+        )
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.not_done_count, 0)
+
+    def test_apply_attempts_without_summary(self):
+        attempts = Result.objects.record_attempts(
+            owner=self.user.profile,
+            table=self.table,
+            outcomes={self.verb1.id: True},
+        )
+        TableProgress.objects.apply_attempts(
+            owner=self.user.profile, table=self.table, attempts=attempts
+        )
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.not_done_count, 1)
+
+    def test_table_verbs_changed_refresh_progress(self):
+        Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        self.table.verbs.remove(self.verb2)
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.success_count, 1)
+        self.assertEqual(progress.not_done_count, 0)
+
+        # The results of the removed verb are deleted on commit.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.table.verbs.remove(self.verb1)
+        progress.refresh_from_db()
+        self.assertEqual(progress.success_count, 0)
+        self.assertEqual(progress.not_done_count, 0)
+
+        self.table.verbs.add(self.verb1, self.verb2)
+        progress.refresh_from_db()
+        self.assertEqual(progress.not_done_count, 2)
+
+
+@override_settings(RESULTS_PACKED_WRITE=True, RESULTS_PACKED_READ=True)
+class TestPackedProgress(BaseTestCase):
+    def setUp(self):
+        self.table.verbs.add(self.verb2)
+
+    def record(self, outcomes):
+        return Result.objects.bulk_record(
+            owner=self.user.profile, table=self.table, outcomes=outcomes
+        )
+
+    def test_record(self):
+        self.record({self.verb1.id: True, self.verb2.id: False})
+        progress = PackedProgress.objects.get()
+        self.assertEqual(
+            progress.done_mask, 1 << self.verb1.id | 1 << self.verb2.id
+        )
+        self.assertEqual(progress.success_mask, 1 << self.verb1.id)
+
+        self.record({self.verb1.id: False})
+        progress.refresh_from_db()
+        self.assertEqual(progress.success_mask, 0)
+
+    def test_status_map(self):
+        self.record({self.verb1.id: True, self.verb2.id: False})
+        expected = {self.verb1.id: True, self.verb2.id: False}
+        self.assertEqual(Result.objects.status_map(self.user.profile), expected)
+        self.assertEqual(
+            Result.objects.status_map(self.user.profile, table=self.table), expected
+        )
+
+    def test_result_save_and_delete(self):
+        result = Result.objects.create(
+            owner=self.user.profile,
+            table=self.table,
+            verb=self.verb1,
+            is_success=True,
+        )
+        self.assertEqual(
+            Result.objects.status_map(self.user.profile), {self.verb1.id: True}
+        )
+        result.delete()
+        self.assertEqual(Result.objects.status_map(self.user.profile), {})
+
+    def test_reset(self):
+        self.record({self.verb1.id: True})
+        TableProgress.objects.reset(owner=self.user.profile, table=self.table)
+        self.assertEqual(Result.objects.status_map(self.user.profile), {})
+
+    def test_verb_removed_from_table(self):
+        self.record({self.verb1.id: True, self.verb2.id: True})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.table.set_verbs([self.verb2])
+        self.table.verbs.add(self.verb1)
+        self.assertEqual(
+            Result.objects.status_map(self.user.profile, table=self.table),
+            {self.verb2.id: True},
+        )
+
+    def test_backfill(self):
+        with self.settings(RESULTS_PACKED_WRITE=False, RESULTS_PACKED_READ=False):
+            self.record({self.verb1.id: True, self.verb2.id: False})
+            expected = Result.objects.status_map(self.user.profile)
+        self.assertFalse(PackedProgress.objects.exists())
+
+        self.assertEqual(PackedProgress.objects.backfill(), 1)
+        self.assertEqual(Result.objects.status_map(self.user.profile), expected)
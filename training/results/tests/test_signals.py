@@ -1,7 +1,9 @@
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from training.results.models import Result
+from training.results.models import Result, TableProgress, TableProgressManager
 from training.tables.models import Table
 from training.verbs.models import Verb
 
@@ -40,5 +42,68 @@ class TestSignals(TestCase):
         table.
         """
         results_count = Result.objects.count()
-        self.table.verbs.remove(self.verb1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.table.verbs.remove(self.verb1)
         self.assertEqual(Result.objects.count(), results_count - 1)
+
+    def test_delete_results_on_commit(self):
+        with self.captureOnCommitCallbacks():
+            self.table.verbs.remove(self.verb1)
+        self.assertEqual(Result.objects.count(), 2)
+
+    def test_delete_results_reverse_remove(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.verb1.tables.remove(self.table)
+        self.assertQuerySetEqual(
+            Result.objects.values_list("verb", flat=True), [self.verb2.id]
+        )
+
+    def test_delete_results_clear(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.table.verbs.clear()
+        self.assertFalse(Result.objects.exists())
+
+    def test_delete_results_set_with_clear(self):
+        # Verbs added back in the same transaction keep their results.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.table.verbs.set([self.verb2], clear=True)
+        self.assertQuerySetEqual(
+            Result.objects.values_list("verb", flat=True), [self.verb2.id]
+        )
+
+    def test_set_verbs(self):
+        verb3 = Verb.objects.create(
+            infinitive="cut",
+            simple_past="cut",
+            past_participle="cut",
+            translation="couper",
+        )
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            patch.object(
+                TableProgressManager,
+                "refresh_table",
+                autospec=True,
+                side_effect=TableProgressManager.refresh_table,
+            ) as refresh_table,
+        ):
+            added_ids, removed_ids = self.table.set_verbs([self.verb2, verb3])
+        # Once for the removal and the addition.
+        refresh_table.assert_called_once()
+        self.assertEqual(added_ids, {verb3.id})
+        self.assertEqual(removed_ids, {self.verb1.id})
+        self.assertQuerySetEqual(
+            self.table.verbs.order_by("id"), [self.verb2, verb3]
+        )
+        self.assertQuerySetEqual(
+            Result.objects.values_list("verb", flat=True), [self.verb2.id]
+        )
+        progress = TableProgress.objects.get(owner=self.user.profile, table=self.table)
+        self.assertEqual(progress.failed_count, 1)
+        self.assertEqual(progress.not_done_count, 1)
+
+    def test_set_verbs_unchanged(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.table.set_verbs([self.verb1.id, self.verb2.id]), (set(), set())
+            )
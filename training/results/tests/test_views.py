@@ -3,7 +3,7 @@ from django.contrib.auth import get_user_model
 from django.test import RequestFactory, TestCase
 from django.urls import reverse, reverse_lazy
 
-from training.results.models import Result
+from training.results.models import Result, TableProgress
 from training.results.views import BaseResetView
 from training.tables.models import DefaultTable, UserTable
 from training.verbs.models import Verb
@@ -98,7 +98,7 @@ class TestBaseResetView(BaseTestCase):
     def setUp(self):
         self.factory = RequestFactory()
 
-    def test_get_results_not_implemented(self):
+    def test_get_table_not_implemented(self):
         request = self.factory.get(self.url)
         request.user = self.user1
 
@@ -106,9 +106,9 @@ class TestBaseResetView(BaseTestCase):
         view.setup(request)
 
         with self.assertRaisesMessage(
-            NotImplementedError, "Subclasses must implement get_results()"
+            NotImplementedError, "Subclasses must implement get_table()"
         ):
-            view.get_results()
+            view.get_table()
 
 
 class TestAllTablesResetView(BaseTestCase):
@@ -134,16 +134,42 @@ class TestAllTablesResetView(BaseTestCase):
     def test_post(self):
         response = self.client.post(self.url)
         self.assertRedirects(response, reverse("verbs:list"))
-        self.assertFalse(Result.objects.filter(owner=self.user1.profile).exists())
-        # Check that only user1 results are deleted
-        self.assertTrue(Result.objects.filter(owner=self.user2.profile).exists())
+        self.assertFalse(
+            Result.objects.current().filter(owner=self.user1.profile).exists()
+        )
+        # Check that only user1 results are reset
+        self.assertTrue(
+            Result.objects.current().filter(owner=self.user2.profile).exists()
+        )
+
+    def test_post_resets_progress(self):
+        self.client.post(self.url)
+        self.assertFalse(
+            TableProgress.objects.filter(
+                owner=self.user1.profile, success_count__gt=0
+            ).exists()
+        )
+        self.assertFalse(
+            TableProgress.objects.filter(
+                owner=self.user1.profile, generation=0
+            ).exists()
+        )
+        self.assertFalse(
+            TableProgress.objects.filter(
+                owner=self.user2.profile, generation=1
+            ).exists()
+        )
 
     def test_delete(self):
         response = self.client.delete(self.url)
         self.assertRedirects(response, reverse("verbs:list"))
-        self.assertFalse(Result.objects.filter(owner=self.user1.profile).exists())
-        # Check that only user1 results are deleted
-        self.assertTrue(Result.objects.filter(owner=self.user2.profile).exists())
+        self.assertFalse(
+            Result.objects.current().filter(owner=self.user1.profile).exists()
+        )
+        # Check that only user1 results are reset
+        self.assertTrue(
+            Result.objects.current().filter(owner=self.user2.profile).exists()
+        )
 
 
 class TestDefaultTableResetView(BaseTestCase):
@@ -184,21 +210,21 @@ class TestDefaultTableResetView(BaseTestCase):
             ),
         )
         self.assertFalse(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user1.profile,
                 table=self.default_table,
             ).exists()
         )
-        # UserTable results are not deleted
+        # UserTable results are not reset
         self.assertTrue(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user1.profile,
                 table=self.user_table1,
             ).exists()
         )
-        # Results from another user's DefaultTable are not deleted.
+        # Results from another user's DefaultTable are not reset.
         self.assertTrue(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user2.profile,
                 table=self.default_table,
             ).exists()
@@ -217,21 +243,46 @@ class TestDefaultTableResetView(BaseTestCase):
             ),
         )
         self.assertFalse(
-            Result.objects.filter(
+            Result.objects.current().filter(
+                owner=self.user1.profile,
+                table=self.default_table,
+            ).exists()
+        )
+        # UserTable results are not reset
+        self.assertTrue(
+            Result.objects.current().filter(
+                owner=self.user1.profile,
+                table=self.user_table1,
+            ).exists()
+        )
+        # Results from another user's DefaultTable are not reset.
+        self.assertTrue(
+            Result.objects.current().filter(
+                owner=self.user2.profile,
+                table=self.default_table,
+            ).exists()
+        )
+
+    def test_post_resets_progress(self):
+        self.client.post(self.url)
+        self.assertTrue(
+            TableProgress.objects.filter(
+                generation=1,
+                success_count=0,
                 owner=self.user1.profile,
                 table=self.default_table,
             ).exists()
         )
-        # UserTable results are not deleted
         self.assertTrue(
-            Result.objects.filter(
+            TableProgress.objects.filter(
+                generation=0,
                 owner=self.user1.profile,
                 table=self.user_table1,
             ).exists()
         )
-        # Results from another user's DefaultTable are not deleted.
         self.assertTrue(
-            Result.objects.filter(
+            TableProgress.objects.filter(
+                generation=0,
                 owner=self.user2.profile,
                 table=self.default_table,
             ).exists()
@@ -276,14 +327,14 @@ class TestUserTableResetView(BaseTestCase):
             ),
         )
         self.assertFalse(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user1.profile,
                 table=self.user_table1,
             ).exists()
         )
-        # DefaultTable results are not deleted
+        # DefaultTable results are not reset
         self.assertTrue(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user1.profile,
                 table=self.default_table,
             ).exists()
@@ -302,14 +353,14 @@ class TestUserTableResetView(BaseTestCase):
             ),
         )
         self.assertFalse(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user1.profile,
                 table=self.user_table1,
             ).exists()
         )
-        # DefaultTable results are not deleted
+        # DefaultTable results are not reset
         self.assertTrue(
-            Result.objects.filter(
+            Result.objects.current().filter(
                 owner=self.user1.profile,
                 table=self.default_table,
             ).exists()
@@ -5,7 +5,7 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic.edit import DeleteView
 
 from training.common.views.mixins import PreviousPageURLMixin, TitleMixin
-from training.results.models import Result
+from training.results.models import Result, TableProgress
 from training.tables.models import DefaultTable, UserTable
 
 
@@ -14,7 +14,7 @@ class BaseResetView(
     PreviousPageURLMixin,
     DeleteView,
 ):
-    """Base view for deleting Result."""
+    """Base view for resetting the results of a table."""
 
     pk_url_kwarg = "pk"
     query_pk_and_slug = True
@@ -24,22 +24,19 @@ class BaseResetView(
 
     def delete(self, request, *args, **kwargs):
         """
-        Call the delete() method on fetched Result objects and redirect
-        to the success URL.
+        Reset the results and redirect to the success URL.
         """
         self.object = self.get_object()
         success_url = self.get_success_url()
-        results = self.get_results()
-        results.delete()
+        self.reset()
         return HttpResponseRedirect(success_url)
 
     def form_valid(self, form):
         """
-        Delete results on form validation and redirect to success URL.
+        Reset results on form validation and redirect to success URL.
         """
         success_url = self.get_success_url()
-        results = self.get_results()
-        results.delete()
+        self.reset()
         return HttpResponseRedirect(success_url)
 
     def get_previous_page_url(self):
@@ -50,17 +47,27 @@ class BaseResetView(
         """
         return self.get_success_url()
 
-    def get_results(self):
+    def reset(self):
         """
-        Return a queryset of Result objects to delete.
+        Reset the progress summaries in a single UPDATE, the results
+        are read as not done and purged later by the compact_results
+        command.
+        """
+        TableProgress.objects.reset(
+            owner=self.request.user.profile, table=self.get_table()
+        )
+
+    def get_table(self):
+        """
+        Return the table to reset, or None for every table.
         Must be implemented in subclasses.
         """
-        raise NotImplementedError("Subclasses must implement get_results()")
+        raise NotImplementedError("Subclasses must implement get_table()")
 
 
 class AllTablesResetView(BaseResetView):
     """
-    View for deleting all Result objects related to the logged-in user
+    View for resetting all Result objects related to the logged-in user
     profile.
     """
 
@@ -69,12 +76,12 @@ class AllTablesResetView(BaseResetView):
     title = _("Reset all")
 
     def get_object(self):
-        # We don't want to retreive a single object as we are deleting
-        # the Result queryset.
+        # We don't want to retreive a single object as we are resetting
+        # every table.
         return None
 
-    def get_results(self):
-        return self.model.objects.filter(owner=self.request.user.profile)
+    def get_table(self):
+        return None
 
     def get_success_url(self):
         return self.success_url
@@ -82,14 +89,14 @@ class AllTablesResetView(BaseResetView):
 
 class DefaultTableResetView(BaseResetView):
     """
-    View for deleting all Result objects belonging to a DefaultTable
+    View for resetting all Result objects belonging to a DefaultTable
     and related to the logged-in user's profile.
     """
 
     model = DefaultTable
 
-    def get_results(self):
-        return self.object.results.filter(owner=self.request.user.profile)
+    def get_table(self):
+        return self.object
 
     def get_success_url(self):
         return reverse(
@@ -105,14 +112,14 @@ class DefaultTableResetView(BaseResetView):
 
 class UserTableResetView(BaseResetView):
     """
-    View for deleting all Result objects belonging to a UserTable
+    View for resetting all Result objects belonging to a UserTable
     and related to the logged-in user's profile.
     """
 
     model = UserTable
 
-    def get_results(self):
-        return self.object.results.all()
+    def get_table(self):
+        return self.object
 
     def get_success_url(self):
         return reverse(
@@ -4,28 +4,56 @@
 #######################
 */
 
+var dtElement = $("#custom-dt");
+
+// Escape text before inserting it in the table HTML
+function escapeHtml(text) {
+    return $("<div>").text(text).html();
+}
+
+function formatInfo(info) {
+    return info.map(function (content) {
+        return (
+            "<div class='fst-italic .text-body'>" +
+                "<div>" + escapeHtml(content) + "</div>" +
+            "</div>"
+        );
+    }).join("");
+}
+
+function formatExamples(examples) {
+    return examples.map(function (example) {
+        return (
+            "<div class='mb-2 .text-body'>" +
+                "<div>" + escapeHtml(example.english) + "</div>" +
+                "<div class='fst-italic'>" + escapeHtml(example.translation) + "</div>" +
+            "</div>"
+        );
+    }).join("");
+}
+
 // Formatting function for childrows
 function format(d) {
-    // `d` is the original data object for the row
+    // `d` holds the info and examples of the verb fetched from the server
     let subrow = "";
-    if (d.info) {
+    if (d.info.length) {
         subrow += (
             "<tr>" +
                 "<td class='childrow-first-col border-bottom-0'></td>" +
                 "<td colspan='4'>" +
                     "<h6 class='fw-bold'>Info</h6>" +
-                    d.info +
+                    formatInfo(d.info) +
                 "</td>" +
             "</tr>"
         );
     }
-    if (d.examples) {
+    if (d.examples.length) {
         subrow += (
             "<tr>" +
                 "<td class='childrow-first-col'></td>" +
                 "<td colspan='4'>" +
                     "<h6 class='fw-bold'>Examples</h6>" +
-                    d.examples +
+                    formatExamples(d.examples) +
                 "</td>" +
             "</tr>"
         );
@@ -33,7 +61,45 @@ function format(d) {
     return $(subrow).toArray()
 }
 
-var table = $("#custom-dt").DataTable({
+// Render a comma separated verb form, one form per line
+function renderForms(data, type, row, meta) {
+    if (type === "pdf") {
+        return data
+    }
+    return data.split(",").map(escapeHtml).join("</br>");
+}
+
+// Rows are paginated by the server, reload every row with their info and
+// examples before exporting then reload the current page.
+function exportAll(exportAction) {
+    return function (e, dt, button, config, cb) {
+        var self = this;
+        var oldStart = dt.settings()[0]._iDisplayStart;
+        dt.one("preXhr", function (e, s, data) {
+            data.start = 0;
+            data.length = -1;
+            data.details = true;
+            dt.one("preDraw", function (e, settings) {
+                exportAction.call(self, e, dt, button, config, cb);
+                dt.one("preXhr", function (e, s, data) {
+                    settings._iDisplayStart = oldStart;
+                    data.start = oldStart;
+                });
+                setTimeout(dt.ajax.reload, 0);
+                // Prevent rendering of the whole table
+                return false;
+            });
+        });
+        dt.ajax.reload();
+    }
+}
+
+var table = dtElement.DataTable({
+    serverSide: true,
+    processing: true,
+    ajax: {
+        url: dtElement.data("url"),
+    },
     initComplete: function () {
         // display table, hidden by css #custom-dt display: none to avoid FOUC
         var api = this.api();
@@ -63,8 +129,9 @@ var table = $("#custom-dt").DataTable({
     },
     scrollX: true,
     scrollCollapse: true,
-    paging: false,
-    info: false,
+    paging: true,
+    pageLength: 50,
+    info: true,
     tabIndex: -1,
     language: {
         searchPanes: {
@@ -97,16 +164,8 @@ var table = $("#custom-dt").DataTable({
                             orthogonal: "pdf",
                             columns: [1, 2, 3, 4, 7],
                             // stripNewlines: false,
-                            format: {
-                                header: function(data, columnIdx) {
-                                    if (columnIdx == 4) {
-                                        return "Examples";
-                                    } else {
-                                        return data;
-                                    }
-                                },
-                            }
                         },
+                        action: exportAll(DataTable.ext.buttons.pdfHtml5.action),
                         customize: function(doc) {
                             doc.defaultStyle.alignment = "center";
                             // doc.content[1].table.widths = ["auto", "auto", "auto", "auto", "*"]
@@ -125,16 +184,8 @@ var table = $("#custom-dt").DataTable({
                         exportOptions: {
                             columns: [1, 2, 3, 4, 7],
                             stripHtml: false,
-                            format: {
-                                header: function(data, columnIdx) {
-                                    if (columnIdx == 4) {
-                                        return "Examples";
-                                    } else {
-                                        return data;
-                                    }
-                                },
-                            },
                         },
+                        action: exportAll(DataTable.ext.buttons.print.action),
                     },
                 ],
             },
@@ -189,32 +240,10 @@ var table = $("#custom-dt").DataTable({
     },
     columnDefs: [
         {
+            // options are sent by the server
             searchPanes: {
                 className: "test-custom-class",
                 header: "Verb status",
-                options: [
-                    {
-                        label: "Successfull",
-                        value: function (rowData, rowIdx) {
-                            return rowData["is success"] === "True";
-                        },
-                        order: 1,
-                    },
-                    {
-                        label: "Failed",
-                        value: function (rowData, rowIdx) {
-                            return rowData["is success"] === "False";
-                        },
-                        order: 2,
-                    },
-                    {
-                        label: "Not done",
-                        value: function (rowData, rowIdx) {
-                            return rowData["is success"] === "None";
-                        },
-                        order: 3,
-                    },
-                ],
             },
             targets: [5],
         },
@@ -226,33 +255,18 @@ var table = $("#custom-dt").DataTable({
             data: null,
             defaultContent: ""
         },
-        {data: "infinitive"},
+        {data: "infinitive", render: DataTable.render.text()},
         {
             data: "simple past",
-            render: function (data, type, row, meta) {
-                if (type === "pdf") {
-                    return data
-                }
-                return data.split(",").join("</br>");
-            }
+            render: renderForms,
         },
         {
             data: "past participle",
-            render: function (data, type, row, meta) {
-                if (type === "pdf") {
-                    return data
-                }
-                return data.split(",").join("</br>");
-            }
+            render: renderForms,
         },
         {
             data: "translation",
-            render: function (data, type, row, meta) {
-                if (type === "pdf") {
-                    return data
-                }
-                return data.split(",").join("</br>");
-            }
+            render: renderForms,
         },
         {
             data: "is success",
@@ -260,14 +274,31 @@ var table = $("#custom-dt").DataTable({
             orderable: false,
         },
         {
+            // info and examples are only sent by the server when exporting
             data: "info",
             visible: false,
             orderable: false,
+            defaultContent: "",
+            render: function (data, type, row, meta) {
+                return data ? formatInfo(data) : "";
+            },
         },
         {
             data: "examples",
             visible: false,
             orderable: false,
+            defaultContent: "",
+            render: function (data, type, row, meta) {
+                if (!data) {
+                    return "";
+                }
+                if (type === "pdf") {
+                    return data.map(function (example) {
+                        return example.english + "\n" + example.translation;
+                    }).join("\n\n");
+                }
+                return formatExamples(data);
+            },
         },
     ],
     order: [],
@@ -284,9 +315,20 @@ table.on("click", "tbody td.dt-control", function () {
         tr.removeClass("shown");
     }
     else {
-        // Open this row
-        row.child(format(row.data())).show();  // add child row on click
-        tr.addClass("shown");
+        // Open this row, info and examples are fetched on first opening
+        let showDetails = function (details) {
+            row.child(format(details)).show();  // add child row on click
+            tr.addClass("shown");
+        };
+        if (row.data().details) {
+            showDetails(row.data().details);
+        } else {
+            let url = dtElement.data("details-url").replace("/0/", "/" + row.data().DT_RowData.id + "/");
+            $.getJSON(url, function (details) {
+                row.data().details = details;
+                showDetails(details);
+            });
+        }
     }
 });
 
@@ -298,13 +340,21 @@ if (isAuthenticated === "false") {
     })
 }
 
-// Add event listener to expand row when enter key is pressed
-$(".dt-control").on("keypress", function(event){
+// Add event listener to expand row when enter key is pressed, rows are
+// drawn on each page change so the listener is delegated to the table
+table.on("keypress", "tbody td.dt-control", function(event){
     if(event.keyCode == 13) {
         $(this).click();
     }
 });
 
+// Make the control cell of each drawn row focusable
+table.on("draw", function () {
+    dtElement.find("tbody td.dt-control")
+        .attr("tabindex", "0")
+        .attr("aria-label", "Open/close child row");
+});
+
 // Toggle the active class on the button when clicked
 $("#filter").on('click', function() {
     $(this).toggleClass('active');
@@ -26,6 +26,10 @@ window.addEventListener("load", function() {
                             model_name: element.dataset.modelName,
                             field_name: element.dataset.fieldName,
                         };
+                        // Next pages start after the last result of the previous one
+                        if (params.page > 1) {
+                            data.after = element.dataset.lastResult
+                        }
                         // Add all previous elements value to URL data; uses element id as key
                         $.each(selectElements, function(j, element) {
                             prev = selectElements[i - (j + 1)]
@@ -40,6 +44,12 @@ window.addEventListener("load", function() {
                         // }
                         return data;
                     },
+                    processResults: (data) => {
+                        if (data.results.length) {
+                            element.dataset.lastResult = data.results[data.results.length - 1].id
+                        }
+                        return data;
+                    },
                 },
                 // Adds a placeholder if the value on which this select depends has not been chosen
                 templateSelection: function (data) {
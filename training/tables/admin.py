@@ -6,20 +6,25 @@ from django.contrib.admin.widgets import (
     FilteredSelectMultiple,
     RelatedFieldWidgetWrapper,
 )
+from django.core.paginator import Paginator
 from django.db.models import Q
 from django.db.models.fields.related import ForeignKey
 from django.db.models.query import QuerySet
 from django.http import HttpRequest
+from django.urls import reverse
 
 from training.common.admin.mixins import GetReadOnlyFieldsMixin
 from training.profiles.models import Profile
+from training.tables.forms import TableVerbsFormMixin
 from training.tables.models import DefaultTable, Table, UserTable
+from training.tables.search import KeysetPaginator, get_table_search
 from training.verbs.models import Verb
 
 
-class TableAdminFormMixin:
+class TableAdminFormMixin(TableVerbsFormMixin):
     """
-    Mixin to set initial verbs in tables change form.
+    Mixin to set initial verbs in tables change form, they are saved
+    with Table.set_verbs().
     """
 
     def __init__(self, *args, **kwargs):
@@ -206,34 +211,44 @@ class TableAdmin(admin.ModelAdmin):
     class Media:
         js = ("js/disableOwner.js",)
 
+    def is_autocomplete(self, request: HttpRequest) -> bool:
+        return request.path == reverse(f"{self.admin_site.name}:autocomplete")
+
     def get_search_results(
         self, request: HttpRequest, queryset: QuerySet[Any], search_term: str
     ) -> tuple[QuerySet[Any], bool]:
-        queryset, may_have_duplicates = super().get_search_results(
-            request,
-            queryset,
-            search_term,
-        )
+        # Default search for the admin list view search bar
+        if not self.is_autocomplete(request):
+            return super().get_search_results(request, queryset, search_term)
+
         profile_id = request.GET.get("id_profile", None)
 
         # Returns an empty list to avoid obtaining a result
         # if the profile has not been selected
-        if not profile_id and request.get_full_path() != "/admin/tables/table/":
-            return Table.objects.none(), may_have_duplicates
-
-        # Return all tables to display on Table admin panel
-        if request.get_full_path() == "/admin/tables/table/":
-            return (
-                Table.objects.all().select_related("owner__user").order_by("type"),
-                may_have_duplicates,
-            )
-
-        queryset = (
-            queryset.filter(Q(owner=profile_id) | Q(type=Table.DEFAULT_TABLE))
-            .filter(name__icontains=search_term)
-            .order_by("type")
+        if not profile_id:
+            return queryset.none(), False
+
+        queryset = queryset.filter(Q(owner=profile_id) | Q(type=Table.DEFAULT_TABLE))
+        table_search = get_table_search(queryset.db)
+        # "after" is the last table of the previous page, see KeysetPaginator
+        queryset = table_search.search(
+            queryset, search_term, after=request.GET.get("after", None)
+        )
+        return queryset, False
+
+    def get_paginator(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[Any],
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+    ) -> Paginator:
+        if self.is_autocomplete(request):
+            return KeysetPaginator(queryset, per_page, orphans, allow_empty_first_page)
+        return super().get_paginator(
+            request, queryset, per_page, orphans, allow_empty_first_page
         )
-        return queryset, may_have_duplicates
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[UserTable]:
         queryset = super().get_queryset(request)
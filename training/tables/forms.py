@@ -11,7 +11,21 @@ from training.tables.models import DefaultTable, Table, UserTable
 from training.verbs.models import Verb
 
 
-class TableForm(forms.ModelForm):
+class TableVerbsFormMixin:
+    """Save the verbs of the table with Table.set_verbs()."""
+
+    def _save_m2m(self):
+        verbs = self.cleaned_data.pop("verbs", None)
+        try:
+            super()._save_m2m()
+        finally:
+            if verbs is not None:
+                self.cleaned_data["verbs"] = verbs
+        if verbs is not None:
+            self.instance.set_verbs(verbs.values_list("pk", flat=True))
+
+
+class TableForm(TableVerbsFormMixin, forms.ModelForm):
     """Base Table model form."""
 
     name = forms.CharField(
@@ -75,7 +89,7 @@ class DefaultTableForm(TableForm):
     def clean_name(self):
         name = self.cleaned_data.get("name")
         if (
-            self.Meta.model.objects.filter(name=name)
+            self.Meta.model.objects.filter(name__lower_exact=name)
             .exclude(id=self.instance.id)
             .exists()
         ):
@@ -103,7 +117,7 @@ class UserTableForm(TableForm):
         name = self.cleaned_data.get("name")
         if (
             self.Meta.model.objects.filter(
-                name__iexact=name,
+                name__lower_exact=name,
                 owner=self.instance.owner,
             )
             .exclude(id=self.instance.id)
@@ -0,0 +1,78 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from training.tables.models import DefaultTable
+from training.verbs.catalog import bump_catalog_version, catalog
+from training.verbs.models import Verb
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare ORDER BY RANDOM() with the catalog sampler used by the "
+        "training views on tables of growing size. Everything is written "
+        "in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=lambda value: [int(size) for size in value.split(",")],
+            default=[100, 1000, 5000, 20_000],
+            help="Comma separated numbers of verbs per table.",
+        )
+        parser.add_argument("--number", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def seed(self, size):
+        verbs = Verb.objects.bulk_create(
+            Verb(
+                infinitive=f"verb {i}",
+                simple_past=f"simple past {i}",
+                past_participle=f"past participle {i}",
+                translation=f"translation {i}",
+            )
+            for i in range(size)
+        )
+        table = DefaultTable.objects.create(name=f"benchmark {size}")
+        Through = DefaultTable.verbs.through
+        Through.objects.bulk_create(
+            (Through(table_id=table.id, verb_id=verb.id) for verb in verbs),
+            batch_size=5000,
+        )
+        return table
+
+    def measure(self, function, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def handle(self, *args, sizes, number, repeat, **options):
+        self.stdout.write(f"Sample of {number} verbs, median of {repeat} runs")
+        with transaction.atomic():
+            for size in sizes:
+                table = self.seed(size)
+                catalog.clear()
+                catalog.get_table_verb_ids(table.id)
+
+                def order_by_random():
+                    verb_ids = table.verbs.order_by("?").values_list("id", flat=True)
+                    return list(Verb.objects.filter(id__in=list(verb_ids[:number])))
+
+                def sampler():
+                    return catalog.sample_table_verbs(table.id, number)
+
+                random_ms = self.measure(order_by_random, repeat)
+                sampler_ms = self.measure(sampler, repeat)
+                self.stdout.write(
+                    f"{size} verbs: order_by('?') {random_ms:.2f} ms, "
+                    f"sampler {sampler_ms:.2f} ms"
+                )
+            transaction.set_rollback(True)
+        catalog.clear()
+        bump_catalog_version()
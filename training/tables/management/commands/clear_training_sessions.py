@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from training.tables.models import TrainingSession
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the expired training sessions. Can be run as a cron job "
+        "or directly to clean out old training results."
+    )
+
+    def handle(self, *args, **options):
+        count = TrainingSession.objects.clear_expired()
+        self.stdout.write(f"{count} expired training sessions deleted.")
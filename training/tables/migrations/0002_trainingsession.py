@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:01
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        ('tables', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrainingSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('verb_ids', models.JSONField()),
+                ('answers', models.JSONField()),
+                ('successes', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='training_sessions', to='profiles.profile')),
+                ('table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='training_sessions', to='tables.table')),
+            ],
+        ),
+    ]
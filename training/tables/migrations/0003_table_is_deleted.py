@@ -0,0 +1,37 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:11
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        ('tables', '0002_trainingsession'),
+        ('verbs', '0002_verb_is_deleted'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='table',
+            name='unique_default_table_name',
+        ),
+        migrations.RemoveConstraint(
+            model_name='table',
+            name='unique_table_name_per_profile',
+        ),
+        migrations.AddField(
+            model_name='table',
+            name='is_deleted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddConstraint(
+            model_name='table',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), condition=models.Q(('is_deleted', False), ('type', 'defaulttable')), name='unique_default_table_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='table',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), models.F('owner'), condition=models.Q(('is_deleted', False), ('type', 'usertable')), name='unique_table_name_per_profile'),
+        ),
+    ]
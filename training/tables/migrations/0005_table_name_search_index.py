@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:40
+
+import django.db.models.functions.text
+import training.common.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_time_ordered_ids'),
+        ('tables', '0004_time_ordered_ids'),
+        ('verbs', '0002_verb_is_deleted'),
+    ]
+
+    operations = [
+        # pg_trgm on PostgreSQL, nothing on other databases.
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='table',
+            index=training.common.indexes.TrigramIndex(django.db.models.functions.text.Lower('name'), name='table_name_trgm_idx'),
+        ),
+    ]
@@ -1,16 +1,60 @@
 import uuid
+from datetime import timedelta
 
-from django.db import models
-from django.db.models import Q
+from django.apps import apps
+from django.conf import settings
+from django.db import models, router, transaction
+from django.db.models import Count, F, FilteredRelation, Q
 from django.db.models.constraints import UniqueConstraint
-from django.db.models.functions import Lower
+from django.db.models.functions import Coalesce, Lower
+from django.db.models.signals import m2m_changed
+from django.utils import timezone
 from django.utils.text import slugify
 
+from training.common.ids import uuid7
+from training.common.indexes import TrigramIndex
+from training.deletions.models import DeferredDeletionMixin
 from training.profiles.models import Profile
+from training.verbs.catalog import catalog
 from training.verbs.models import Verb
 
 
-class Table(models.Model):
+class TableManager(models.Manager):
+    def get_queryset(self):
+        # Tables waiting for their deferred deletion are hidden.
+        return super().get_queryset().filter(is_deleted=False)
+
+    def with_progress(self, profile):
+        """
+        Annotate each table with the number of verbs the profile has
+        succeeded (success_count), failed (failed_count) and not done
+        yet (not_done_count).
+
+        Counts are read from the profile's TableProgress summary, tables
+        without a summary have all their verbs not done. Verbs waiting for
+        their deletion are not counted, like in TableProgress.
+        """
+        return (
+            self.get_queryset()
+            .annotate(
+                profile_progress=FilteredRelation(
+                    "progress",
+                    condition=Q(progress__owner=profile),
+                ),
+            )
+            .annotate(
+                verbs_count=Count("verbs", filter=Q(verbs__is_deleted=False)),
+                success_count=Coalesce("profile_progress__success_count", 0),
+                failed_count=Coalesce("profile_progress__failed_count", 0),
+                not_done_count=Coalesce(
+                    "profile_progress__not_done_count", F("verbs_count")
+                ),
+                last_trained_at=F("profile_progress__last_trained_at"),
+            )
+        )
+
+
+class Table(DeferredDeletionMixin, models.Model):
     DEFAULT_TABLE = "defaulttable"
     USER_TABLE = "usertable"
 
@@ -22,7 +66,7 @@ class Table(models.Model):
         primary_key=True,
         unique=True,
         editable=False,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     type = models.CharField(
         max_length=12,
@@ -45,6 +89,9 @@ class Table(models.Model):
     is_available = models.BooleanField(
         default=True,
     )
+    is_deleted = models.BooleanField(
+        default=False,
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -52,44 +99,129 @@ class Table(models.Model):
         auto_now=True,
     )
 
+    objects = TableManager()
+
     class Meta:
         constraints = [
             UniqueConstraint(
                 Lower("name"),
                 condition=Q(
                     type="defaulttable",
+                    is_deleted=False,
                 ),
                 name=("unique_default_table_name"),
             ),
             UniqueConstraint(
                 Lower("name"),
                 "owner",
-                condition=Q(type="usertable"),
+                condition=Q(type="usertable", is_deleted=False),
                 name=("unique_table_name_per_profile"),
             ),
         ]
+        indexes = [
+            # Table search, see training.tables.search.
+            TrigramIndex(Lower("name"), name="table_name_trgm_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         self.slug_name = slugify(self.name)
         return super().save(*args, **kwargs)
 
+    def hide(self):
+        self.is_deleted = True
+        self.save(update_fields=["is_deleted", "updated_at"])
+
+    def get_deletion_querysets(self):
+        Result = apps.get_model("results.Result")
+        TableProgress = apps.get_model("results.TableProgress")
+        return [
+            Result.objects.filter(table=self),
+            TableProgress.objects.filter(table=self),
+            TrainingSession.objects.filter(table=self),
+            Table.verbs.through.objects.filter(table=self),
+        ]
+
+    def set_verbs(self, verbs):
+        """
+        Replace the verbs of the table by verbs (Verb instances or ids).
+
+        Unlike verbs.set(), the added and removed ids are computed from
+        a single query and the through rows are written with one bulk
+        insert and one delete. m2m_changed is sent like remove() and
+        add() do, with set_verbs=True, the results of the removed verbs
+        are deleted after commit (see training.results.signals). The
+        progress summaries of the table are refreshed once, not on each
+        signal. Return the added and removed verb ids.
+        """
+        through = Table.verbs.through
+        verb_ids = {getattr(verb, "pk", verb) for verb in verbs}
+        using = router.db_for_write(through, instance=self)
+
+        def send(action, pk_set):
+            m2m_changed.send(
+                sender=through,
+                instance=self,
+                action=action,
+                reverse=False,
+                model=Verb,
+                pk_set=pk_set,
+                using=using,
+                set_verbs=True,
+            )
+
+        # Like verbs.set(), the rows and the m2m_changed receivers' writes
+        # are committed together.
+        with transaction.atomic(using=using, savepoint=False):
+            current_ids = set(
+                through.objects.using(using)
+                .filter(table=self)
+                .values_list("verb_id", flat=True)
+            )
+            added_ids = verb_ids - current_ids
+            removed_ids = current_ids - verb_ids
+            if removed_ids:
+                send("pre_remove", removed_ids)
+                through.objects.using(using).filter(
+                    table=self, verb_id__in=removed_ids
+                ).delete()
+                send("post_remove", removed_ids)
+            if added_ids:
+                send("pre_add", added_ids)
+                through.objects.using(using).bulk_create(
+                    [
+                        through(table_id=self.pk, verb_id=verb_id)
+                        for verb_id in added_ids
+                    ]
+                )
+                send("post_add", added_ids)
+            if added_ids or removed_ids:
+                TableProgress = apps.get_model("results.TableProgress")
+                TableProgress.objects.refresh_table(self)
+        if added_ids or removed_ids:
+            # Like verbs.set(), drop the verbs prefetched on the instance.
+            getattr(self, "_prefetched_objects_cache", {}).pop("verbs", None)
+        return added_ids, removed_ids
+
+    def get_verbs_with_status(self, user):
+        """
+        Return the verbs of the table with the is_success attribute of
+        the user's results.
+        """
+        if self.owner_id is not None and user.profile.id != self.owner_id:
+            raise PermissionError("This user does not have access to this table.")
+        Result = apps.get_model("results.Result")
+        status_map = Result.objects.status_map(user.profile, table=self)
+        return catalog.with_status(catalog.get_table_verbs(self.id), status_map)
+
     def _get_verbs(self, *, is_success, user):
         """Return a list of verbs filtered by the is_success attribute."""
-        try:
-            # On the views the verbs queryset is
-            # annotated with the is_success attribute.
-            return [verb for verb in self.verbs.all() if verb.is_success is is_success]
-        except AttributeError:
-            if user is None:
-                raise TypeError(f"'user' must be a User instance not {type(user)}")
-            return [
-                verb
-                for verb in self.verbs.with_results(user=user, table=self)
-                if verb.is_success is is_success
-            ]
-
-    def _get_count(self, *, is_success, user):
-        return self.verbs.filter(is_success=is_success).count()
+        if user is None:
+            raise TypeError(f"'user' must be a User instance not {type(user)}")
+        return [
+            verb
+            for verb in self.get_verbs_with_status(user)
+            if verb.is_success is is_success
+        ]
 
     def get_verbs_success_count(self, user=None):
         return len(self._get_verbs(is_success=True, user=user))
@@ -121,12 +253,12 @@ class Table(models.Model):
         return f"{self.name}"
 
 
-class DefaultTableManager(models.Manager):
+class DefaultTableManager(TableManager):
     def get_queryset(self):
         return super().get_queryset().filter(type=self.model.DEFAULT_TABLE)
 
 
-class UserTableManager(models.Manager):
+class UserTableManager(TableManager):
     def get_queryset(self):
         return super().get_queryset().filter(type=self.model.USER_TABLE)
 
@@ -152,3 +284,90 @@ class UserTable(Table):
     def save(self, *args, **kwargs):
         self.type = self.USER_TABLE
         return super().save(*args, **kwargs)
+
+
+class TrainingSessionManager(models.Manager):
+    def active(self):
+        return self.filter(expires_at__gt=timezone.now())
+
+    def clear_expired(self):
+        """Delete the expired training sessions, return their number."""
+        return self.filter(expires_at__lte=timezone.now()).delete()[0]
+
+
+class TrainingSession(models.Model):
+    """
+    A graded training, displayed by the results page until it expires.
+
+    For each sampled verb, in the training order, verb_ids holds its id,
+    answers the [infinitive, simple past, past participle] answers and
+    successes whether each of them was correct.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        unique=True,
+        editable=False,
+        default=uuid.uuid4,
+    )
+    owner = models.ForeignKey(
+        to=Profile,
+        on_delete=models.CASCADE,
+        related_name="training_sessions",
+    )
+    table = models.ForeignKey(
+        to=Table,
+        on_delete=models.CASCADE,
+        related_name="training_sessions",
+    )
+    verb_ids = models.JSONField()
+    answers = models.JSONField()
+    successes = models.JSONField()
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+    expires_at = models.DateTimeField(
+        db_index=True,
+    )
+
+    objects = TrainingSessionManager()
+
+    def save(self, *args, **kwargs):
+        if self.expires_at is None:
+            self.expires_at = timezone.now() + timedelta(
+                seconds=settings.TRAINING_SESSION_AGE
+            )
+        return super().save(*args, **kwargs)
+
+    def get_verbs_data(self):
+        """
+        Return a dict for each graded verb with the answers, the correct
+        forms and the success of each form, skipping deleted verbs.
+        """
+        verbs = {verb.id: verb for verb in catalog.get_verbs(self.verb_ids)}
+        verbs_data = []
+        for verb_id, answers, successes in zip(
+            self.verb_ids, self.answers, self.successes
+        ):
+            verb = verbs.get(verb_id)
+            if verb is None:
+                continue
+            infinitive, simple_past, past_participle = answers
+            data = {
+                "infinitive": infinitive,
+                "simple_past": simple_past,
+                "past_participle": past_participle,
+                "correct_infinitive": verb.infinitive,
+                "correct_simple_past": verb.simple_past,
+                "correct_past_participle": verb.past_participle,
+                "translation": verb.translation,
+                "infinitive_is_success": successes[0],
+                "simple_past_is_success": successes[1],
+                "past_participle_is_success": successes[2],
+            }
+            data["is_success"] = all(successes)
+            verbs_data.append(data)
+        return verbs_data
+
+    def __str__(self):
+        return f"Training of {self.owner} on {self.table}"
@@ -0,0 +1,134 @@
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator
+from django.db import connections
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.functions import Lower
+
+
+class TableSearch:
+    """
+    Search of the tables by name, case insensitive, served by the
+    table_name_trgm_idx index (see training.common.indexes.TrigramIndex).
+
+    Tables whose name starts with the term are ordered by name. Results
+    are paginated by keyset: the next page is read after a table of the
+    previous one, not with an offset.
+
+    SQLite's LOWER() only folds ASCII letters, the term is folded the same
+    way: "École" is found with "ÉCO" but not with "éco".
+    """
+
+    ordering = ("lower_name", "id")
+
+    def normalize(self, term):
+        """Return term lowercased as LOWER() does."""
+        return "".join(char.lower() if char.isascii() else char for char in term)
+
+    def annotate(self, queryset, term):
+        return queryset.annotate(lower_name=Lower("name"))
+
+    def filter(self, queryset, term):
+        if not term:
+            return queryset
+        # Range of the names starting with term, LIKE cannot use the
+        # index on SQLite.
+        upper = term[:-1] + chr(ord(term[-1]) + 1)
+        return queryset.filter(lower_name__gte=term, lower_name__lt=upper)
+
+    def search(self, queryset, term, after=None):
+        """
+        Return the tables of queryset matching term ordered by relevance,
+        those following the table of id 'after' if provided.
+        """
+        term = self.normalize(term.strip())
+        queryset = self.filter(self.annotate(queryset, term), term).order_by(
+            *self.ordering
+        )
+        if after:
+            queryset = self.after(queryset, after)
+        return queryset
+
+    def after(self, queryset, pk):
+        """Return the tables of the ordered queryset following the table pk."""
+        fields = [field.lstrip("-") for field in self.ordering]
+        try:
+            key = queryset.filter(pk=pk).values(*fields).first()
+        except ValidationError:
+            key = None
+        if key is None:
+            return queryset.none()
+        # (a, b, c) > (x, y, z): a > x or (a = x and b > y) or ...
+        conditions = []
+        for i, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal = {previous: key[previous] for previous in fields[:i]}
+            conditions.append(Q(**equal, **{f"{name}__{lookup}": key[name]}))
+        # Redundant bound of the first field, for the index range scan.
+        first = self.ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return queryset.filter(
+            Q(**{f"{fields[0]}__{bound}": key[fields[0]]}),
+            reduce(or_, conditions),
+        )
+
+
+class PostgresTableSearch(TableSearch):
+    """
+    Tables whose name contains the term, served by the GIN trigram
+    index. Names starting with the term come first, then by trigram
+    similarity with the term.
+    """
+
+    ordering = ("-rank", "lower_name", "id")
+
+    def normalize(self, term):
+        return term.lower()
+
+    def annotate(self, queryset, term):
+        queryset = super().annotate(queryset, term)
+        if not term:
+            return queryset.annotate(rank=Value(0.0, output_field=FloatField()))
+        return queryset.annotate(
+            rank=Case(
+                When(lower_name__startswith=term, then=Value(1.0)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+            + TrigramSimilarity("lower_name", term)
+        )
+
+    def filter(self, queryset, term):
+        if not term:
+            return queryset
+        return queryset.filter(lower_name__contains=term)
+
+
+def get_table_search(using="default"):
+    """Return the table search of the database."""
+    if connections[using].vendor == "postgresql":
+        return PostgresTableSearch()
+    return TableSearch()
+
+
+class KeysetPage(Page):
+    def has_next(self):
+        return self.more
+
+
+class KeysetPaginator(Paginator):
+    """
+    Paginator of a TableSearch.search() queryset, already starting after
+    the previous page. Every page is read as the first one, without
+    COUNT or OFFSET, one more table tells if there is a next page.
+    """
+
+    def page(self, number):
+        objects = list(self.object_list[: self.per_page + 1])
+        page = KeysetPage(objects[: self.per_page], number, self)
+        page.more = len(objects) > self.per_page
+        return page
@@ -0,0 +1,25 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from training.tables.models import TrainingSession
+from training.tables.tests.test_models import BaseTestCase
+
+
+class TestClearTrainingSessionsCommand(BaseTestCase):
+    def test_clear_training_sessions(self):
+        for expires_at in (timezone.now(), None):
+            TrainingSession.objects.create(
+                owner=self.user1.profile,
+                table=self.default_table,
+                verb_ids=[],
+                answers=[],
+                successes=[],
+                expires_at=expires_at,
+            )
+        out = StringIO()
+        call_command("clear_training_sessions", stdout=out)
+
+        self.assertEqual(out.getvalue(), "1 expired training sessions deleted.\n")
+        self.assertEqual(TrainingSession.objects.count(), 1)
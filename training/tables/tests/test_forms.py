@@ -0,0 +1,48 @@
+from training.common.testcase.mixins import QueryPlanMixin
+from training.tables.forms import DefaultTableForm, UserTableForm
+from training.tables.models import DefaultTable, UserTable
+from training.tables.tests.test_models import BaseTestCase
+
+
+class TestTableNameValidation(QueryPlanMixin, BaseTestCase):
+    def test_user_table_name_case_insensitive(self):
+        form = UserTableForm(
+            data={"name": "TABLE", "verbs": [self.verb1.id]},
+            owner=self.user1.profile,
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["name"], ["You already have a Table with this Name."]
+        )
+
+    def test_user_table_name_of_another_user(self):
+        form = UserTableForm(
+            data={"name": "TABLE", "verbs": [self.verb1.id]},
+            owner=self.user2.profile,
+        )
+        form.is_valid()
+
+        self.assertNotIn("name", form.errors)
+
+    def test_default_table_name_case_insensitive(self):
+        form = DefaultTableForm(data={"name": "Default", "verbs": [self.verb1.id]})
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["name"], ["A default table with this Name already exists."]
+        )
+
+    def test_user_table_name_query_uses_index(self):
+        self.assertIndexScan(
+            UserTable.objects.filter(
+                name__lower_exact="TABLE", owner=self.user1.profile
+            ),
+            "unique_table_name_per_profile",
+        )
+
+    def test_default_table_name_query_uses_index(self):
+        self.assertIndexScan(
+            DefaultTable.objects.filter(name__lower_exact="Default"),
+            "unique_default_table_name",
+        )
@@ -0,0 +1,206 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from training.results.models import Result
+from training.tables.models import DefaultTable, Table, TrainingSession, UserTable
+from training.verbs.models import Verb
+
+
+User = get_user_model()
+
+
+class BaseTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@email.com",
+            password="password",
+        )
+        cls.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@email.com",
+            password="password",
+        )
+
+        cls.verb1 = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.verb2 = Verb.objects.create(
+            infinitive="become",
+            simple_past="became",
+            past_participle="become",
+            translation="devenir",
+        )
+        cls.verb3 = Verb.objects.create(
+            infinitive="cut",
+            simple_past="cut",
+            past_participle="cut",
+            translation="couper",
+        )
+
+        cls.default_table = DefaultTable.objects.create(name="default")
+        cls.default_table.verbs.add(*[cls.verb1, cls.verb2, cls.verb3])
+
+        cls.user_table = UserTable.objects.create(
+            name="table",
+            owner=cls.user1.profile,
+        )
+        cls.user_table.verbs.add(*[cls.verb1, cls.verb2])
+
+        Result.objects.create(
+            owner=cls.user1.profile,
+            table=cls.default_table,
+            verb=cls.verb1,
+            is_success=True,
+        )
+        Result.objects.create(
+            owner=cls.user1.profile,
+            table=cls.default_table,
+            verb=cls.verb2,
+            is_success=False,
+        )
+        # Same verb in another table must not be counted for the
+        # default table.
+        Result.objects.create(
+            owner=cls.user1.profile,
+            table=cls.user_table,
+            verb=cls.verb1,
+            is_success=False,
+        )
+        # Another user's results must not be counted.
+        Result.objects.create(
+            owner=cls.user2.profile,
+            table=cls.default_table,
+            verb=cls.verb3,
+            is_success=True,
+        )
+
+
+class TestTableManagerWithProgress(BaseTestCase):
+    def test_counts(self):
+        tables = {
+            table.id: table
+            for table in Table.objects.with_progress(self.user1.profile)
+        }
+
+        default_table = tables[self.default_table.id]
+        self.assertEqual(default_table.verbs_count, 3)
+        self.assertEqual(default_table.success_count, 1)
+        self.assertEqual(default_table.failed_count, 1)
+        self.assertEqual(default_table.not_done_count, 1)
+
+        user_table = tables[self.user_table.id]
+        self.assertEqual(user_table.verbs_count, 2)
+        self.assertEqual(user_table.success_count, 0)
+        self.assertEqual(user_table.failed_count, 1)
+        self.assertEqual(user_table.not_done_count, 1)
+
+    def test_counts_without_summary_hidden_verb(self):
+        table = Table.objects.create(name="hidden", owner=self.user1.profile)
+        table.verbs.add(self.verb1, self.verb2)
+        self.verb2.delete_later()
+
+        table = Table.objects.with_progress(self.user1.profile).get(id=table.id)
+        self.assertEqual(table.verbs_count, 1)
+        self.assertEqual(table.not_done_count, 1)
+
+    def test_counts_other_profile(self):
+        table = Table.objects.with_progress(self.user2.profile).get(
+            id=self.default_table.id
+        )
+        self.assertEqual(table.success_count, 1)
+        self.assertEqual(table.failed_count, 0)
+        self.assertEqual(table.not_done_count, 2)
+
+    def test_proxy_managers(self):
+        table = DefaultTable.objects.with_progress(self.user1.profile).get()
+        self.assertEqual(table.success_count, 1)
+
+    def test_single_query(self):
+        with self.assertNumQueries(1):
+            list(Table.objects.with_progress(self.user1.profile))
+
+
+class TestTableModel(BaseTestCase):
+    def test_get_verbs_with_status(self):
+        verbs = self.default_table.get_verbs_with_status(self.user1)
+        self.assertEqual(
+            [(verb, verb.is_success) for verb in verbs],
+            [(self.verb2, False), (self.verb1, True), (self.verb3, None)],
+        )
+
+    def test_get_verbs_with_status_not_owner(self):
+        with self.assertRaisesMessage(
+            PermissionError, "This user does not have access to this table."
+        ):
+            self.user_table.get_verbs_with_status(self.user2)
+
+    def test_get_verbs_counts(self):
+        self.assertEqual(self.default_table.get_verbs_success_count(self.user1), 1)
+        self.assertEqual(self.default_table.get_verbs_unsuccess_count(self.user1), 1)
+        self.assertEqual(self.default_table.get_verbs_not_done_count(self.user1), 1)
+
+    def test_get_verbs_counts_missing_user(self):
+        with self.assertRaises(TypeError):
+            self.default_table.get_verbs_success_count()
+
+
+class TestTrainingSessionModel(BaseTestCase):
+    def create_training_session(self, **kwargs):
+        return TrainingSession.objects.create(
+            owner=self.user1.profile,
+            table=self.default_table,
+            verb_ids=[self.verb1.id, self.verb3.id],
+            answers=[["begin", "began", "begin"], ["cut", "cut", "cut"]],
+            successes=[[True, True, False], [True, True, True]],
+            **kwargs,
+        )
+
+    def test_expires_at_default(self):
+        training_session = self.create_training_session()
+        self.assertAlmostEqual(
+            training_session.expires_at,
+            timezone.now() + timedelta(seconds=settings.TRAINING_SESSION_AGE),
+            delta=timedelta(seconds=5),
+        )
+
+    def test_active(self):
+        active = self.create_training_session()
+        self.create_training_session(expires_at=timezone.now())
+        self.assertQuerySetEqual(TrainingSession.objects.active(), [active])
+
+    def test_clear_expired(self):
+        active = self.create_training_session()
+        self.create_training_session(expires_at=timezone.now())
+        self.assertEqual(TrainingSession.objects.clear_expired(), 1)
+        self.assertQuerySetEqual(TrainingSession.objects.all(), [active])
+
+    def test_get_verbs_data(self):
+        training_session = self.create_training_session()
+        self.verb3.delete()
+        self.assertEqual(
+            training_session.get_verbs_data(),
+            [
+                {
+                    "infinitive": "begin",
+                    "simple_past": "began",
+                    "past_participle": "begin",
+                    "correct_infinitive": "begin",
+                    "correct_simple_past": "began",
+                    "correct_past_participle": "begun",
+                    "translation": "commencer",
+                    "infinitive_is_success": True,
+                    "simple_past_is_success": True,
+                    "past_participle_is_success": False,
+                    "is_success": False,
+                }
+            ],
+        )
@@ -0,0 +1,207 @@
+import re
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models import QuerySet
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from training.common.testcase.mixins import QueryPlanMixin
+from training.tables.models import DefaultTable, Table, UserTable
+from training.tables.search import PostgresTableSearch, get_table_search
+
+
+User = get_user_model()
+
+
+class TestTableSearch(QueryPlanMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user",
+            email="user@email.com",
+            password="password",
+        )
+        cls.other_user = User.objects.create_user(
+            username="other",
+            email="other@email.com",
+            password="password",
+        )
+        cls.admin = User.objects.create_superuser(
+            username="admin",
+            email="admin@email.com",
+            password="password",
+        )
+        for name in ["Travel", "travel 2", "Irregular", "Trains"]:
+            UserTable.objects.create(name=name, owner=cls.user.profile)
+        UserTable.objects.create(name="Travel 3", owner=cls.other_user.profile)
+        DefaultTable.objects.create(name="Top 100")
+        cls.search = get_table_search()
+
+    def get_names(self, queryset):
+        return [table.name for table in queryset]
+
+    def test_search(self):
+        tables = self.search.search(Table.objects.all(), " TRA")
+
+        self.assertEqual(
+            self.get_names(tables), ["Trains", "Travel", "travel 2", "Travel 3"]
+        )
+
+    def test_search_non_ascii(self):
+        UserTable.objects.create(name="École", owner=self.user.profile)
+        tables = self.search.search(Table.objects.all(), "ÉCO")
+
+        self.assertEqual(self.get_names(tables), ["École"])
+        # Not folded by SQLite's LOWER().
+        self.assertFalse(self.search.search(Table.objects.all(), "éco").exists())
+
+    def test_search_empty_term(self):
+        tables = self.search.search(Table.objects.all(), "")
+
+        self.assertEqual(len(tables), 6)
+
+    def test_search_after(self):
+        queryset = Table.objects.all()
+        first_page = list(self.search.search(queryset, "t")[:2])
+        second_page = self.search.search(queryset, "t", after=first_page[-1].pk)
+
+        self.assertEqual(self.get_names(first_page), ["Top 100", "Trains"])
+        self.assertEqual(
+            self.get_names(second_page), ["Travel", "travel 2", "Travel 3"]
+        )
+
+    def test_search_after_unknown_table(self):
+        self.assertFalse(
+            self.search.search(Table.objects.all(), "t", after="unknown").exists()
+        )
+
+    def test_search_uses_index(self):
+        table = Table.objects.get(name="Travel")
+        self.assertIndexScan(
+            self.search.search(Table.objects.all(), "tra", after=table.pk),
+            "table_name_trgm_idx",
+        )
+
+    def test_admin_autocomplete(self):
+        self.client.force_login(self.admin)
+        url = reverse("admin:autocomplete")
+        data = {
+            "term": "t",
+            "app_label": "results",
+            "model_name": "result",
+            "field_name": "table",
+            "id_profile": self.user.profile.pk,
+        }
+        response = self.client.get(url, data)
+        results = response.json()["results"]
+
+        self.assertEqual(
+            [result["text"] for result in results],
+            ["Top 100", "Trains", "Travel", "travel 2"],
+        )
+        self.assertFalse(response.json()["pagination"]["more"])
+
+    @patch.object(AutocompleteJsonView, "paginate_by", 3)
+    def test_admin_autocomplete_pages(self):
+        self.client.force_login(self.admin)
+        url = reverse("admin:autocomplete")
+        data = {
+            "term": "t",
+            "app_label": "results",
+            "model_name": "result",
+            "field_name": "table",
+            "id_profile": self.user.profile.pk,
+        }
+        # session, user and the page with one more table, no COUNT
+        with self.assertNumQueries(3):
+            first_page = self.client.get(url, data).json()
+        data.update(page=2, after=first_page["results"][-1]["id"])
+        second_page = self.client.get(url, data).json()
+
+        self.assertEqual(len(first_page["results"]), 3)
+        self.assertTrue(first_page["pagination"]["more"])
+        self.assertEqual(
+            [result["text"] for result in second_page["results"]], ["travel 2"]
+        )
+        self.assertFalse(second_page["pagination"]["more"])
+
+    def test_admin_autocomplete_without_profile(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "term": "t",
+                "app_label": "results",
+                "model_name": "result",
+                "field_name": "table",
+            },
+        )
+
+        self.assertEqual(response.json()["results"], [])
+
+    def test_admin_changelist_search(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse("admin:tables_table_changelist"), {"q": "travel"}
+        )
+
+        self.assertEqual(
+            sorted(self.get_names(response.context["cl"].result_list)),
+            ["Travel", "Travel 3", "travel 2"],
+        )
+
+
+@patch.object(connections["default"], "vendor", "postgresql")
+class TestPostgresTableSearch(SimpleTestCase):
+    """SQL of the PostgreSQL search, compiled without a PostgreSQL database."""
+
+    rank = (
+        """(CASE WHEN LOWER("tables_table"."name") LIKE tra% ESCAPE '\\' """
+        """THEN 1.0 ELSE 0.0 END """
+        """+ SIMILARITY(LOWER("tables_table"."name"), tra))"""
+    )
+
+    def test_get_table_search(self):
+        self.assertIsInstance(get_table_search(), PostgresTableSearch)
+
+    def test_search(self):
+        sql = str(get_table_search().search(Table.objects.all(), " Tra").query)
+
+        self.assertIn(f'{self.rank} AS "rank"', sql)
+        self.assertIn(
+            """LOWER("tables_table"."name") LIKE %tra% ESCAPE '\\'""", sql
+        )
+        # Rank first, then name and id.
+        self.assertRegex(sql, r'ORDER BY \d+ DESC, \d+ ASC, "tables_table"."id" ASC$')
+
+    def test_search_empty_term(self):
+        sql = str(get_table_search().search(Table.objects.all(), "").query)
+
+        self.assertIn('0.0 AS "rank"', sql)
+        self.assertNotIn("LIKE", sql)
+
+    def test_search_after(self):
+        pk = uuid4()
+        key = {"rank": 1.5, "lower_name": "travel", "id": pk}
+        with patch.object(QuerySet, "first", return_value=key):
+            queryset = get_table_search().search(Table.objects.all(), "tra", pk)
+        # The rank expressions, some with a parenthesized condition.
+        sql = re.sub(
+            r"\(CASE WHEN .+? END \+ SIMILARITY\(.+?, tra\)\)",
+            "rank",
+            str(queryset.query),
+        )
+        name = 'LOWER("tables_table"."name")'
+
+        # Following tables: lower rank, or same rank and following name, or
+        # same rank and name and following id, bounded by the rank.
+        self.assertIn(
+            f"rank <= 1.5 AND (rank < 1.5 OR ({name} > travel AND rank = 1.5) "
+            f'OR ("tables_table"."id" > {pk.hex} AND {name} = travel '
+            "AND rank = 1.5))",
+            sql,
+        )
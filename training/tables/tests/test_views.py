@@ -0,0 +1,342 @@
+import zlib
+from datetime import timedelta
+
+from django.core import signing
+from django.urls import reverse
+from django.utils import timezone
+
+from training.deletions.models import PendingDeletion
+from training.results.models import Result, TableProgress
+from training.tables.models import Table, TrainingSession, UserTable
+from training.tables.tests.test_models import BaseTestCase
+from training.tables.tokens import TRAINING_TOKEN_SALT
+from training.verbs.catalog import catalog
+from training.verbs.models import Verb
+
+
+class TrainingViewTestCase(BaseTestCase):
+    def setUp(self):
+        catalog.clear()
+        self.url = reverse(
+            "tables:default:training",
+            kwargs={
+                "pk": self.default_table.id,
+                "slug_name": self.default_table.slug_name,
+            },
+        )
+
+    def get_training(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.context["training_token"], response.context["form"]
+
+    def get_post_data(self, token, form, wrong=()):
+        """Answer every verb of the training, wrongly for those in 'wrong'."""
+        data = {
+            "training_token": token,
+            "form-TOTAL_FORMS": len(form.forms),
+            "form-INITIAL_FORMS": len(form.forms),
+        }
+        verbs = {
+            verb.translation: verb for verb in (self.verb1, self.verb2, self.verb3)
+        }
+        for i, subform in enumerate(form.forms):
+            verb = verbs[subform.initial["translation"]]
+            data[f"form-{i}-infinitive"] = verb.infinitive
+            data[f"form-{i}-simple_past"] = verb.simple_past
+            data[f"form-{i}-past_participle"] = (
+                "wrong" if verb in wrong else verb.past_participle
+            )
+        return data
+
+    def get_results_url(self, training_session):
+        return reverse(
+            "tables:default:results",
+            kwargs={
+                "pk": self.default_table.id,
+                "slug_name": self.default_table.slug_name,
+                "session_pk": training_session.id,
+            },
+        )
+
+
+class TestTrainingView(TrainingViewTestCase):
+    def test_get(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+
+        self.assertTrue(token)
+        self.assertEqual(len(form.forms), 3)
+
+    def test_token_does_not_hold_answers(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        data = signing.loads(token, salt=TRAINING_TOKEN_SALT)
+
+        self.assertEqual(set(data), {"u", "p", "t", "v"})
+        self.assertEqual(
+            sorted(data["v"]), sorted([self.verb1.id, self.verb2.id, self.verb3.id])
+        )
+        payload = signing.b64_decode(token.split(":")[0][1:].encode())
+        self.assertNotIn(self.verb1.past_participle.encode(), zlib.decompress(payload))
+
+    def test_post(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        response = self.client.post(
+            self.url, self.get_post_data(token, form, wrong=[self.verb1])
+        )
+
+        training_session = TrainingSession.objects.get()
+        self.assertRedirects(response, self.get_results_url(training_session))
+        self.assertEqual(training_session.owner, self.user1.profile)
+        self.assertEqual(len(training_session.verb_ids), 3)
+        results = Result.objects.filter(
+            owner=self.user1.profile, table=self.default_table
+        )
+        self.assertEqual(
+            dict(results.values_list("verb", "is_success")),
+            {self.verb1.id: False, self.verb2.id: True, self.verb3.id: True},
+        )
+        progress = TableProgress.objects.get(
+            owner=self.user1.profile, table=self.default_table
+        )
+        self.assertEqual(progress.success_count, 2)
+        self.assertEqual(progress.failed_count, 1)
+        self.assertEqual(progress.not_done_count, 0)
+        self.assertIsNotNone(progress.last_trained_at)
+
+    def test_post_no_verb_query(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        data = self.get_post_data(token, form)
+
+        # session and user, then in a savepoint: table not hidden,
+        # generation, existing results, insert of the new one, update of
+        # the changed one, progress update and training session insert.
+        with self.assertNumQueries(11):
+            self.client.post(self.url, data)
+
+    def test_post_same_answers_no_result_written(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        data = self.get_post_data(token, form)
+        self.client.post(self.url, data)
+        updated_at = dict(Result.objects.values_list("id", "updated_at"))
+
+        # session and user, then in a savepoint: table not hidden,
+        # generation, existing results, progress update and training
+        # session insert.
+        with self.assertNumQueries(9):
+            self.client.post(self.url, data)
+        self.assertEqual(
+            dict(Result.objects.values_list("id", "updated_at")), updated_at
+        )
+
+    def test_post_verb_removed_from_table(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        self.default_table.verbs.remove(self.verb3)
+        response = self.client.post(self.url, self.get_post_data(token, form))
+
+        self.assertRedirects(
+            response,
+            self.get_results_url(TrainingSession.objects.get()),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(
+            set(
+                Result.objects.filter(
+                    owner=self.user1.profile, table=self.default_table
+                ).values_list("verb", flat=True)
+            ),
+            {self.verb1.id, self.verb2.id},
+        )
+
+    def test_post_verb_deleted(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        data = self.get_post_data(token, form)
+        self.verb3.delete()
+        catalog.clear()
+        response = self.client.post(self.url, data)
+
+        self.assertRedirects(response, self.url)
+        self.assertFalse(TrainingSession.objects.exists())
+
+    def test_post_table_hidden(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        data = self.get_post_data(token, form)
+        self.default_table.delete_later()
+        results = list(Result.objects.values_list("id", "updated_at"))
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(TrainingSession.objects.exists())
+        self.assertEqual(
+            list(Result.objects.values_list("id", "updated_at")), results
+        )
+
+    def test_post_invalid_token(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        data = self.get_post_data(token[:-1], form)
+        response = self.client.post(self.url, data)
+
+        self.assertRedirects(response, self.url)
+        self.assertEqual(Result.objects.count(), 4)
+
+    def test_post_token_of_another_user(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        self.client.force_login(self.user2)
+        response = self.client.post(self.url, self.get_post_data(token, form))
+
+        self.assertRedirects(response, self.url)
+        self.assertEqual(Result.objects.count(), 4)
+
+    def test_post_token_of_another_table(self):
+        self.client.force_login(self.user1)
+        token, form = self.get_training()
+        url = reverse(
+            "tables:user:training",
+            kwargs={
+                "pk": self.user_table.id,
+                "slug_name": self.user_table.slug_name,
+            },
+        )
+        response = self.client.post(url, self.get_post_data(token, form))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestResultView(TrainingViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.training_session = TrainingSession.objects.create(
+            owner=self.user1.profile,
+            table=self.default_table,
+            verb_ids=[self.verb1.id, self.verb2.id],
+            answers=[["begin", "began", "begin"], ["become", "became", "become"]],
+            successes=[[True, True, False], [True, True, True]],
+        )
+        self.detail_url = reverse(
+            "tables:default:detail",
+            kwargs={
+                "pk": self.default_table.id,
+                "slug_name": self.default_table.slug_name,
+            },
+        )
+
+    def test_get(self):
+        self.client.force_login(self.user1)
+        response = self.client.get(self.get_results_url(self.training_session))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [data["is_success"] for data in response.context["verbs_data"]],
+            [False, True],
+        )
+        self.assertContains(response, "begun")
+
+    def test_get_twice(self):
+        self.client.force_login(self.user1)
+        self.client.get(self.get_results_url(self.training_session))
+        response = self.client.get(self.get_results_url(self.training_session))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_does_not_write_session(self):
+        self.client.force_login(self.user1)
+        self.client.get(self.get_results_url(self.training_session))
+        catalog.get_verbs()
+
+        # session, user and training session with its table
+        with self.assertNumQueries(3):
+            self.client.get(self.get_results_url(self.training_session))
+
+    def test_get_expired(self):
+        self.training_session.expires_at = timezone.now() - timedelta(seconds=1)
+        self.training_session.save()
+        self.client.force_login(self.user1)
+        response = self.client.get(self.get_results_url(self.training_session))
+
+        self.assertRedirects(response, self.detail_url)
+
+    def test_get_another_user(self):
+        self.client.force_login(self.user2)
+        response = self.client.get(self.get_results_url(self.training_session))
+
+        self.assertRedirects(response, self.detail_url)
+
+
+class TestUserTableDeleteView(BaseTestCase):
+    def setUp(self):
+        self.url = reverse(
+            "tables:user:delete",
+            kwargs={
+                "pk": self.user_table.id,
+                "slug_name": self.user_table.slug_name,
+            },
+        )
+
+    def test_post(self):
+        self.client.force_login(self.user1)
+        response = self.client.post(self.url)
+
+        self.assertRedirects(response, reverse("tables:list"))
+        self.assertFalse(UserTable.objects.filter(pk=self.user_table.pk).exists())
+        # Deleted later with its results by the process_deletions command.
+        self.assertTrue(Table._base_manager.filter(pk=self.user_table.pk).exists())
+        self.assertTrue(Result.objects.filter(table=self.user_table).exists())
+        self.assertTrue(
+            PendingDeletion.objects.pending()
+            .filter(object_id=self.user_table.pk)
+            .exists()
+        )
+
+    def test_post_another_user(self):
+        self.client.force_login(self.user2)
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(PendingDeletion.objects.exists())
+
+
+class TestUserTableUpdateView(BaseTestCase):
+    def setUp(self):
+        self.url = reverse(
+            "tables:user:change",
+            kwargs={
+                "pk": self.user_table.id,
+                "slug_name": self.user_table.slug_name,
+            },
+        )
+
+    def test_post_sets_verbs(self):
+        verbs = [self.verb2, self.verb3] + [
+            Verb.objects.create(
+                infinitive=f"verb{i}",
+                simple_past=f"verb{i}",
+                past_participle=f"verb{i}",
+                translation=f"verb{i}",
+            )
+            for i in range(8)
+        ]
+        self.client.force_login(self.user1)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                {"name": "table", "verbs": [verb.id for verb in verbs]},
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            set(self.user_table.verbs.values_list("id", flat=True)),
+            {verb.id for verb in verbs},
+        )
+        # The result of verb1, removed from the table, is deleted.
+        self.assertFalse(
+            Result.objects.filter(table=self.user_table, verb=self.verb1).exists()
+        )
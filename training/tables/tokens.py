@@ -0,0 +1,58 @@
+import uuid
+
+from django.core import signing
+
+
+TRAINING_TOKEN_SALT = "training.tables.training"
+# Maximum time in seconds to submit a training
+TRAINING_TOKEN_MAX_AGE = 60 * 60 * 12
+
+TABLE_FIELDS = ("id", "type", "name", "slug_name", "owner_id")
+
+
+def _dump(value):
+    return value if value is None or isinstance(value, int) else str(value)
+
+
+def make_training_token(user, profile_id, table, verbs):
+    """
+    Return a signed token holding what is needed to grade and save a
+    training: the user and profile ids, the table and the ids of the
+    sampled verbs. The token is only signed, it can be read by the user
+    and must not hold the answers, those are read from the catalog.
+    """
+    return signing.dumps(
+        {
+            "u": str(user.pk),
+            "p": str(profile_id),
+            "t": [_dump(getattr(table, field)) for field in TABLE_FIELDS],
+            "v": [verb.id for verb in verbs],
+        },
+        salt=TRAINING_TOKEN_SALT,
+        compress=True,
+    )
+
+
+def read_training_token(token, user):
+    """
+    Return the data of a token made for user by make_training_token() as
+    a dict with 'profile_id', 'table' (a dict of TABLE_FIELDS) and
+    'verb_ids'.
+
+    Raise signing.BadSignature if the token is invalid, expired or made
+    for another user.
+    """
+    data = signing.loads(
+        token, salt=TRAINING_TOKEN_SALT, max_age=TRAINING_TOKEN_MAX_AGE
+    )
+    if data["u"] != str(user.pk):
+        raise signing.BadSignature("Training token made for another user.")
+    table = dict(zip(TABLE_FIELDS, data["t"]))
+    table["id"] = uuid.UUID(table["id"])
+    if table["owner_id"] is not None:
+        table["owner_id"] = uuid.UUID(table["owner_id"])
+    return {
+        "profile_id": uuid.UUID(data["p"]),
+        "table": table,
+        "verb_ids": data["v"],
+    }
@@ -28,7 +28,7 @@ default_tables_urls = [
         name="training",
     ),
     path(
-        "<uuid:pk>/<str:slug_name>/training/results/",
+        "<uuid:pk>/<str:slug_name>/training/results/<uuid:session_pk>/",
         views.DefaultTableResultView.as_view(),
         name="results",
     ),
@@ -61,7 +61,7 @@ user_tables_urls = [
         name="training",
     ),
     path(
-        "<uuid:pk>/<str:slug_name>/training/results/",
+        "<uuid:pk>/<str:slug_name>/training/results/<uuid:session_pk>/",
         views.UserTableResultView.as_view(),
         name="results",
     ),
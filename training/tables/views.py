@@ -1,10 +1,13 @@
-import re
-
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.db.models import OuterRef, Prefetch, Q, Subquery
+from django.core import signing
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+from django.utils.http import urlencode
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from django.views.generic.detail import DetailView, SingleObjectMixin
@@ -12,10 +15,13 @@ from django.views.generic.edit import CreateView, DeleteView, FormView, UpdateVi
 from django.views.generic.list import ListView
 
 from training.common.views.mixins import PreviousPageURLMixin, TitleMixin
-from training.results.models import Result
+from training.profiles.models import Profile
+from training.results.models import Result, TableProgress
 from training.tables.forms import DefaultTableForm, UserTableForm, VerbFormSet
-from training.tables.models import DefaultTable, Table, UserTable
-from training.verbs.models import Verb
+from training.tables.models import DefaultTable, Table, TrainingSession, UserTable
+from training.tables.tokens import make_training_token, read_training_token
+from training.verbs.catalog import catalog
+from training.verbs.grading import ANSWER_FIELDS, grade_many
 
 
 class TableListView(TitleMixin, ListView):
@@ -24,17 +30,10 @@ class TableListView(TitleMixin, ListView):
     title = _("Tables")
 
     def get_queryset(self):
-        verbs_prefetch = Prefetch(
-            "verbs",
-            queryset=Verb.objects.with_results(
-                user=self.request.user, table=OuterRef("tables")
-            ),
+        profile = self.request.user.profile
+        queryset = Table.objects.with_progress(profile).filter(
+            Q(owner=profile) | Q(type=Table.DEFAULT_TABLE)
         )
-
-        queryset = Table.objects.filter(
-            Q(owner=self.request.user.profile) | Q(type=Table.DEFAULT_TABLE)
-        ).prefetch_related(verbs_prefetch)
-
         return queryset.order_by("-created_at")
 
     def get_context_data(self, **kwargs):
@@ -56,30 +55,13 @@ class BaseTableDetailView(TitleMixin, PreviousPageURLMixin, DetailView):
     slug_url_kwarg = "slug_name"
     template_name = "tables/detail.html"
 
-    def prefetch_verbs(self, table_id):
-        # Subquery to get is_success for each Verb
-        result_subquery = Result.objects.filter(
-            owner=self.request.user.profile,
-            table_id=table_id,
-            verb=OuterRef("pk"),
-        ).values("is_success")[:1]
-
-        # Prefetch related verbs with the annotated is_success
-        verbs_prefetch = Prefetch(
-            "verbs",
-            queryset=Verb.objects.annotate(
-                is_success=Subquery(result_subquery)
-            ).prefetch_related("info", "examples"),
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["data_url"] = "%s?%s" % (
+            reverse("verbs:data"),
+            urlencode({"table": self.object.id}),
         )
-
-        # verbs_prefetch = Prefetch(
-        #     "verbs",
-        #     queryset=Verb.objects.with_results(
-        #         user=self.request.user, table=table_id
-        #     ).prefetch_related("info", "examples"),
-        # )
-
-        return verbs_prefetch
+        return context
 
     def get_title(self):
         return self.object.name
@@ -88,21 +70,12 @@ class BaseTableDetailView(TitleMixin, PreviousPageURLMixin, DetailView):
 class DefaultTableDetailView(BaseTableDetailView):
     model = DefaultTable
 
-    def get_queryset(self):
-        table_id = self.kwargs.get(self.pk_url_kwarg)
-        verbs_prefetch = self.prefetch_verbs(table_id)
-        return self.model.objects.prefetch_related(verbs_prefetch)
-
 
 class UserTableDetailView(BaseTableDetailView):
     model = UserTable
 
     def get_queryset(self):
-        table_id = self.kwargs.get(self.pk_url_kwarg)
-        verbs_prefetch = self.prefetch_verbs(table_id)
-        return self.model.objects.filter(
-            Q(owner=self.request.user.profile)
-        ).prefetch_related(verbs_prefetch)
+        return self.model.objects.filter(owner=self.request.user.profile)
 
 
 class BaseTableCreateView(
@@ -253,6 +226,20 @@ class BaseTableDeleteView(TitleMixin, PreviousPageURLMixin, DeleteView):
     success_url = reverse_lazy("tables:list")
     template_name = "tables/delete.html"
 
+    def delete(self, request, *args, **kwargs):
+        """
+        Hide the table and redirect to the success URL, its results are
+        deleted in batches by the process_deletions command.
+        """
+        self.object = self.get_object()
+        self.object.delete_later()
+        return redirect(self.get_success_url())
+
+    def form_valid(self, form):
+        """Hide the table on form validation, see delete()."""
+        self.object.delete_later()
+        return redirect(self.get_success_url())
+
     def get_title(self):
         return gettext(
             "Delete table - %(name)s" % {"name": self.object.name.capitalize()}
@@ -307,95 +294,108 @@ class BaseTrainingFormView(
 
     def get_verbs_sample(self, number):
         """Return a random sample of 'number' verbs from the table"""
-        return self.object.verbs.all().order_by("?")[:number]
-
-    def get_verbs(self):
-        """
-        Get a random sample of verbs belonging to the table and save
-        their ids to the session.
-        """
-        verbs_id = self.request.session.get("verbs_id")
-        if not verbs_id or self.request.method == "GET":
-            verbs_sample = self.get_verbs_sample(self.total_verb_forms)
-            self.request.session["verbs_id"] = [verb.id for verb in verbs_sample]
-            return list(verbs_sample)
-        # Transform the queryset to list to avoid hitting db
-        # multiple time when ittarting over it.
-        verbs = list(self.object.verbs.filter(id__in=verbs_id))
-        # Sort verbs in same order than verbs_id otherwise cleaned_data
-        # does not corresponding.
-        verbs.sort(key=lambda verb: verbs_id.index(verb.id))
-        return verbs
+        return catalog.sample_table_verbs(self.object.id, number)
 
     def get_initial(self):
         return [{"translation": verb.translation} for verb in self.verbs]
 
-    def get_correct_data(self, verb):
-        return {
-            "correct_infinitive": verb.infinitive,
-            "correct_simple_past": verb.simple_past,
-            "correct_past_participle": verb.past_participle,
-            "translation": verb.translation,
-        }
-
-    def get_verb_success(self, cleaned_data, verb):
-        data = {
-            "infinitive_is_success": (
-                cleaned_data.get("infinitive") in re.split(", |/", verb.infinitive)
-            ),
-            "simple_past_is_success": (
-                cleaned_data.get("simple_past") in re.split(", |/", verb.simple_past)
-            ),
-            "past_participle_is_success": (
-                cleaned_data.get("past_participle")
-                in re.split(", |/", verb.past_participle)
-            ),
-        }
-        data["is_success"] = all(data.values())
-        return data
-
-    def get_data(self, cleaned_data, verb):
-        return (
-            cleaned_data
-            | self.get_correct_data(verb)
-            | self.get_verb_success(cleaned_data, verb)
-        )
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["training_token"] = self.training_token
+        return context
 
     def form_valid(self, form):
-        verbs_data = []
-        results = []
-        for cleaned_data, verb in zip(form.cleaned_data, self.verbs):
-            data = self.get_data(cleaned_data, verb)
-            result = Result(
-                owner=self.request.user.profile,
-                table_id=self.object.id,
-                verb_id=verb.id,
-                is_success=data["is_success"],
-            )
-            verbs_data.append(data)
-            results.append(result)
-
-        # Save results objects.
-        # Update update_fields when a row insertion fails on conflicts.
-        # WARNING update_fields not working on Oracle database.
-        Result.objects.bulk_create(
-            results,
-            update_conflicts=True,
-            update_fields=["is_success"],
-            unique_fields=["owner_id", "table_id", "verb_id"],
+        # Verbs removed from the table since the sample was drawn are
+        # graded but their results are not saved.
+        table_verbs_id = set(catalog.get_table_verb_ids(self.object.id))
+        training_session = TrainingSession(
+            owner=self.profile,
+            table=self.object,
+            verb_ids=[],
+            answers=[],
+            successes=[],
         )
-        # self.request.session['results'] = form.cleaned_data
-        self.request.session["verbs_data"] = verbs_data
+        outcomes = {}
+        gradings = grade_many(form.cleaned_data, self.answer_keys)
+        for cleaned_data, verb, grading in zip(
+            form.cleaned_data, self.verbs, gradings
+        ):
+            training_session.verb_ids.append(verb.id)
+            training_session.answers.append(
+                [cleaned_data.get(field) for field in ANSWER_FIELDS]
+            )
+            training_session.successes.append(
+                [grading[f"{field}_is_success"] for field in ANSWER_FIELDS]
+            )
+            if verb.id in table_verbs_id:
+                outcomes[verb.id] = grading["is_success"]
+
+        try:
+            with transaction.atomic():
+                # The table is rebuilt from the token, nothing is recorded
+                # for a table hidden since the sample was drawn.
+                if not self.model.objects.filter(pk=self.object.pk).exists():
+                    raise Http404
+                # Only new or changed results are written.
+                attempts = Result.objects.record_attempts(
+                    owner=self.profile, table=self.object, outcomes=outcomes
+                )
+                TableProgress.objects.apply_attempts(
+                    owner=self.profile,
+                    table=self.object,
+                    attempts=attempts,
+                    last_trained_at=timezone.now(),
+                    verbs_count=len(table_verbs_id),
+                )
+                training_session.save()
+        except IntegrityError:
+            # The table was deleted since the sample was drawn.
+            raise Http404
+        self.training_session = training_session
         return super().form_valid(form)
 
     def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.verbs = self.get_verbs()
+        """
+        Grade the training from the data of its token, the table is only
+        checked not to be hidden before the results are recorded and the
+        verbs and their answer keys come from the catalog.
+        """
+        try:
+            data = read_training_token(
+                request.POST.get("training_token", ""), request.user
+            )
+        except signing.BadSignature:
+            messages.warning(
+                request, gettext("Your training has expired, please try again.")
+            )
+            return redirect(request.path)
+        if data["table"]["id"] != self.kwargs[self.pk_url_kwarg] or (
+            data["table"]["slug_name"] != self.kwargs[self.slug_url_kwarg]
+        ):
+            raise Http404
+        self.object = self.model(**data["table"])
+        self.object._state.adding = False
+        self.profile = Profile(id=data["profile_id"], user=request.user)
+        self.verbs = catalog.get_verbs(data["verb_ids"])
+        if len(self.verbs) != len(data["verb_ids"]):
+            # A verb was deleted since the sample was drawn.
+            messages.warning(
+                request, gettext("Your training has expired, please try again.")
+            )
+            return redirect(request.path)
+        self.answer_keys = catalog.get_answer_keys(data["verb_ids"])
+        self.training_token = request.POST["training_token"]
         return super().post(request, *args, **kwargs)
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
-        self.verbs = self.get_verbs()
+        self.verbs = self.get_verbs_sample(self.total_verb_forms)
+        self.training_token = make_training_token(
+            request.user,
+            request.user.profile.id,
+            self.object,
+            self.verbs,
+        )
         return super().get(request, *args, **kwargs)
 
     def get_title(self):
@@ -405,15 +405,13 @@ class BaseTrainingFormView(
 class DefaultTableTrainingFormView(BaseTrainingFormView):
     model = DefaultTable
 
-    def get_queryset(self):
-        return self.model.objects.prefetch_related("verbs")
-
     def get_success_url(self):
         return reverse(
             "tables:default:results",
             kwargs={
                 "pk": self.object.id,
                 "slug_name": self.object.slug_name,
+                "session_pk": self.training_session.id,
             },
         )
 
@@ -431,9 +429,7 @@ class UserTableTrainingFormView(BaseTrainingFormView):
     model = UserTable
 
     def get_queryset(self):
-        return self.model.objects.filter(
-            owner=self.request.user.profile
-        ).prefetch_related("verbs")
+        return self.model.objects.filter(owner=self.request.user.profile)
 
     def get_success_url(self):
         return reverse(
@@ -441,6 +437,7 @@ class UserTableTrainingFormView(BaseTrainingFormView):
             kwargs={
                 "pk": self.object.id,
                 "slug_name": self.object.slug_name,
+                "session_pk": self.training_session.id,
             },
         )
 
@@ -463,23 +460,38 @@ class BaseResultView(TitleMixin, PreviousPageURLMixin, DetailView):
     slug_url_kwarg = "slug_name"
     template_name = "tables/results.html"
 
+    def get_training_session(self):
+        """
+        Return the user's training session of the URL with its table, or
+        None if it does not exist or has expired.
+        """
+        return (
+            TrainingSession.objects.active()
+            .select_related("table")
+            .filter(
+                pk=self.kwargs["session_pk"],
+                owner__user=self.request.user,
+                table_id=self.kwargs[self.pk_url_kwarg],
+                table__slug_name=self.kwargs[self.slug_url_kwarg],
+            )
+            .first()
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        verbs_data = self.request.session.get("verbs_data")
-        if verbs_data is not None:
-            context["verbs_data"] = verbs_data
-            del self.request.session["verbs_data"]
+        context["verbs_data"] = self.training_session.get_verbs_data()
         return context
 
     def get_title(self):
         return gettext("%(name)s - Results" % {"name": self.object.name.capitalize()})
 
     def get(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        context = self.get_context_data(object=self.object)
-        if not context.get("verbs_data"):
+        self.training_session = self.get_training_session()
+        if self.training_session is None:
+            self.object = self.get_object()
             return redirect(self.get_previous_page_url())
-        return self.render_to_response(context)
+        self.object = self.training_session.table
+        return self.render_to_response(self.get_context_data(object=self.object))
 
 
 class DefaultTableResultView(BaseResultView):
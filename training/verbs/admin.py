@@ -72,6 +72,25 @@ class VerbAdmin(admin.ModelAdmin):
         queryset = super().get_queryset(request)
         return queryset.select_related("similarity")
 
+    def get_deleted_objects(self, objs, request):
+        # The results, info and examples are deleted later by the
+        # process_deletions command, do not collect them for the
+        # confirmation page.
+        objs = list(objs)
+        return (
+            [str(obj) for obj in objs],
+            {Verb._meta.verbose_name_plural: len(objs)},
+            set(),
+            [],
+        )
+
+    def delete_model(self, request: HttpRequest, obj: Verb) -> None:
+        obj.delete_later()
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet[Verb]) -> None:
+        for verb in queryset:
+            verb.delete_later()
+
     def get_search_results(
         self, request: HttpRequest, queryset: models.QuerySet[Any], search_term: str
     ) -> tuple[QuerySet[Any], bool]:
@@ -96,9 +115,10 @@ class VerbAdmin(admin.ModelAdmin):
             return [], may_have_duplicates
 
         # verb ids that already have a result for this profile and this table
-        excluded_verbs = Result.objects.filter(
-            owner=profile_id, table=table_id
-        ).values_list("verb_id", flat=True)
+        excluded_verbs = (
+            Result.objects.current_of(profile_id, table=table_id)
+            .values_list("verb_id", flat=True)
+        )
 
         queryset = (
             Table.objects.get(id=table_id)
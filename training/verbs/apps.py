@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class VerbsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "training.verbs"
+
+    def ready(self):
+        import training.verbs.signals  # noqa: F401
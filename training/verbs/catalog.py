@@ -0,0 +1,192 @@
+import random
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from training.verbs.grading import build_answer_key
+from training.verbs.models import Verb
+
+
+CATALOG_VERSION_KEY = "verbs:catalog:version"
+TABLE_VERSION_KEY = "verbs:catalog:table:%s"
+
+
+def get_catalog_version():
+    """Return the global catalog version, creating it if needed."""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def _set_new_version():
+    cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def bump_catalog_version():
+    """
+    Invalidate every process catalog.
+
+    The version is bumped right away and once again after commit, so a
+    process reloading the catalog before the transaction is committed
+    does not keep the old rows.
+    """
+    _set_new_version()
+    transaction.on_commit(_set_new_version)
+
+
+def get_table_version(table_id):
+    """Return the version of the verbs of a table, creating it if needed."""
+    key = TABLE_VERSION_KEY % table_id
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex)
+        version = cache.get(key)
+    return version
+
+
+def bump_table_versions(table_ids):
+    """
+    Invalidate the cached verbs of the given tables in every process,
+    the rest of the catalog is kept.
+    """
+    keys = [TABLE_VERSION_KEY % table_id for table_id in table_ids]
+
+    def set_new_versions():
+        cache.set_many({key: uuid.uuid4().hex for key in keys})
+
+    set_new_versions()
+    transaction.on_commit(set_new_versions)
+
+
+class VerbCatalog:
+    """
+    Process-local cache of the verbs with their info, examples and
+    similarity, and of the verbs belonging to each table.
+
+    The answer key of each verb, its accepted forms, is built once when
+    the verbs are loaded.
+
+    The cache is dropped as soon as the global catalog version stored in
+    the Django cache changes, the verbs of a table are also dropped when
+    the version of this table changes. Cached Verb instances are shared between
+    requests and must not be modified, use with_status() to attach a
+    user's results.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._verbs = None
+        self._answer_keys = None
+        self._tables = {}
+
+    def clear(self):
+        with self._lock:
+            self._version = None
+            self._verbs = None
+            self._answer_keys = None
+            self._tables = {}
+
+    def _check_version(self):
+        version = get_catalog_version()
+        if version != self._version:
+            with self._lock:
+                self._version = version
+                self._verbs = None
+                self._answer_keys = None
+                self._tables = {}
+        return version
+
+    def _load(self):
+        version = self._check_version()
+        verbs, answer_keys = self._verbs, self._answer_keys
+        if verbs is None:
+            queryset = Verb.objects.select_related("similarity").prefetch_related(
+                "info", "examples"
+            )
+            verbs = {verb.id: verb for verb in queryset}
+            answer_keys = {
+                verb_id: build_answer_key(verb) for verb_id, verb in verbs.items()
+            }
+            with self._lock:
+                # Do not store a catalog loaded for an outdated version.
+                if self._version == version:
+                    self._verbs = verbs
+                    self._answer_keys = answer_keys
+        return verbs, answer_keys
+
+    def _get_verbs_by_id(self):
+        return self._load()[0]
+
+    def get_verbs(self, verb_ids=None):
+        """
+        Return the verbs ordered by infinitive, or in the order of
+        verb_ids if provided. Unknown ids are ignored.
+        """
+        verbs = self._get_verbs_by_id()
+        if verb_ids is None:
+            return list(verbs.values())
+        return [verbs[verb_id] for verb_id in verb_ids if verb_id in verbs]
+
+    def get_answer_keys(self, verb_ids):
+        """
+        Return the answer keys of the verbs, in the order of verb_ids.
+        See training.verbs.grading.
+        """
+        answer_keys = self._load()[1]
+        return [answer_keys[verb_id] for verb_id in verb_ids]
+
+    def get_table_verb_ids(self, table_id):
+        """Return the ids of the verbs of the table ordered by infinitive."""
+        verbs = self._get_verbs_by_id()
+        version = self._version
+        table_version = get_table_version(table_id)
+        cached = self._tables.get(table_id)
+        if cached is not None and cached[0] == table_version:
+            verb_ids = cached[1]
+        else:
+            table_verb_ids = set(
+                Verb.tables.through.objects.filter(table_id=table_id).values_list(
+                    "verb_id", flat=True
+                )
+            )
+            verb_ids = tuple(verb_id for verb_id in verbs if verb_id in table_verb_ids)
+            with self._lock:
+                if self._version == version:
+                    self._tables[table_id] = (table_version, verb_ids)
+        return verb_ids
+
+    def get_table_verbs(self, table_id):
+        """Return the verbs of the table ordered by infinitive."""
+        return self.get_verbs(self.get_table_verb_ids(table_id))
+
+    def sample_table_verbs(self, table_id, number):
+        """
+        Return 'number' verbs of the table drawn at random, or all of
+        them in random order if the table has fewer verbs.
+        """
+        verb_ids = self.get_table_verb_ids(table_id)
+        return self.get_verbs(random.sample(verb_ids, min(number, len(verb_ids))))
+
+    @staticmethod
+    def with_status(verbs, status_map):
+        """
+        Return copies of the verbs with their is_success attribute set
+        from status_map ({verb_id: is_success}).
+        """
+        verbs_with_status = []
+        for verb in verbs:
+            # Cheaper than copy.copy(), the model state and the related
+            # objects caches are shared with the cached instance.
+            clone = Verb.__new__(Verb)
+            clone.__dict__ = verb.__dict__.copy()
+            clone.is_success = status_map.get(verb.id)
+            verbs_with_status.append(clone)
+        return verbs_with_status
+
+
+catalog = VerbCatalog()
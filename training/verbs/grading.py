@@ -0,0 +1,47 @@
+import re
+
+
+ANSWER_FIELDS = ("infinitive", "simple_past", "past_participle")
+FORMS_SEPARATOR = re.compile(", |/")
+
+
+def normalize(answer):
+    return (answer or "").strip().lower()
+
+
+def build_answer_key(verb):
+    """
+    Return the accepted answers of each verb form as frozensets, forms
+    are separated by ', ' or '/' (e.g. 'got, gotten').
+    """
+    return {
+        field: frozenset(
+            form
+            for form in map(normalize, FORMS_SEPARATOR.split(getattr(verb, field)))
+            if form
+        )
+        for field in ANSWER_FIELDS
+    }
+
+
+def grade(answers, answer_key):
+    """
+    Grade the answers given for a verb against its answer key.
+
+    Return a dict with a '<field>_is_success' boolean for each verb form
+    and 'is_success', True when every form is correct.
+    """
+    data = {
+        f"{field}_is_success": normalize(answers.get(field)) in answer_key[field]
+        for field in ANSWER_FIELDS
+    }
+    data["is_success"] = all(data.values())
+    return data
+
+
+def grade_many(answers_list, answer_keys):
+    """Grade each answers dict against the answer key at the same index."""
+    return [
+        grade(answers, answer_key)
+        for answers, answer_key in zip(answers_list, answer_keys)
+    ]
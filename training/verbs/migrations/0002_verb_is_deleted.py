@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verbs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='verb',
+            name='is_deleted',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -1,73 +1,16 @@
-from django.apps import apps
-from django.db import models
-from django.db.models import OuterRef, Subquery
+from django.db import models, router
+from django.db.models.signals import m2m_changed
 
+from training.deletions.models import DeferredDeletionMixin
 
-class VerbManager(models.Manager):
-    _table_model = None
-
-    @property
-    def table_model(self):
-        """Cache Table model"""
-        if self._table_model is None:
-            self._table_model = apps.get_model("tables.Table")
-        return self._table_model
-
-    def get_queryset_annotated(self, user, table):
-        results_subquery = self._get_results_subquery(user=user, table=table)
-        return (
-            self.get_queryset()
-            .annotate(is_success=Subquery(results_subquery))
-            .distinct()
-        )
 
-    def _get_results_subquery(self, user, table):
-        Result = apps.get_model("results.Result")
-        return Result.objects.filter(
-            owner=user.profile,
-            table=table,
-            verb=OuterRef("pk"),
-        ).values("is_success")[:1]
-
-    def _get_table(self, table):
-        """Validate table argument."""
-        instance = getattr(self, "instance", None)
-        # if table argument is not provided the manager must be
-        # attached to a Table instance
-        if table is None:
-            if not isinstance(instance, self.table_model):
-                raise TypeError(
-                    "The 'table' argument must be provided when the manager "
-                    "is not attached to a Table instance."
-                )
-            return instance
-        if isinstance(table, self.table_model) and isinstance(
-            instance, self.table_model
-        ):
-            raise TypeError(
-                "The 'table' argument must be None when the manager is "
-                "attached to a Table instance."
-            )
-        return table
-
-    def _user_owns_table(self, user, table):
-        """Ensure that user owns the table if it's a UserTable."""
-        if table.owner is not None and user.profile != table.owner:
-            raise PermissionError("This user does not have access to this table.")
-
-    def with_results(self, *, user, table=None):
-        table = self._get_table(table)
-        # When the table argument is an OuterRef object (views),
-        # it cannot be directly used to filter the queryset.
-        if isinstance(table, self.table_model):
-            self._user_owns_table(user, table)
-            return self.get_queryset_annotated(user=user, table=table).filter(
-                tables=table
-            )
-        return self.get_queryset_annotated(user=user, table=table)
+class VerbManager(models.Manager):
+    def get_queryset(self):
+        # Verbs waiting for their deferred deletion are hidden.
+        return super().get_queryset().filter(is_deleted=False)
 
 
-class Verb(models.Model):
+class Verb(DeferredDeletionMixin, models.Model):
     infinitive = models.CharField(
         max_length=70,
     )
@@ -86,6 +29,9 @@ class Verb(models.Model):
         related_name="verbs",
         null=True,
     )
+    is_deleted = models.BooleanField(
+        default=False,
+    )
 
     objects = VerbManager()
 
@@ -94,6 +40,41 @@ class Verb(models.Model):
             "infinitive",
         ]
 
+    def hide(self):
+        self.is_deleted = True
+        self.save(update_fields=["is_deleted"])
+
+    def get_deletion_querysets(self):
+        return [
+            self.results.all(),
+            self.info.all(),
+            self.examples.all(),
+        ]
+
+    def delete_batch(self, batch_size):
+        deleted = super().delete_batch(batch_size)
+        if deleted:
+            return deleted
+        # table.verbs.remove() ignores hidden verbs, the rows are deleted
+        # directly and m2m_changed is sent as remove() would, so the
+        # progress summaries and the catalog are refreshed.
+        through = self.tables.through
+        tables = list(
+            self.tables.model._base_manager.filter(verbs=self)[:batch_size]
+        )
+        for table in tables:
+            through.objects.filter(table=table, verb=self).delete()
+            m2m_changed.send(
+                sender=through,
+                instance=table,
+                action="post_remove",
+                reverse=False,
+                model=Verb,
+                pk_set={self.pk},
+                using=router.db_for_write(through, instance=table),
+            )
+        return len(tables)
+
     def __str__(self) -> str:
         return (
             f"{self.infinitive} {self.simple_past} "
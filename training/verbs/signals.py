@@ -0,0 +1,32 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from training.verbs.catalog import bump_catalog_version, bump_table_versions
+from training.verbs.models import Example, Info, Similarity, Verb
+
+
+@receiver(post_save, sender=Verb, dispatch_uid="verb_saved")
+@receiver(post_delete, sender=Verb, dispatch_uid="verb_deleted")
+@receiver(post_save, sender=Info, dispatch_uid="info_saved")
+@receiver(post_delete, sender=Info, dispatch_uid="info_deleted")
+@receiver(post_save, sender=Example, dispatch_uid="example_saved")
+@receiver(post_delete, sender=Example, dispatch_uid="example_deleted")
+@receiver(post_save, sender=Similarity, dispatch_uid="similarity_saved")
+@receiver(post_delete, sender=Similarity, dispatch_uid="similarity_deleted")
+def invalidate_catalog(sender, **kwargs):
+    """Invalidate the verb catalog when a verb or its data change."""
+    bump_catalog_version()
+
+
+@receiver(m2m_changed, sender=Verb.tables.through, dispatch_uid="table_verbs_changed")
+def invalidate_catalog_tables(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate the cached verbs of the tables whose verbs change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        bump_table_versions([instance.pk])
+    elif pk_set is not None:
+        bump_table_versions(pk_set)
+    else:
+        # verb.tables.clear() does not tell which tables were changed
+        bump_catalog_version()
@@ -0,0 +1,146 @@
+from django.test import TestCase
+
+from training.tables.models import DefaultTable
+from training.verbs.catalog import VerbCatalog, bump_catalog_version
+from training.verbs.models import Example, Info, Verb
+
+
+class CatalogTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.verb1 = Verb.objects.create(
+            infinitive="begin",
+            simple_past="began",
+            past_participle="begun",
+            translation="commencer",
+        )
+        cls.verb2 = Verb.objects.create(
+            infinitive="become",
+            simple_past="became",
+            past_participle="become",
+            translation="devenir",
+        )
+        cls.info = Info.objects.create(content="info content", verb=cls.verb1)
+        cls.example = Example.objects.create(
+            english="example english", translation="example translation", verb=cls.verb1
+        )
+        cls.table = DefaultTable.objects.create(name="default")
+        cls.table.verbs.add(cls.verb1)
+
+    def setUp(self):
+        self.catalog = VerbCatalog()
+
+
+class TestVerbCatalog(CatalogTestCase):
+    def test_get_verbs(self):
+        self.assertEqual(self.catalog.get_verbs(), [self.verb2, self.verb1])
+        self.assertEqual(
+            self.catalog.get_verbs([self.verb1.id, 0, self.verb2.id]),
+            [self.verb1, self.verb2],
+        )
+
+    def test_get_verbs_warm_cache_no_query(self):
+        self.catalog.get_verbs()
+        with self.assertNumQueries(0):
+            verbs = self.catalog.get_verbs()
+            verb = verbs[1]
+            self.assertEqual(list(verb.info.all()), [self.info])
+            self.assertEqual(list(verb.examples.all()), [self.example])
+
+    def test_get_table_verbs_warm_cache_no_query(self):
+        self.assertEqual(self.catalog.get_table_verbs(self.table.id), [self.verb1])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.catalog.get_table_verb_ids(self.table.id), (self.verb1.id,)
+            )
+
+    def test_verb_saved_invalidates_catalog(self):
+        self.catalog.get_verbs()
+        self.verb1.translation = "débuter"
+        self.verb1.save()
+        self.assertEqual(self.catalog.get_verbs()[1].translation, "débuter")
+
+    def test_info_deleted_invalidates_catalog(self):
+        self.catalog.get_verbs()
+        self.info.delete()
+        self.assertEqual(list(self.catalog.get_verbs()[1].info.all()), [])
+
+    def test_table_verbs_changed_invalidates_catalog(self):
+        self.catalog.get_table_verb_ids(self.table.id)
+        self.table.verbs.add(self.verb2)
+        self.assertEqual(
+            self.catalog.get_table_verb_ids(self.table.id),
+            (self.verb2.id, self.verb1.id),
+        )
+
+    def test_table_verbs_changed_keeps_verbs(self):
+        self.catalog.get_table_verb_ids(self.table.id)
+        self.table.verbs.add(self.verb2)
+        # Only the verbs of the table are read again.
+        with self.assertNumQueries(1):
+            self.catalog.get_table_verb_ids(self.table.id)
+
+    def test_verb_tables_changed_invalidates_tables(self):
+        self.catalog.get_table_verb_ids(self.table.id)
+        self.verb2.tables.add(self.table)
+        self.assertEqual(
+            self.catalog.get_table_verb_ids(self.table.id),
+            (self.verb2.id, self.verb1.id),
+        )
+
+    def test_verb_tables_cleared_invalidates_catalog(self):
+        self.catalog.get_table_verb_ids(self.table.id)
+        self.verb1.tables.clear()
+        self.assertEqual(self.catalog.get_table_verb_ids(self.table.id), ())
+
+    def test_sample_table_verbs(self):
+        self.table.verbs.add(self.verb2)
+        verbs = self.catalog.sample_table_verbs(self.table.id, 1)
+        self.assertEqual(len(verbs), 1)
+        self.assertIn(verbs[0], [self.verb1, self.verb2])
+
+    def test_sample_table_verbs_fewer_verbs(self):
+        self.assertEqual(
+            self.catalog.sample_table_verbs(self.table.id, 10), [self.verb1]
+        )
+
+    def test_sample_table_verbs_warm_cache_no_query(self):
+        self.catalog.get_table_verb_ids(self.table.id)
+        with self.assertNumQueries(0):
+            self.catalog.sample_table_verbs(self.table.id, 10)
+
+    def test_get_answer_keys(self):
+        self.assertEqual(
+            self.catalog.get_answer_keys([self.verb2.id]),
+            [
+                {
+                    "infinitive": frozenset({"become"}),
+                    "simple_past": frozenset({"became"}),
+                    "past_participle": frozenset({"become"}),
+                }
+            ],
+        )
+
+    def test_verb_saved_updates_answer_keys(self):
+        self.catalog.get_answer_keys([self.verb1.id])
+        self.verb1.simple_past = "began/begun"
+        self.verb1.save()
+        self.assertEqual(
+            self.catalog.get_answer_keys([self.verb1.id])[0]["simple_past"],
+            frozenset({"began", "begun"}),
+        )
+
+    def test_bump_catalog_version(self):
+        self.catalog.get_verbs()
+        bump_catalog_version()
+        with self.assertNumQueries(3):
+            self.catalog.get_verbs()
+
+    def test_with_status(self):
+        verbs = self.catalog.with_status(
+            self.catalog.get_verbs(), {self.verb1.id: True}
+        )
+        self.assertIsNone(verbs[0].is_success)
+        self.assertTrue(verbs[1].is_success)
+        # Cached instances are left untouched.
+        self.assertFalse(hasattr(self.catalog.get_verbs()[1], "is_success"))
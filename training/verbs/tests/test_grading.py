@@ -0,0 +1,76 @@
+from django.test import SimpleTestCase
+
+from training.verbs.grading import build_answer_key, grade, grade_many
+from training.verbs.models import Verb
+
+
+class TestGrading(SimpleTestCase):
+    def setUp(self):
+        self.verb = Verb(
+            infinitive="get",
+            simple_past="got",
+            past_participle="got, gotten",
+            translation="obtenir",
+        )
+        self.answer_key = build_answer_key(self.verb)
+
+    def test_build_answer_key(self):
+        verb = Verb(
+            infinitive="Dream",
+            simple_past="dreamt/dreamed",
+            past_participle="dreamt, dreamed",
+        )
+        self.assertEqual(
+            build_answer_key(verb),
+            {
+                "infinitive": frozenset({"dream"}),
+                "simple_past": frozenset({"dreamt", "dreamed"}),
+                "past_participle": frozenset({"dreamt", "dreamed"}),
+            },
+        )
+
+    def test_grade_success(self):
+        answers = {
+            "infinitive": "get",
+            "simple_past": "got",
+            "past_participle": "gotten",
+        }
+        self.assertEqual(
+            grade(answers, self.answer_key),
+            {
+                "infinitive_is_success": True,
+                "simple_past_is_success": True,
+                "past_participle_is_success": True,
+                "is_success": True,
+            },
+        )
+
+    def test_grade_normalizes_answers(self):
+        answers = {
+            "infinitive": " Get ",
+            "simple_past": "GOT",
+            "past_participle": "got",
+        }
+        self.assertTrue(grade(answers, self.answer_key)["is_success"])
+
+    def test_grade_failure(self):
+        answers = {"infinitive": "get", "simple_past": "", "past_participle": "got, "}
+        data = grade(answers, self.answer_key)
+        self.assertTrue(data["infinitive_is_success"])
+        self.assertFalse(data["simple_past_is_success"])
+        self.assertFalse(data["past_participle_is_success"])
+        self.assertFalse(data["is_success"])
+
+    def test_grade_missing_answer(self):
+        self.assertFalse(grade({}, self.answer_key)["is_success"])
+
+    def test_grade_many(self):
+        verb = Verb(infinitive="cut", simple_past="cut", past_participle="cut")
+        answers = {"infinitive": "cut", "simple_past": "cut", "past_participle": "cut"}
+        gradings = grade_many(
+            [answers, answers], [build_answer_key(verb), self.answer_key]
+        )
+        self.assertEqual(
+            [data["is_success"] for data in gradings],
+            [True, False],
+        )
@@ -1,9 +1,11 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse_lazy
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse, reverse_lazy
 
 from training.results.models import Result
-from training.tables.models import DefaultTable
+from training.tables.models import DefaultTable, UserTable
+from training.verbs.catalog import catalog
 from training.verbs.models import Example, Info, Similarity, Verb
 
 
@@ -45,20 +47,220 @@ class TestVerbsViews(VerbsViewsTestCase):
     def test_get_anonymous_user(self):
         template_expected = "verbs/verb_list.html"
         response = self.client.get(self.url)
-        queryset = response.context.get("verb_list")
 
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, template_expected)
-        self.assertQuerySetEqual(queryset, Verb.objects.all())
-        self.assertFalse(hasattr(queryset.first(), "is_success"))
+        self.assertContains(response, f'data-url="{reverse("verbs:data")}"')
+        self.assertNotContains(response, self.verb.infinitive)
 
     def test_get_authenticated_user(self):
         template_expected = "verbs/verb_list.html"
         self.client.force_login(self.user)
         response = self.client.get(self.url)
-        queryset = response.context.get("verb_list")
 
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, template_expected)
-        self.assertQuerySetEqual(queryset, Verb.objects.all())
-        self.assertTrue(hasattr(queryset.first(), "is_success"))
+        self.assertNotContains(response, self.example.english)
+
+
+class TestVerbDataView(VerbsViewsTestCase):
+    url = reverse_lazy("verbs:data")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.verb_2 = Verb.objects.create(
+            infinitive="awake",
+            simple_past="awoke",
+            past_participle="awoken",
+            translation="se réveiller",
+        )
+        cls.verb_3 = Verb.objects.create(
+            infinitive="cut",
+            simple_past="cut",
+            past_participle="cut",
+            translation="couper",
+        )
+        cls.default_table.verbs.add(cls.verb_3)
+        Result.objects.create(
+            verb=cls.verb_3,
+            owner=cls.user.profile,
+            table=cls.default_table,
+            is_success=False,
+        )
+        cls.other_user = User.objects.create_user(
+            username="other", email="other@email.com", password="password"
+        )
+        cls.other_table = UserTable.objects.create(
+            name="other table", owner=cls.other_user.profile
+        )
+
+    def setUp(self):
+        catalog.clear()
+
+    def get_data(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_infinitives(self, data):
+        return [row["infinitive"] for row in data["data"]]
+
+    def test_anonymous_user(self):
+        data = self.get_data(draw=3)
+
+        self.assertEqual(data["draw"], 3)
+        self.assertEqual(data["recordsTotal"], 3)
+        self.assertEqual(data["recordsFiltered"], 3)
+        self.assertEqual(self.get_infinitives(data), ["awake", "begin", "cut"])
+        self.assertEqual(
+            {row["is success"] for row in data["data"]},
+            {"None"},
+        )
+
+    def test_authenticated_user(self):
+        self.client.force_login(self.user)
+        data = self.get_data()
+
+        self.assertEqual(
+            [(row["infinitive"], row["is success"]) for row in data["data"]],
+            [("awake", "None"), ("begin", "True"), ("cut", "False")],
+        )
+        self.assertEqual(
+            [row["DT_RowClass"] for row in data["data"]],
+            ["not-done", "success", "unsuccess"],
+        )
+        self.assertEqual(data["data"][1]["DT_RowData"], {"id": self.verb.id})
+
+    def test_details_not_sent_by_default(self):
+        data = self.get_data()
+
+        self.assertNotIn("info", data["data"][0])
+        self.assertNotIn("examples", data["data"][0])
+
+    def test_details(self):
+        data = self.get_data(details="true")
+        row = data["data"][1]
+
+        self.assertEqual(row["info"], ["info content"])
+        self.assertEqual(
+            row["examples"],
+            [{"english": "example english", "translation": "example translation"}],
+        )
+
+    def test_paging(self):
+        data = self.get_data(start=1, length=1)
+
+        self.assertEqual(data["recordsFiltered"], 3)
+        self.assertEqual(self.get_infinitives(data), ["begin"])
+
+    def test_search(self):
+        data = self.get_data(**{"search[value]": "COU"})
+
+        self.assertEqual(data["recordsTotal"], 3)
+        self.assertEqual(data["recordsFiltered"], 1)
+        self.assertEqual(self.get_infinitives(data), ["cut"])
+
+    def test_search_every_word(self):
+        data = self.get_data(**{"search[value]": "awoke réveiller"})
+
+        self.assertEqual(self.get_infinitives(data), ["awake"])
+
+    def test_order(self):
+        data = self.get_data(**{"order[0][column]": "4", "order[0][dir]": "desc"})
+
+        self.assertEqual(self.get_infinitives(data), ["awake", "cut", "begin"])
+
+    def test_order_unknown_column(self):
+        data = self.get_data(**{"order[0][column]": "5", "order[0][dir]": "desc"})
+
+        self.assertEqual(self.get_infinitives(data), ["awake", "begin", "cut"])
+
+    def test_status_filter(self):
+        self.client.force_login(self.user)
+        data = self.get_data(
+            **{
+                "searchPanes[is success][0]": "True",
+                "searchPanes[is success][1]": "None",
+            }
+        )
+
+        self.assertEqual(data["recordsFiltered"], 2)
+        self.assertEqual(self.get_infinitives(data), ["awake", "begin"])
+        self.assertEqual(
+            data["searchPanes"]["options"]["is success"],
+            [
+                {"label": "Successfull", "value": "True", "total": 1, "count": 1},
+                {"label": "Failed", "value": "False", "total": 1, "count": 1},
+                {"label": "Not done", "value": "None", "total": 1, "count": 1},
+            ],
+        )
+
+    def test_table(self):
+        self.client.force_login(self.user)
+        data = self.get_data(table=self.default_table.id)
+
+        self.assertEqual(data["recordsTotal"], 2)
+        self.assertEqual(
+            [(row["infinitive"], row["is success"]) for row in data["data"]],
+            [("begin", "True"), ("cut", "False")],
+        )
+
+    def test_table_anonymous_user(self):
+        response = self.client.get(self.url, {"table": self.default_table.id})
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_table_of_another_user(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.url, {"table": self.other_table.id})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_table_invalid_id(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.url, {"table": "invalid"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_query_count(self):
+        self.client.force_login(self.user)
+        catalog.get_verbs()
+        # session, user with its profile, generations and results
+        with self.assertNumQueries(4):
+            self.get_data()
+
+    @override_settings(USER_CACHE_TIMEOUT=60)
+    def test_query_count_user_cached(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        catalog.get_verbs()
+        self.get_data()
+        # session, generations and results
+        with self.assertNumQueries(3):
+            self.get_data()
+
+
+class TestVerbDetailsView(VerbsViewsTestCase):
+
+    def setUp(self):
+        catalog.clear()
+
+    def test_get(self):
+        response = self.client.get(reverse("verbs:details", args=[self.verb.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "info": ["info content"],
+                "examples": [
+                    {"english": "example english", "translation": "example translation"}
+                ],
+            },
+        )
+
+    def test_get_unknown_verb(self):
+        response = self.client.get(reverse("verbs:details", args=[0]))
+
+        self.assertEqual(response.status_code, 404)
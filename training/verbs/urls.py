@@ -6,4 +6,6 @@ from training.verbs import views
 app_name = "verbs"
 urlpatterns = [
     path("", views.VerbListView.as_view(), name="list"),
+    path("data/", views.VerbDataView.as_view(), name="data"),
+    path("<int:pk>/details/", views.VerbDetailsView.as_view(), name="details"),
 ]
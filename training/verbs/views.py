@@ -1,37 +1,242 @@
+import re
+
 from django.contrib.auth.decorators import login_not_required
-from django.db.models import OuterRef, Subquery
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db.models import Q
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext_lazy as _
-from django.views.generic.list import ListView
+from django.views.generic import TemplateView, View
 
 from training.common.views.mixins import TitleMixin
 from training.results.models import Result
-from training.verbs.models import Verb
+from training.tables.models import Table
+from training.verbs.catalog import catalog
 
 
 @method_decorator(login_not_required, name="dispatch")
-class VerbListView(TitleMixin, ListView):
-    template_name = "training/verbs/verb_list.html"
+class VerbListView(TitleMixin, TemplateView):
+    """
+    Render the verbs table shell, rows are loaded by the DataTable
+    from VerbDataView.
+    """
+
+    template_name = "verbs/verb_list.html"
     title = _("Verbs")
 
-    def get_queryset(self):
+
+class VerbDetailsMixin:
+    """Serialize the info and examples of a catalog verb."""
+
+    def get_details(self, verb):
+        return {
+            "info": [info.content for info in verb.info.all()],
+            "examples": [
+                {"english": example.english, "translation": example.translation}
+                for example in verb.examples.all()
+            ],
+        }
+
+
+@method_decorator(login_not_required, name="dispatch")
+class VerbDataView(VerbDetailsMixin, View):
+    """
+    DataTables server-side processing endpoint.
+
+    Supports the draw, start, length, search[value] and order[i][...]
+    parameters and the "is success" search pane. The verbs come from the
+    catalog and the user's latest result for each verb is merged in as
+    is_success. With a 'table' parameter only the verbs of this table are
+    returned, with the user's results for this table.
+
+    Info and examples are only sent when the 'details' parameter is set,
+    they are fetched by VerbDetailsView when a child row is expanded.
+
+    https://datatables.net/manual/server-side
+    """
+
+    # DataTables column index -> Verb field, for ordering
+    columns = {
+        1: "infinitive",
+        2: "simple_past",
+        3: "past_participle",
+        4: "translation",
+    }
+    search_fields = ("infinitive", "simple_past", "past_participle", "translation")
+    status_pane = "is success"
+    status_labels = {
+        "True": _("Successfull"),
+        "False": _("Failed"),
+        "None": _("Not done"),
+    }
+    status_classes = {
+        "True": "success",
+        "False": "unsuccess",
+        "None": "not-done",
+    }
+    order_regex = re.compile(r"^order\[(\d+)\]\[column\]$")
+    pane_regex = re.compile(r"^searchPanes\[%s\]\[\d+\]$" % re.escape(status_pane))
+
+    def get_int(self, name, default):
+        try:
+            return int(self.request.GET.get(name, default))
+        except ValueError:
+            return default
+
+    def get_table(self):
+        table_id = self.request.GET.get("table")
+        if not table_id:
+            return None
+        if not self.request.user.is_authenticated:
+            raise PermissionDenied
+        tables = Table.objects.filter(
+            Q(owner=self.request.user.profile) | Q(type=Table.DEFAULT_TABLE)
+        )
+        try:
+            return get_object_or_404(tables, pk=table_id)
+        except ValidationError:
+            raise Http404
+
+    def get_verbs(self):
+        """Return the verbs with their is_success attribute if any."""
+        table = self.get_table()
+        if table is not None:
+            return table.get_verbs_with_status(self.request.user)
+        verbs = catalog.get_verbs()
+        if self.request.user.is_authenticated:
+            status_map = Result.objects.status_map(self.request.user.profile)
+            return catalog.with_status(verbs, status_map)
+        return verbs
+
+    def get_status(self, verb):
+        return str(getattr(verb, "is_success", None))
+
+    def filter_search(self, verbs):
         """
-        Get all verbs and add is_success field based on the Result
-        subquery is_success field
+        Keep the verbs matching every word of the search value in one of
+        the search fields, case insensitive.
         """
-        if self.request.user.is_authenticated:
-            return Verb.objects.annotate(
-                is_success=Subquery(
-                    Result.objects.filter(
-                        verb=OuterRef("id"),
-                        owner=self.request.user.profile,
-                    )
-                    .order_by("-updated_at")
-                    .values("is_success")[:1]
-                )
-            ).prefetch_related(
-                "info",
-                "examples",
+        terms = self.request.GET.get("search[value]", "").lower().split()
+        if not terms:
+            return verbs
+        return [
+            verb
+            for verb in verbs
+            if all(
+                any(term in getattr(verb, f).lower() for f in self.search_fields)
+                for term in terms
+            )
+        ]
+
+    def filter_status(self, verbs):
+        statuses = {
+            value
+            for key, values in self.request.GET.lists()
+            if self.pane_regex.match(key)
+            for value in values
+        }
+        if not statuses:
+            return verbs
+        return [verb for verb in verbs if self.get_status(verb) in statuses]
+
+    def get_ordering(self):
+        """Return a list of (field, descending) from the order parameters."""
+        ordering = []
+        orders = sorted(
+            (int(match.group(1)), value)
+            for key, value in self.request.GET.items()
+            if (match := self.order_regex.match(key))
+        )
+        for index, column in orders:
+            try:
+                field = self.columns[int(column)]
+            except (KeyError, ValueError):
+                continue
+            direction = self.request.GET.get(f"order[{index}][dir]")
+            ordering.append((field, direction == "desc"))
+        return ordering
+
+    def order(self, verbs):
+        # Sort on the least significant column first, sorts are stable.
+        for field, descending in reversed(self.get_ordering()):
+            verbs = sorted(
+                verbs,
+                key=lambda verb: getattr(verb, field).lower(),
+                reverse=descending,
             )
+        return verbs
+
+    def paginate(self, verbs):
+        start = max(self.get_int("start", 0), 0)
+        length = self.get_int("length", -1)
+        if length < 0:
+            return verbs[start:]
+        return verbs[start:start + length]
+
+    def get_status_options(self, verbs, filtered_verbs):
+        """Return the options of the "is success" search pane."""
+        totals = dict.fromkeys(self.status_labels, 0)
+        counts = dict.fromkeys(self.status_labels, 0)
+        for verb in verbs:
+            totals[self.get_status(verb)] += 1
+        for verb in filtered_verbs:
+            counts[self.get_status(verb)] += 1
+        return [
+            {
+                "label": label,
+                "value": value,
+                "total": totals[value],
+                "count": counts[value],
+            }
+            for value, label in self.status_labels.items()
+        ]
+
+    def get_row(self, verb, details=False):
+        status = self.get_status(verb)
+        row = {
+            "DT_RowId": f"verb-{verb.id}",
+            "DT_RowClass": self.status_classes[status],
+            "DT_RowData": {"id": verb.id},
+            "infinitive": verb.infinitive,
+            "simple past": verb.simple_past,
+            "past participle": verb.past_participle,
+            "translation": verb.translation,
+            "is success": status,
+        }
+        if details:
+            row.update(self.get_details(verb))
+        return row
+
+    def get(self, request, *args, **kwargs):
+        verbs = self.get_verbs()
+        searched_verbs = self.filter_search(verbs)
+        filtered_verbs = self.filter_status(searched_verbs)
+        page = self.paginate(self.order(filtered_verbs))
+        details = bool(request.GET.get("details"))
+        return JsonResponse(
+            {
+                "draw": self.get_int("draw", 0),
+                "recordsTotal": len(verbs),
+                "recordsFiltered": len(filtered_verbs),
+                "data": [self.get_row(verb, details) for verb in page],
+                "searchPanes": {
+                    "options": {
+                        self.status_pane: self.get_status_options(
+                            verbs, searched_verbs
+                        ),
+                    },
+                },
+            }
+        )
+
+
+@method_decorator(login_not_required, name="dispatch")
+class VerbDetailsView(VerbDetailsMixin, View):
+    """Return the info and examples of a verb for its DataTable child row."""
 
-        return Verb.objects.prefetch_related("info", "examples")
+    def get(self, request, *args, **kwargs):
+        verbs = catalog.get_verbs([kwargs["pk"]])
+        if not verbs:
+            raise Http404
+        return JsonResponse(self.get_details(verbs[0]))